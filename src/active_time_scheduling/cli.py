@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+import argparse
+import inspect
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from enum import Enum
+from typing import Any, Deque, Dict, IO, Iterator, List, Optional, Sequence, Tuple, Union
+
+from . import models, schedulers
+from .models import AbstractJobPool, BatchJobSchedule, Schedule
+from .schedulers import AbstractScheduler
+
+_worker_scheduler: Optional[AbstractScheduler] = None
+_worker_max_concurrency: Optional[int] = None
+_worker_job_pool_name: Optional[str] = None
+_worker_takes_max_concurrency: bool = True
+
+
+def get_scheduler_class(name: str) -> type:
+    """
+    Find a scheduler of the subpackage schedulers by its class name.
+    :param name: Name of the scheduler class, e.g. GreedyScheduler.
+    :return: Scheduler class.
+    """
+    scheduler_class = getattr(schedulers, name, None)
+
+    if not isinstance(scheduler_class, type) or not issubclass(scheduler_class, AbstractScheduler):
+        raise ValueError("Unknown scheduler {0}".format(name))
+    if inspect.isabstract(scheduler_class):
+        raise ValueError("Scheduler {0} is abstract".format(name))
+
+    return scheduler_class
+
+
+def _parse_option(annotation: Any, value: str) -> Any:
+    for option_type in getattr(annotation, '__args__', None) or [annotation]:
+        if isinstance(option_type, type) and issubclass(option_type, Enum):
+            for member in option_type:
+                if value.upper() == member.name or value == str(member.value):
+                    return member
+
+            raise ValueError("Expected one of {0}, got {1}".format([member.name for member in option_type], value))
+
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def create_scheduler(name: str, options: Dict[str, str]) -> AbstractScheduler:
+    """
+    Create a scheduler from the options given as strings. The options are the parameters of the constructor of the
+    scheduler, enumerations like FlowMethod are given by the names of their members and the other values in JSON.
+    :param name: Name of the scheduler class, e.g. GreedyScheduler.
+    :param options: Values of the parameters of the constructor by their names.
+    :return: Created scheduler.
+    """
+    scheduler_class = get_scheduler_class(name)
+    parameters = inspect.signature(scheduler_class.__init__).parameters
+    kwargs = {}
+
+    for key, value in options.items():
+        if key not in parameters or key == 'self':
+            raise ValueError("Scheduler {0} has no option {1}".format(name, key))
+
+        kwargs[key] = _parse_option(parameters[key].annotation, value)
+
+    return scheduler_class(**kwargs)
+
+
+def create_job_pool(record: Dict[str, Any], job_pool_name: Optional[str] = None) -> AbstractJobPool:
+    """
+    Create a job pool from a record. The jobs of the record are given in the field jobs, either with a single execution
+    window as {"release_time": 0, "deadline": 3, "duration": 2} or with multiple execution windows as
+    {"availability_intervals": [[0, 1], [4, 5]], "duration": 2}. The field job_pool may name the class of the job pool
+    from the subpackage models, a columnar job pool is used by default. The fixed length job pools take the duration of
+    the jobs from the field duration.
+    :param record: Record to read.
+    :param job_pool_name: Name of the job pool class used if the record does not name one.
+    :return: Created job pool.
+    """
+    jobs = record.get('jobs', [])
+    multiple_windows = any('availability_intervals' in job for job in jobs)
+    name = record.get('job_pool', job_pool_name) or ('ColumnarJobPoolMI' if multiple_windows else 'ColumnarJobPool')
+    job_pool_class = getattr(models, name, None)
+
+    if not isinstance(job_pool_class, type) or not issubclass(job_pool_class, AbstractJobPool):
+        raise ValueError("Unknown job pool {0}".format(name))
+
+    if 'duration' in inspect.signature(job_pool_class.__init__).parameters:
+        job_pool = job_pool_class(record['duration'])
+    else:
+        job_pool = job_pool_class()
+
+    windows = [
+        job['availability_intervals'] if 'availability_intervals' in job else [[job['release_time'], job['deadline']]]
+        for job in jobs
+    ]
+    fixed_duration = getattr(job_pool, 'duration', None)
+
+    job_pool.add_columns(
+        [start for job_windows in windows for start, _ in job_windows],
+        [end for job_windows in windows for _, end in job_windows],
+        [len(job_windows) for job_windows in windows],
+        [job['duration'] if fixed_duration is None else fixed_duration for job in jobs],
+    )
+
+    return job_pool
+
+
+def _to_number(value: Any) -> Union[int, float]:
+    return value.item() if hasattr(value, 'item') else value
+
+
+def _to_intervals(intervals: Sequence[Any]) -> List[List[Union[int, float]]]:
+    return [[_to_number(interval.start), _to_number(interval.end)] for interval in intervals]
+
+
+def encode_schedule(schedule: Schedule, job_pool: AbstractJobPool) -> Dict[str, Any]:
+    """
+    Encode a schedule as a JSON object, the jobs are referred to by their positions in the job pool, i.e. in the field
+    jobs of the record.
+    :param schedule: Schedule to encode.
+    :param job_pool: Job pool the schedule was computed for.
+    :return: Encoded schedule.
+    """
+    if schedule.all_jobs_scheduled is False:
+        return {'all_jobs_scheduled': False, 'active_time_intervals': None, 'job_schedules': None}
+
+    job_schedules = []
+
+    for job_schedule in schedule.job_schedules:
+        if isinstance(job_schedule, BatchJobSchedule):
+            job_schedules.append({
+                'jobs': sorted(job_pool.get_position(job) for job in job_schedule.jobs),
+                'execution_start': _to_number(job_schedule.execution_start),
+                'execution_end': _to_number(job_schedule.execution_end),
+            })
+        else:
+            job_schedules.append({
+                'job': job_pool.get_position(job_schedule.job),
+                'execution_intervals': _to_intervals(job_schedule.execution_intervals),
+            })
+
+    return {
+        'all_jobs_scheduled': True,
+        'active_time_intervals': _to_intervals(schedule.active_time_intervals),
+        'job_schedules': job_schedules,
+    }
+
+
+def _takes_max_concurrency(scheduler: AbstractScheduler) -> bool:
+    parameters = inspect.signature(scheduler.process).parameters.values()
+
+    return any(parameter.kind == inspect.Parameter.VAR_POSITIONAL for parameter in parameters) or len([
+        parameter
+        for parameter in parameters
+        if parameter.kind in [inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD]
+    ]) >= 2
+
+
+def _initialize_worker(scheduler: AbstractScheduler, max_concurrency: int, job_pool_name: Optional[str]) -> None:
+    global _worker_scheduler, _worker_max_concurrency, _worker_job_pool_name, _worker_takes_max_concurrency
+    _worker_scheduler = scheduler
+    _worker_max_concurrency = max_concurrency
+    _worker_job_pool_name = job_pool_name
+    _worker_takes_max_concurrency = _takes_max_concurrency(scheduler)
+
+
+def _process_line(line_number: int, line: str) -> Tuple[bool, str]:
+    result: Dict[str, Any] = {'line': line_number}
+    start = time.perf_counter()
+
+    try:
+        record = json.loads(line)
+
+        if not isinstance(record, dict):
+            raise ValueError("Record is not a JSON object")
+        if 'id' in record:
+            result['id'] = record['id']
+
+        job_pool = create_job_pool(record, _worker_job_pool_name)
+        max_concurrency = record.get('max_concurrency', _worker_max_concurrency)
+        parsed = time.perf_counter()
+
+        if _worker_takes_max_concurrency is True:
+            schedule = _worker_scheduler.process(job_pool, max_concurrency)
+        else:
+            schedule = _worker_scheduler.process(job_pool)
+
+        processed = time.perf_counter()
+
+        result.update(encode_schedule(schedule, job_pool))
+        result['timing'] = {'parse': parsed - start, 'process': processed - parsed}
+    except Exception as exception:
+        result['error'] = "{0}: {1}".format(type(exception).__name__, exception)
+        result['timing'] = {'total': time.perf_counter() - start}
+
+    return 'error' not in result, json.dumps(result)
+
+
+def _read_lines(stream: IO[str]) -> Iterator[Tuple[int, str]]:
+    for line_number, line in enumerate(stream, 1):
+        if line.strip() != '':
+            yield line_number, line
+
+
+def _write_result(output: IO[str], result: Tuple[bool, str]) -> bool:
+    succeeded, line = result
+    output.write(line + '\n')
+    output.flush()
+    return succeeded
+
+
+def _parse_arguments(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='active-time-scheduling',
+        description="Process job pools given as JSON Lines with a scheduler and write the schedules as JSON Lines.",
+    )
+    parser.add_argument('input', nargs='?', default='-', help="File with the job pools, the standard input if '-'.")
+    parser.add_argument('-o', '--output', default='-', help="File for the schedules, the standard output if '-'.")
+    parser.add_argument('-s', '--scheduler', default='GreedyScheduler', help="Name of the scheduler class.")
+    parser.add_argument('-c', '--max-concurrency', type=int, default=1, help="Default maximum concurrency.")
+    parser.add_argument('--flow-method', help="Option flow_method of the scheduler, e.g. PREFLOW_PUSH.")
+    parser.add_argument('--lp-method', help="Option lp_method of the scheduler, e.g. HIGHS.")
+    parser.add_argument(
+        '--option',
+        action='append',
+        default=[],
+        metavar='NAME=VALUE',
+        help="Other option of the scheduler, may be repeated.",
+    )
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1, help="Number of worker processes.")
+    parser.add_argument('-j', '--job-pool', help="Job pool class for the records that do not name one.")
+    parser.add_argument('-q', '--queue-size', type=int, help="Maximum number of records in flight, twice the workers.")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point of the command line interface. Every line of the input is a JSON object with a job pool, see
+    create_job_pool, and optionally the fields id and max_concurrency, which is ignored by the schedulers that do not
+    take it, e.g. MatchingScheduler. For every record a line with the schedule, see encode_schedule, the number of the
+    input line, the id of the record and the time spent on parsing and on processing the record in seconds is written,
+    or with the field error if the record could not be processed. The records are processed by a pool of worker
+    processes and the results are written in the order of the input. At most queue_size records are read ahead of the
+    written results, so the memory used does not depend on the length of the input.
+    :param argv: Command line arguments, the arguments of the process if not provided.
+    :return: Exit status, 1 if any record could not be processed.
+    """
+    args = _parse_arguments(argv)
+
+    options = {}
+
+    for option in args.option:
+        key, separator, value = option.partition('=')
+
+        if separator == '':
+            print("Option {0} is not of the form NAME=VALUE".format(option), file=sys.stderr)
+            return 2
+
+        options[key.strip()] = value.strip()
+
+    if args.flow_method is not None:
+        options['flow_method'] = args.flow_method
+    if args.lp_method is not None:
+        options['lp_method'] = args.lp_method
+
+    try:
+        scheduler = create_scheduler(args.scheduler, options)
+    except (TypeError, ValueError) as exception:
+        print(exception, file=sys.stderr)
+        return 2
+
+    workers = max(args.workers, 1)
+    queue_size = max(args.queue_size if args.queue_size is not None else 2 * workers, 1)
+    succeeded = True
+
+    input_stream = sys.stdin if args.input == '-' else open(args.input, 'r')
+    output_stream = sys.stdout if args.output == '-' else open(args.output, 'w')
+
+    try:
+        if workers == 1:
+            _initialize_worker(scheduler, args.max_concurrency, args.job_pool)
+
+            for line_number, line in _read_lines(input_stream):
+                succeeded &= _write_result(output_stream, _process_line(line_number, line))
+        else:
+            with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_initialize_worker,
+                    initargs=(scheduler, args.max_concurrency, args.job_pool),
+            ) as executor:
+                pending: Deque[Future] = deque()
+
+                for line_number, line in _read_lines(input_stream):
+                    pending.append(executor.submit(_process_line, line_number, line))
+
+                    if len(pending) >= queue_size:
+                        succeeded &= _write_result(output_stream, pending.popleft().result())
+
+                while len(pending) != 0:
+                    succeeded &= _write_result(output_stream, pending.popleft().result())
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+
+    return 0 if succeeded else 1
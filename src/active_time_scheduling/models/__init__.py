@@ -1,33 +1,77 @@
 # -*- coding: utf-8 -*-
 from .job import AbstractJob, BatchJob, Job, JobMI, TimeInterval
+from .job_columns import JobColumns
+from .time_slot_index import TimeSlotIndex
 from .job_pool import (
+    AbstractColumnarJobPool,
     AbstractJobPool,
+    ColumnarFixedLengthJobPool,
+    ColumnarJobPool,
+    ColumnarJobPoolMI,
+    ColumnarUnitJobPool,
     JobPool,
     JobPoolMI,
     FixedLengthJobPool,
     FixedLengthJobPoolMI,
+    JobSet,
     UnitJobPool,
     UnitJobPoolMI,
 )
 from .job_schedule import AbstractJobSchedule, BatchJobSchedule, JobScheduleMI, JobSchedule
 from .schedule import Schedule
+from .encoded_schedule import EncodedSchedule
+from .shared_job_pool import SharedJobPool
+from .job_pool_io import (
+    get_job_pool_dtype,
+    get_job_pool_fields,
+    read_job_pool_binary,
+    read_job_pool_csv,
+    read_job_pool_npz,
+    write_job_pool_binary,
+    write_job_pool_csv,
+    write_job_pool_npz,
+    write_schedule_binary,
+    write_schedule_csv,
+    write_schedule_npz,
+)
 
 __all__ = [
+    'AbstractColumnarJobPool',
     'AbstractJob',
     'AbstractJobSchedule',
     'AbstractJobPool',
+    'ColumnarFixedLengthJobPool',
+    'ColumnarJobPool',
+    'ColumnarJobPoolMI',
+    'ColumnarUnitJobPool',
     'JobPool',
     'JobPoolMI',
     'FixedLengthJobPool',
     'FixedLengthJobPoolMI',
     'BatchJobSchedule',
     'BatchJob',
+    'EncodedSchedule',
     'Job',
+    'JobColumns',
     'JobMI',
     'JobSchedule',
     'JobScheduleMI',
+    'JobSet',
     'Schedule',
+    'SharedJobPool',
     'TimeInterval',
+    'TimeSlotIndex',
     'UnitJobPool',
     'UnitJobPoolMI',
+    'get_job_pool_dtype',
+    'get_job_pool_fields',
+    'read_job_pool_binary',
+    'read_job_pool_csv',
+    'read_job_pool_npz',
+    'write_job_pool_binary',
+    'write_job_pool_csv',
+    'write_job_pool_npz',
+    'write_schedule_binary',
+    'write_schedule_csv',
+    'write_schedule_npz',
 ]
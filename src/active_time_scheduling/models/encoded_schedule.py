@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+import mmap
+import struct
+from numbers import Integral
+from numpy import array, cumsum, dtype, float64, frombuffer, int8, int64, min_scalar_type, ndarray, result_type, zeros
+from typing import Any, Dict, List, Tuple, Union
+
+from . import (
+    AbstractJob,
+    BatchJob,
+    BatchJobSchedule,
+    Job,
+    JobColumns,
+    JobMI,
+    JobSchedule,
+    JobScheduleMI,
+    Schedule,
+    TimeInterval,
+)
+
+
+class EncodedSchedule(object):
+    """
+    Compact representation of a schedule that refers to the jobs by their positions in the canonical order of the job
+    pool instead of the job objects, so it can be decoded onto any job pool with the same fingerprint. The schedule is
+    stored in a handful of NumPy arrays:
+    1. active_time_intervals of shape (k, 2) with the bounds of the active time intervals.
+    2. kinds with the type of every job schedule, see the KIND_* constants.
+    3. job_indptr and job_positions, the jobs of every job schedule in the CSR form.
+    4. interval_indptr and intervals, the execution intervals of every job schedule in the CSR form.
+    All bounds are stored as int64 if they are integral and as float64 otherwise. The binary form is a fixed size
+    header with the flag, the types of the bounds and the lengths of the arrays followed by the raw arrays in the
+    native byte order, the int8 array last so the other arrays stay 8-byte aligned. The schedule is pickled as its
+    arrays, so with the pickle protocol 5 they can be passed as out-of-band buffers.
+    """
+
+    KIND_JOB_SCHEDULE_MI = 0
+    KIND_JOB_SCHEDULE = 1
+    KIND_BATCH_JOB_SCHEDULE = 2
+
+    MAGIC = b'ATSC'
+    VERSION = 1
+    HEADER = struct.Struct('=4sBBBBQQQQ')
+    DTYPES = [dtype(int64), dtype(float64)]
+
+    def __init__(
+            self,
+            all_jobs_scheduled: bool,
+            active_time_intervals: ndarray,
+            kinds: ndarray,
+            job_indptr: ndarray,
+            job_positions: ndarray,
+            interval_indptr: ndarray,
+            intervals: ndarray,
+    ) -> None:
+        """
+        Initialize the class with parameters.
+        :param all_jobs_scheduled: Whether a feasible schedule was found.
+        :param active_time_intervals: Bounds of the active time intervals.
+        :param kinds: Types of the job schedules.
+        :param job_indptr: Offsets of the jobs of every job schedule in job_positions.
+        :param job_positions: Canonical positions of the jobs.
+        :param interval_indptr: Offsets of the execution intervals of every job schedule in intervals.
+        :param intervals: Bounds of the execution intervals.
+        """
+        self.all_jobs_scheduled = all_jobs_scheduled
+        self.active_time_intervals = active_time_intervals
+        self.kinds = kinds
+        self.job_indptr = job_indptr
+        self.job_positions = job_positions
+        self.interval_indptr = interval_indptr
+        self.intervals = intervals
+
+    def __reduce__(self) -> Tuple[type, Tuple[Any, ...]]:
+        return EncodedSchedule, (
+            self.all_jobs_scheduled,
+            self.active_time_intervals,
+            self.kinds,
+            self.job_indptr,
+            self.job_positions,
+            self.interval_indptr,
+            self.intervals,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return sum(values.nbytes for values in self.arrays)
+
+    @property
+    def arrays(self) -> List[ndarray]:
+        return [
+            self.active_time_intervals,
+            self.job_indptr,
+            self.job_positions,
+            self.interval_indptr,
+            self.intervals,
+            self.kinds,
+        ]
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the schedule into the binary form.
+        :return: Binary form of the schedule.
+        """
+        header = self.HEADER.pack(
+            self.MAGIC,
+            self.VERSION,
+            int(self.all_jobs_scheduled),
+            self.DTYPES.index(self.active_time_intervals.dtype),
+            self.DTYPES.index(self.intervals.dtype),
+            len(self.active_time_intervals),
+            len(self.kinds),
+            len(self.job_positions),
+            len(self.intervals),
+        )
+
+        return b''.join([header] + [values.tobytes() for values in self.arrays])
+
+    @classmethod
+    def from_buffer(cls, buffer: Union[bytes, mmap.mmap]) -> 'EncodedSchedule':
+        """
+        Read the schedule from the binary form without copying, the arrays are views of the buffer.
+        :param buffer: Binary form of the schedule, e.g. a memory-mapped file.
+        :return: Encoded schedule.
+        """
+        if len(buffer) < cls.HEADER.size:
+            raise ValueError("Buffer is too short to contain a schedule")
+
+        magic, version, all_jobs_scheduled, active_dtype, intervals_dtype, k, s, p, q = cls.HEADER.unpack_from(buffer)
+
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Buffer does not contain a schedule")
+
+        shapes = [
+            (k * 2, cls.DTYPES[active_dtype]),
+            (s + 1, dtype(int64)),
+            (p, dtype(int64)),
+            (s + 1, dtype(int64)),
+            (q * 2, cls.DTYPES[intervals_dtype]),
+            (s, dtype(int8)),
+        ]
+
+        if len(buffer) != cls.HEADER.size + sum(count * values_dtype.itemsize for count, values_dtype in shapes):
+            raise ValueError("Buffer size does not match the schedule header")
+
+        arrays = []
+        offset = cls.HEADER.size
+
+        for count, values_dtype in shapes:
+            arrays.append(frombuffer(buffer, dtype=values_dtype, count=count, offset=offset))
+            offset += count * values_dtype.itemsize
+
+        active_time_intervals, job_indptr, job_positions, interval_indptr, intervals, kinds = arrays
+
+        return cls(
+            bool(all_jobs_scheduled),
+            active_time_intervals.reshape(-1, 2),
+            kinds,
+            job_indptr,
+            job_positions,
+            interval_indptr,
+            intervals.reshape(-1, 2),
+        )
+
+    @staticmethod
+    def _to_array(bounds: List[Tuple[Any, Any]]) -> ndarray:
+        dtype = int64 if all(isinstance(bound, Integral) for pair in bounds for bound in pair) else float64
+        return array(bounds, dtype=dtype).reshape(-1, 2)
+
+    @staticmethod
+    def _to_intervals(bounds: ndarray) -> List[TimeInterval]:
+        return [TimeInterval(start, end) for start, end in bounds.tolist()]
+
+    @classmethod
+    def encode(cls, schedule: Schedule, positions: Dict[int, int]) -> 'EncodedSchedule':
+        """
+        Encode a schedule.
+        :param schedule: Schedule to encode.
+        :param positions: Canonical positions of the jobs by their IDs.
+        :return: Encoded schedule.
+        """
+        if schedule.all_jobs_scheduled is False:
+            return cls(
+                False,
+                zeros((0, 2), dtype=int64),
+                zeros(0, dtype=int8),
+                zeros(1, dtype=int64),
+                zeros(0, dtype=int64),
+                zeros(1, dtype=int64),
+                zeros((0, 2), dtype=int64),
+            )
+
+        kinds = []
+        job_positions = []
+        job_counts = []
+        intervals = []
+        interval_counts = []
+
+        for job_schedule in schedule.job_schedules:
+            if isinstance(job_schedule, BatchJobSchedule):
+                kinds.append(cls.KIND_BATCH_JOB_SCHEDULE)
+                jobs = sorted(job_schedule.jobs, key=lambda job: positions[job.id])
+                bounds = [(job_schedule.execution_start, job_schedule.execution_end)]
+            else:
+                is_single = isinstance(job_schedule, JobSchedule)
+                kinds.append(cls.KIND_JOB_SCHEDULE if is_single else cls.KIND_JOB_SCHEDULE_MI)
+                jobs = [job_schedule.job]
+                bounds = [(interval.start, interval.end) for interval in job_schedule.execution_intervals]
+
+            job_positions.extend(positions[job.id] for job in jobs)
+            job_counts.append(len(jobs))
+            intervals.extend(bounds)
+            interval_counts.append(len(bounds))
+
+        return cls(
+            True,
+            cls._to_array([(interval.start, interval.end) for interval in schedule.active_time_intervals]),
+            array(kinds, dtype=int8),
+            cumsum([0] + job_counts, dtype=int64),
+            array(job_positions, dtype=int64),
+            cumsum([0] + interval_counts, dtype=int64),
+            cls._to_array(intervals),
+        )
+
+    def decode(self, jobs: List[AbstractJob]) -> Schedule:
+        """
+        Decode the schedule onto the jobs of a job pool.
+        :param jobs: Jobs of the job pool in the canonical order.
+        :return: Decoded schedule.
+        """
+        if self.all_jobs_scheduled is False:
+            return Schedule(False, None, None)
+
+        job_indptr = self.job_indptr.tolist()
+        job_positions = self.job_positions.tolist()
+        interval_indptr = self.interval_indptr.tolist()
+        intervals = self.intervals.tolist()
+
+        job_schedules = []
+
+        for i, kind in enumerate(self.kinds.tolist()):
+            schedule_jobs = [jobs[j] for j in job_positions[job_indptr[i]:job_indptr[i + 1]]]
+            lo, hi = interval_indptr[i], interval_indptr[i + 1]
+
+            if kind == self.KIND_BATCH_JOB_SCHEDULE:
+                job_schedules.append(BatchJobSchedule(set(schedule_jobs), *intervals[lo]))
+            elif kind == self.KIND_JOB_SCHEDULE:
+                job_schedules.append(JobSchedule(schedule_jobs[0], *intervals[lo]))
+            else:
+                job_schedules.append(
+                    JobScheduleMI(schedule_jobs[0], [TimeInterval(start, end) for start, end in intervals[lo:hi]]),
+                )
+
+        return Schedule(True, self._to_intervals(self.active_time_intervals), job_schedules)
+
+
+_JOB_TYPES = [JobMI, Job, BatchJob]
+
+
+def _narrow(values: ndarray) -> ndarray:
+    if values.dtype != int64 or values.size == 0:
+        return values
+    return values.astype(result_type(min_scalar_type(values.min()), min_scalar_type(values.max())))
+
+
+def _reduce_schedule(schedule: Schedule) -> Tuple[Any, ...]:
+    jobs = {}
+
+    for job_schedule in schedule.job_schedules or []:
+        for job in (job_schedule.jobs if isinstance(job_schedule, BatchJobSchedule) else [job_schedule.job]):
+            jobs.setdefault(job.id, job)
+
+    jobs = list(jobs.values())
+
+    for job in jobs:
+        if type(job) not in _JOB_TYPES:
+            raise TypeError("Job of the type {0} can not be pickled".format(type(job).__name__))
+
+    columns = JobColumns.from_jobs(jobs)
+    encoded_schedule = EncodedSchedule.encode(schedule, {job.id: i for i, job in enumerate(jobs)})
+
+    return _restore_schedule, (
+        EncodedSchedule(
+            encoded_schedule.all_jobs_scheduled,
+            _narrow(encoded_schedule.active_time_intervals),
+            encoded_schedule.kinds,
+            _narrow(encoded_schedule.job_indptr),
+            _narrow(encoded_schedule.job_positions),
+            _narrow(encoded_schedule.interval_indptr),
+            _narrow(encoded_schedule.intervals),
+        ),
+        _narrow(columns.ids),
+        _narrow(columns.durations),
+        _narrow(columns.window_starts),
+        _narrow(columns.window_ends),
+        _narrow(columns.window_indptr),
+        array([_JOB_TYPES.index(type(job)) for job in jobs], dtype=int8),
+    )
+
+
+def _restore_schedule(
+        encoded_schedule: EncodedSchedule,
+        ids: ndarray,
+        durations: ndarray,
+        window_starts: ndarray,
+        window_ends: ndarray,
+        window_indptr: ndarray,
+        kinds: ndarray,
+) -> Schedule:
+    jobs = []
+    window_indptr = window_indptr.tolist()
+    window_starts = window_starts.tolist()
+    window_ends = window_ends.tolist()
+
+    for i, (job_id, duration, kind) in enumerate(zip(ids.tolist(), durations.tolist(), kinds.tolist())):
+        lo, hi = window_indptr[i], window_indptr[i + 1]
+        job_type = _JOB_TYPES[kind]
+
+        if job_type is BatchJob:
+            jobs.append(BatchJob(window_starts[lo], window_ends[lo], job_id=job_id))
+        elif job_type is Job:
+            jobs.append(Job(window_starts[lo], window_ends[lo], duration, job_id=job_id))
+        else:
+            intervals = [TimeInterval(start, end) for start, end in zip(window_starts[lo:hi], window_ends[lo:hi])]
+            jobs.append(JobMI(intervals, duration, job_id=job_id))
+
+    return encoded_schedule.decode(jobs)
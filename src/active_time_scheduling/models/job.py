@@ -2,23 +2,35 @@
 from abc import ABC
 from functools import total_ordering
 from itertools import count
-from typing import Iterator, List, Optional, Set
+from typing import Any, Iterator, List, Optional, Set, Tuple
 
 
 @total_ordering
 class TimeInterval(object):
     """
-    An entity that represents a time interval of the form [start, end].
+    An immutable entity that represents a time interval of the form [start, end]. Time intervals are hashable, and the
+    setters of the models that expose the bounds of their intervals replace the intervals instead of changing them.
     """
 
+    __slots__ = ('start', 'end')
+
     def __init__(self, start: int, end: int) -> None:
         """
         Initialize the class with parameters.
         :param start: Start of the time interval.
         :param end: End of the time interval.
         """
-        self.start = start
-        self.end = end
+        _set_start(self, start)
+        _set_end(self, end)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("TimeInterval is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("TimeInterval is immutable")
+
+    def __reduce__(self) -> Tuple[type, Tuple[int, int]]:
+        return TimeInterval, (self.start, self.end)
 
     def __str__(self) -> str:
         return "TimeInterval(start={0}, end={1})".format(self.start, self.end)
@@ -35,6 +47,9 @@ class TimeInterval(object):
     def __lt__(self, other: 'TimeInterval') -> bool:
         return (self.start, self.end) < (other.start, other.end)
 
+    def __hash__(self) -> int:
+        return hash((self.start, self.end))
+
     def __iter__(self) -> Iterator[int]:
         return iter(range(int(self.start), int(self.end) + 1))
 
@@ -50,20 +65,15 @@ class TimeInterval(object):
 
         time_intervals = []
 
-        min_t = min(timestamps)
-        max_t = max(timestamps)
-
-        time_interval_start = None
+        timestamps = sorted(set(timestamps))
+        time_interval_start = timestamps[0]
 
-        for t in range(min_t, max_t + 1):
-            if time_interval_start is None and t in timestamps:
-                time_interval_start = t
-            if time_interval_start is not None and t not in timestamps:
-                time_intervals.append(TimeInterval(time_interval_start, t - 1))
-                time_interval_start = None
+        for t, next_t in zip(timestamps, timestamps[1:]):
+            if next_t != t + 1:
+                time_intervals.append(TimeInterval(time_interval_start, t))
+                time_interval_start = next_t
 
-        if time_interval_start is not None:
-            time_intervals.append(TimeInterval(time_interval_start, max_t))
+        time_intervals.append(TimeInterval(time_interval_start, timestamps[-1]))
 
         return time_intervals
 
@@ -99,19 +109,33 @@ class TimeInterval(object):
         return merged_time_intervals
 
 
+_set_start = TimeInterval.start.__set__
+_set_end = TimeInterval.end.__set__
+
+
 class AbstractJob(ABC):
     """
-    An abstract class representing a single job.
+    An abstract class representing a single job. Jobs are hashed by their IDs. The job pools assign the IDs of their
+    jobs from their own counters, so the IDs are unique within a job pool and do not depend on the process the job pool
+    was built in. Jobs created outside of a job pool get their IDs from a process-wide counter.
     """
+    __slots__ = ('id', 'availability_intervals', 'duration')
+
     _id_iter = count()
 
-    def __init__(self, availability_intervals: List[TimeInterval], duration: Optional[int]) -> None:
+    def __init__(
+            self,
+            availability_intervals: List[TimeInterval],
+            duration: Optional[int],
+            job_id: Optional[int] = None,
+    ) -> None:
         """
         Initialize the class with parameters.
         :param availability_intervals: execution intervals of the job.
         :param duration: Duration of the job.
+        :param job_id: The ID of the job, taken from the process-wide counter if not provided.
         """
-        self.id = next(self.__class__._id_iter)
+        self.id = job_id if job_id is not None else next(self.__class__._id_iter)
         self.availability_intervals = availability_intervals
         self.duration = duration
 
@@ -127,14 +151,16 @@ class JobMI(AbstractJob):
     """
     Job with multiple execution windows. MI stands for multiple intervals.
     """
+    __slots__ = ()
 
-    def __init__(self, availability_intervals: List[TimeInterval], duration: int) -> None:
+    def __init__(self, availability_intervals: List[TimeInterval], duration: int, job_id: Optional[int] = None) -> None:
         """
         Initialize the class with parameters.
         :param availability_intervals: Execution windows of the job.
         :param duration: Duration of the job.
+        :param job_id: The ID of the job, taken from the process-wide counter if not provided.
         """
-        super(JobMI, self).__init__(availability_intervals, duration)
+        super(JobMI, self).__init__(availability_intervals, duration, job_id)
 
     def __str__(self) -> str:
         return "JobMI(availability_intervals={0}, duration={1})".format(
@@ -150,15 +176,17 @@ class Job(JobMI):
     """
     Job with a single execution window.
     """
+    __slots__ = ()
 
-    def __init__(self, release_time: int, deadline: int, duration: int) -> None:
+    def __init__(self, release_time: int, deadline: int, duration: int, job_id: Optional[int] = None) -> None:
         """
         Initialize the class with parameters.
         :param release_time: Release time of the job.
         :param deadline: Deadline of the job.
         :param duration: Duration of the job.
+        :param job_id: The ID of the job, taken from the process-wide counter if not provided.
         """
-        super(Job, self).__init__([TimeInterval(release_time, deadline)], duration)
+        super(Job, self).__init__([TimeInterval(release_time, deadline)], duration, job_id)
 
     def __str__(self) -> str:
         return "Job(release_time={0}, deadline={1}, duration={2})".format(
@@ -175,7 +203,7 @@ class Job(JobMI):
 
     @release_time.setter
     def release_time(self, release_time: int) -> None:
-        self.availability_intervals[0].start = release_time
+        self.availability_intervals[0] = TimeInterval(release_time, self.availability_intervals[0].end)
 
     @property
     def deadline(self) -> int:
@@ -183,7 +211,7 @@ class Job(JobMI):
 
     @deadline.setter
     def deadline(self, deadline: int) -> None:
-        self.availability_intervals[0].end = deadline
+        self.availability_intervals[0] = TimeInterval(self.availability_intervals[0].start, deadline)
 
     def __eq__(self, other: 'Job') -> bool:
         return (self.release_time, self.deadline, self.id) == (other.release_time, other.deadline, other.id)
@@ -192,21 +220,23 @@ class Job(JobMI):
         return (self.release_time, self.deadline, self.id) < (other.release_time, other.deadline, other.id)
 
     def __hash__(self) -> int:
-        return hash((self.release_time, self.deadline, self.id))
+        return self.id
 
 
 class BatchJob(AbstractJob):
     """
     Represents a job that is to be scheduled in a batch.
     """
+    __slots__ = ()
 
-    def __init__(self, release_time: int, deadline: int) -> None:
+    def __init__(self, release_time: int, deadline: int, job_id: Optional[int] = None) -> None:
         """
         Initialize the class with parameters.
         :param release_time: Release time of the job.
         :param deadline: Deadline of the job.
+        :param job_id: The ID of the job, taken from the process-wide counter if not provided.
         """
-        super(BatchJob, self).__init__([TimeInterval(release_time, deadline)], None)
+        super(BatchJob, self).__init__([TimeInterval(release_time, deadline)], None, job_id)
 
     def __str__(self) -> str:
         return "BatchJob(release_time={0}, deadline={1})".format(self.release_time, self.deadline)
@@ -219,7 +249,7 @@ class BatchJob(AbstractJob):
 
     @release_time.setter
     def release_time(self, release_time: int) -> None:
-        self.availability_intervals[0].start = release_time
+        self.availability_intervals[0] = TimeInterval(release_time, self.availability_intervals[0].end)
 
     @property
     def deadline(self) -> int:
@@ -227,7 +257,7 @@ class BatchJob(AbstractJob):
 
     @deadline.setter
     def deadline(self, deadline: int) -> None:
-        self.availability_intervals[0].end = deadline
+        self.availability_intervals[0] = TimeInterval(self.availability_intervals[0].start, deadline)
 
     def __eq__(self, other: 'BatchJob') -> bool:
         return (self.release_time, self.deadline, self.id) == (other.release_time, other.deadline, other.id)
@@ -236,4 +266,4 @@ class BatchJob(AbstractJob):
         return (self.release_time, self.deadline, self.id) < (other.release_time, other.deadline, other.id)
 
     def __hash__(self) -> int:
-        return hash((self.release_time, self.deadline, self.id))
+        return self.id
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+from numpy import arange, asarray, diff, full, int64, maximum, minimum, ndarray, repeat, ufunc
+from typing import Optional, Sequence
+
+from . import AbstractJob
+
+
+class JobColumns(object):
+    """
+    Columnar representation of a fixed list of jobs. The durations are stored in an array and the execution windows in
+    CSR form: the windows of the i-th job are window_starts[window_indptr[i]:window_indptr[i + 1]] and the matching
+    slice of window_ends. Jobs are referred to by their position in the list, the job objects themselves are only
+    needed to create the job schedules, so they can be provided as a lazy sequence. The IDs of the jobs are stored as
+    well, so the columns describe the jobs completely and can be used to recreate them.
+    """
+
+    def __init__(
+            self,
+            jobs: Sequence[AbstractJob],
+            durations: ndarray,
+            window_starts: ndarray,
+            window_ends: ndarray,
+            window_indptr: ndarray,
+            ids: Optional[ndarray] = None,
+    ) -> None:
+        """
+        Initialize the class with parameters.
+        :param jobs: Jobs described by the columns.
+        :param durations: Durations of the jobs.
+        :param window_starts: Starts of the execution windows ordered by jobs.
+        :param window_ends: Ends of the execution windows ordered by jobs.
+        :param window_indptr: Offsets of the execution windows of every job.
+        :param ids: The IDs of the jobs, the positions of the jobs if not provided.
+        """
+        self.jobs = jobs
+        self.durations = asarray(durations, dtype=int64)
+        self.window_starts = asarray(window_starts, dtype=int64)
+        self.window_ends = asarray(window_ends, dtype=int64)
+        self.window_indptr = asarray(window_indptr, dtype=int64)
+        self.ids = asarray(ids, dtype=int64) if ids is not None else arange(len(self.durations), dtype=int64)
+
+    @classmethod
+    def from_jobs(cls, jobs: Sequence[AbstractJob]) -> 'JobColumns':
+        """
+        Create the columns from job objects. Jobs without a duration, e.g. batch jobs, get a zero duration.
+        :param jobs: Jobs to describe.
+        :return: Created columns.
+        """
+        counts = [len(job.availability_intervals) for job in jobs]
+
+        return cls(
+            jobs,
+            [job.duration if job.duration is not None else 0 for job in jobs],
+            [interval.start for job in jobs for interval in job.availability_intervals],
+            [interval.end for job in jobs for interval in job.availability_intervals],
+            [0] + [int(value) for value in asarray(counts, dtype=int64).cumsum()],
+            [job.id for job in jobs],
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.durations)
+
+    @property
+    def window_counts(self) -> ndarray:
+        return diff(self.window_indptr)
+
+    @property
+    def window_jobs(self) -> ndarray:
+        return repeat(arange(self.size), self.window_counts)
+
+    @property
+    def has_single_windows(self) -> bool:
+        return bool((self.window_counts == 1).all())
+
+    def _reduce_windows(self, operation: ufunc, values: ndarray, default: int) -> ndarray:
+        result = full(self.size, default, dtype=int64)
+        mask = self.window_counts > 0
+
+        if mask.any():
+            result[mask] = operation.reduceat(values, self.window_indptr[:-1][mask])
+
+        return result
+
+    @property
+    def release_times(self) -> ndarray:
+        return self._reduce_windows(minimum, self.window_starts, 0)
+
+    @property
+    def deadlines(self) -> ndarray:
+        return self._reduce_windows(maximum, self.window_ends, -1)
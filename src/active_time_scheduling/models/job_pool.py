@@ -1,25 +1,254 @@
 # -*- coding: utf-8 -*-
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from collections.abc import MutableSet, Sequence as AbstractSequence
+from numpy import arange, asarray, concatenate, cumsum, delete, int64, ndarray, ones, zeros
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
-from . import JobMI, Job, TimeInterval
+from . import AbstractJob, JobColumns, JobMI, Job, TimeInterval, TimeSlotIndex
+
+
+class JobSet(MutableSet):
+    """
+    Set of jobs that keeps the insertion order and assigns the jobs dense positions 0..n-1 in it, so the jobs are
+    iterated in a deterministic order and the lookups between positions and jobs take O(1). Removing a job shifts the
+    positions of the jobs added after it, which takes O(n). The IDs of the jobs are unique within the set, and the set
+    hands out the IDs for the new jobs of its job pool with create_id.
+    """
+
+    def __init__(self, jobs: Iterable[AbstractJob] = ()) -> None:
+        """
+        Initialize the class with parameters.
+        :param jobs: Jobs to add in order.
+        """
+        self._jobs: List[AbstractJob] = []
+        self._positions: Dict[int, int] = {}
+        self._next_id = 0
+
+        for job in jobs:
+            self.add(job)
+
+    def __contains__(self, job: Any) -> bool:
+        position = self._positions.get(getattr(job, 'id', None))
+        return position is not None and self._jobs[position] == job
+
+    def __iter__(self) -> Iterator[AbstractJob]:
+        return iter(self._jobs)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __str__(self) -> str:
+        return "JobSet({0})".format(self._jobs)
+
+    __repr__ = __str__
+
+    def add(self, job: AbstractJob) -> None:
+        """
+        Add a job to the end of the set if it is not present, raises ValueError if another job with the same ID is.
+        :param job: Job to add.
+        """
+        if job in self:
+            return
+        if job.id in self._positions:
+            raise ValueError("Job with the ID {0} is already present".format(job.id))
+
+        self._positions[job.id] = len(self._jobs)
+        self._jobs.append(job)
+        self._next_id = max(self._next_id, job.id + 1)
+
+    def create_id(self) -> int:
+        """
+        Create an ID for a new job, the IDs are created in increasing order starting from 0 and skip the IDs of the
+        jobs added to the set.
+        :return: Created ID.
+        """
+        job_id = self._next_id
+        self._next_id += 1
+        return job_id
+
+    def discard(self, job: AbstractJob) -> None:
+        """
+        Remove a job from the set if it is present.
+        :param job: Job to remove.
+        """
+        if job not in self:
+            return
+
+        position = self._positions.pop(job.id)
+        del self._jobs[position]
+
+        for i in range(position, len(self._jobs)):
+            self._positions[self._jobs[i].id] = i
+
+    def find(self, job_id: int) -> Optional[AbstractJob]:
+        """
+        Find a job by its ID.
+        :param job_id: The ID of the job.
+        :return: Job with the ID if present.
+        """
+        position = self._positions.get(job_id)
+        return self._jobs[position] if position is not None else None
+
+    def get_job(self, position: int) -> AbstractJob:
+        """
+        Get a job by its position.
+        :param position: Position of the job.
+        :return: Job at the position.
+        """
+        return self._jobs[position]
+
+    def get_position(self, job: AbstractJob) -> int:
+        """
+        Get the position of a job, raises KeyError if the job is not present.
+        :param job: Job to find.
+        :return: Position of the job.
+        """
+        if job not in self:
+            raise KeyError(job.id)
+        return self._positions[job.id]
 
 
 class AbstractJobPool(ABC):
     """
-    An abstract entity that represents a job pool.
+    An abstract entity that represents a job pool. The jobs are stored in a JobSet, so they are iterated in the order
+    they were added and have dense positions 0..n-1 in the job pool, which the schedulers use as the node numbers of
+    their graphs and the positions of the jobs in their arrays. The IDs of the jobs are assigned by the job pool, so
+    job pools built in different processes do not depend on each other. Job pools are pickled as their columns, see
+    JobColumns, instead of the graph of the job objects; the columns are NumPy arrays, so with the pickle protocol 5
+    they can be passed as out-of-band buffers without copying.
     """
 
     def __init__(self) -> None:
         """
         Initialize the class with parameters.
         """
-        self.jobs = set()
+        self.jobs = JobSet()
+
+    @property
+    def jobs(self) -> JobSet:
+        return self._jobs
+
+    @jobs.setter
+    def jobs(self, jobs: Iterable[AbstractJob]) -> None:
+        self._jobs = JobSet(jobs)
 
     @property
     def size(self) -> int:
         return len(self.jobs)
 
+    def get_job(self, position: int) -> AbstractJob:
+        """
+        Get a job by its position in the job pool.
+        :param position: Position of the job.
+        :return: Job at the position.
+        """
+        return self.jobs.get_job(position)
+
+    def get_position(self, job: AbstractJob) -> int:
+        """
+        Get the position of a job in the job pool, raises KeyError if the job is not in the job pool.
+        :param job: Job to find.
+        :return: Position of the job.
+        """
+        return self.jobs.get_position(job)
+
+    def remove_job(self, job_id: int) -> None:
+        """
+        Remove a job from the job pool, the positions of the jobs added after it are shifted.
+        :param job_id: The ID of the job to remove.
+        """
+        job = self.jobs.find(job_id)
+
+        if job is None:
+            raise KeyError(job_id)
+
+        self.jobs.discard(job)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        columns = self.get_columns()
+        state = {key: value for key, value in vars(self).items() if not key.startswith('_')}
+
+        return _restore_job_pool, (
+            self.__class__,
+            state,
+            columns.ids,
+            columns.durations,
+            columns.window_starts,
+            columns.window_ends,
+            columns.window_indptr,
+        )
+
+    def __copy__(self) -> 'AbstractJobPool':
+        job_pool = self.__class__.__new__(self.__class__)
+        job_pool.__dict__.update(self.__dict__)
+        return job_pool
+
+    def _create_job(self, columns: JobColumns, position: int) -> AbstractJob:
+        lo, hi = columns.window_indptr[position:position + 2].tolist()
+
+        return JobMI(
+            availability_intervals=[
+                TimeInterval(start, end)
+                for start, end in zip(columns.window_starts[lo:hi].tolist(), columns.window_ends[lo:hi].tolist())
+            ],
+            duration=columns.durations[position].item(),
+            job_id=columns.ids[position].item(),
+        )
+
+    def _load_columns(self, columns: JobColumns) -> None:
+        self.jobs = [self._create_job(columns, i) for i in range(columns.size)]
+
+    def add_columns(
+            self,
+            window_starts: Sequence[int],
+            window_ends: Sequence[int],
+            window_counts: Sequence[int],
+            durations: Sequence[int],
+    ) -> None:
+        """
+        Add jobs given in the columnar form, see JobColumns, to the job pool. The jobs get new IDs of the job pool and
+        are created as the jobs of the job pool would be, e.g. single window jobs for a JobPool, so every job is
+        expected to have a single execution window in that case.
+        :param window_starts: Starts of the execution windows of the jobs to add, ordered by jobs.
+        :param window_ends: Ends of the execution windows of the jobs to add, ordered by jobs.
+        :param window_counts: Numbers of the execution windows of the jobs to add.
+        :param durations: Durations of the jobs to add.
+        """
+        durations, window_starts, window_ends, window_counts = _check_columns(
+            durations,
+            window_starts,
+            window_ends,
+            window_counts,
+        )
+        columns = JobColumns(
+            (),
+            durations,
+            window_starts,
+            window_ends,
+            concatenate([[0], cumsum(window_counts)]),
+            [self.jobs.create_id() for _ in range(len(durations))],
+        )
+
+        for i in range(columns.size):
+            self.jobs.add(self._create_job(columns, i))
+
+    def get_columns(self) -> JobColumns:
+        """
+        Create the columnar representation of the jobs of the job pool. The columns fix the order of the jobs, so they
+        are meant to be created once per processing of the job pool.
+        :return: Columns of the jobs.
+        """
+        return JobColumns.from_jobs(list(self.jobs))
+
+    def create_time_slot_index(self, timestamps: Optional[Sequence[int]] = None) -> TimeSlotIndex:
+        """
+        Create an inverted index from time slots to the jobs of the job pool available at them. The index fixes the
+        order of the jobs, so it is meant to be created once per processing of the job pool.
+        :param timestamps: Sorted timestamps to index, all timestamps covered by the jobs if not provided.
+        :return: Created index.
+        """
+        return TimeSlotIndex(self.get_columns(), timestamps)
+
     @abstractmethod
     def add_job(self, *args) -> int:
         """
@@ -30,12 +259,57 @@ class AbstractJobPool(ABC):
         pass
 
 
+def _check_columns(
+        durations: Sequence[int],
+        window_starts: Sequence[int],
+        window_ends: Sequence[int],
+        window_counts: Sequence[int],
+) -> Tuple[ndarray, ndarray, ndarray, ndarray]:
+    durations = asarray(durations, dtype=int64).reshape(-1)
+    window_starts = asarray(window_starts, dtype=int64).reshape(-1)
+    window_ends = asarray(window_ends, dtype=int64).reshape(-1)
+    window_counts = asarray(window_counts, dtype=int64).reshape(-1)
+
+    if len(durations) != len(window_counts):
+        raise ValueError("Number of durations does not match the number of jobs")
+    if len(window_starts) != len(window_ends) or len(window_starts) != window_counts.sum():
+        raise ValueError("Number of execution windows does not match the window counts")
+
+    return durations, window_starts, window_ends, window_counts
+
+
+def _restore_job_pool(
+        cls: type,
+        state: Dict[str, Any],
+        ids: ndarray,
+        durations: ndarray,
+        window_starts: ndarray,
+        window_ends: ndarray,
+        window_indptr: ndarray,
+) -> AbstractJobPool:
+    job_pool = cls.__new__(cls)
+    job_pool.__dict__.update(state)
+    job_pool._load_columns(JobColumns((), durations, window_starts, window_ends, window_indptr, ids))
+    return job_pool
+
+
+def _create_single_window_job(columns: JobColumns, position: int) -> Job:
+    window = columns.window_indptr[position]
+
+    return Job(
+        release_time=columns.window_starts[window].item(),
+        deadline=columns.window_ends[window].item(),
+        duration=columns.durations[position].item(),
+        job_id=columns.ids[position].item(),
+    )
+
+
 class JobPoolMI(AbstractJobPool):
     """
     Job pool of jobs with multiple execution windows. MI stands for multiple intervals.
     """
 
-    def add_job(self, availability_intervals: List[Tuple[int, int]], duration: int) -> None:
+    def add_job(self, availability_intervals: List[Tuple[int, int]], duration: int) -> int:
         """
         Add a job to the job pool.
         :param availability_intervals: Execution windows of the job to add.
@@ -45,6 +319,7 @@ class JobPoolMI(AbstractJobPool):
         job = JobMI(
             availability_intervals=[TimeInterval(start, end) for start, end in availability_intervals],
             duration=duration,
+            job_id=self.jobs.create_id(),
         )
         self.jobs.add(job)
         return job.id
@@ -55,7 +330,10 @@ class JobPool(AbstractJobPool):
     Job pool of jobs with a single execution window.
     """
 
-    def add_job(self, release_time: int, deadline: int, duration: int) -> None:
+    def _create_job(self, columns: JobColumns, position: int) -> Job:
+        return _create_single_window_job(columns, position)
+
+    def add_job(self, release_time: int, deadline: int, duration: int) -> int:
         """
         Add a job to the job pool.
         :param release_time: Release time of the job to add.
@@ -67,6 +345,7 @@ class JobPool(AbstractJobPool):
             release_time=release_time,
             deadline=deadline,
             duration=duration,
+            job_id=self.jobs.create_id(),
         )
         self.jobs.add(job)
         return job.id
@@ -85,7 +364,7 @@ class FixedLengthJobPoolMI(AbstractJobPool):
         super(FixedLengthJobPoolMI, self).__init__()
         self.duration = duration
 
-    def add_job(self, availability_intervals: List[Tuple[int, int]]) -> None:
+    def add_job(self, availability_intervals: List[Tuple[int, int]]) -> int:
         """
         Add a job to the job pool.
         :param availability_intervals: Execution windows of the job to add.
@@ -94,6 +373,7 @@ class FixedLengthJobPoolMI(AbstractJobPool):
         job = JobMI(
             availability_intervals=[TimeInterval(start, end) for start, end in availability_intervals],
             duration=self.duration,
+            job_id=self.jobs.create_id(),
         )
         self.jobs.add(job)
         return job.id
@@ -112,7 +392,10 @@ class FixedLengthJobPool(AbstractJobPool):
         super(FixedLengthJobPool, self).__init__()
         self.duration = duration
 
-    def add_job(self, release_time: int, deadline: int) -> None:
+    def _create_job(self, columns: JobColumns, position: int) -> Job:
+        return _create_single_window_job(columns, position)
+
+    def add_job(self, release_time: int, deadline: int) -> int:
         """
         Add a job to the job pool.
         :param release_time: Release time of the job to add.
@@ -123,6 +406,7 @@ class FixedLengthJobPool(AbstractJobPool):
             release_time=release_time,
             deadline=deadline,
             duration=self.duration,
+            job_id=self.jobs.create_id(),
         )
         self.jobs.add(job)
         return job.id
@@ -150,3 +434,390 @@ class UnitJobPool(FixedLengthJobPool):
         Initialize the class with parameters.
         """
         super(UnitJobPool, self).__init__(duration=1)
+
+
+class _JobViews(AbstractSequence):
+
+    def __init__(self, job_pool: 'AbstractColumnarJobPool') -> None:
+        self._job_pool = job_pool
+
+    def __len__(self) -> int:
+        return self._job_pool.size
+
+    def __getitem__(self, position: Union[int, slice]) -> Union[AbstractJob, List[AbstractJob]]:
+        if isinstance(position, slice):
+            return [self._job_pool.get_job(i) for i in range(*position.indices(len(self)))]
+
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("Job position out of range")
+
+        return self._job_pool.get_job(position)
+
+
+class _ColumnarJobSet(JobSet):
+    """
+    Live view of the jobs of a columnar job pool, the changes of the set are applied to the arrays of the job pool.
+    """
+
+    def __init__(self, job_pool: 'AbstractColumnarJobPool') -> None:
+        self._job_pool = job_pool
+
+    def __contains__(self, job: Any) -> bool:
+        position = self._job_pool._get_positions().get(getattr(job, 'id', None))
+        return position is not None and self._job_pool.get_job(position) == job
+
+    def __iter__(self) -> Iterator[AbstractJob]:
+        return (self._job_pool.get_job(i) for i in range(self._job_pool.size))
+
+    def __len__(self) -> int:
+        return self._job_pool.size
+
+    def __str__(self) -> str:
+        return "JobSet({0})".format(list(self))
+
+    __repr__ = __str__
+
+    def add(self, job: AbstractJob) -> None:
+        if job in self:
+            return
+        if job.id in self._job_pool._get_positions():
+            raise ValueError("Job with the ID {0} is already present".format(job.id))
+
+        columns = JobColumns.from_jobs([job])
+
+        self._job_pool._append(
+            columns.durations,
+            columns.window_starts,
+            columns.window_ends,
+            columns.window_counts,
+            columns.ids,
+        )
+        self._job_pool._views[-1] = job
+
+    def create_id(self) -> int:
+        job_id = self._job_pool._next_id
+        self._job_pool._next_id += 1
+        return job_id
+
+    def discard(self, job: AbstractJob) -> None:
+        if job in self:
+            self._job_pool.remove_job(job.id)
+
+    def find(self, job_id: int) -> Optional[AbstractJob]:
+        position = self._job_pool._get_positions().get(job_id)
+        return self._job_pool.get_job(position) if position is not None else None
+
+    def get_job(self, position: int) -> AbstractJob:
+        return self._job_pool.get_job(position)
+
+    def get_position(self, job: AbstractJob) -> int:
+        return self._job_pool.get_position(job)
+
+
+class AbstractColumnarJobPool(AbstractJobPool):
+    """
+    An abstract job pool that stores the jobs in NumPy arrays instead of job objects: the durations and the execution
+    windows in CSR form, see JobColumns. The jobs are added in bulk from arrays and referred to by their IDs, which are
+    returned by add_job and add_jobs, or by their positions in the job pool. The schedulers consume the arrays directly,
+    while the job objects are created lazily as read-only views, either one by one with get_job or all at once through
+    the field jobs, and are cached so that the same object is returned for a position every time. Changing a view does
+    not change the arrays, while the set returned by the field jobs is a live view of the job pool whose add and discard
+    append the columns of the job and call remove_job respectively. Assigning job objects to the field jobs replaces the
+    content of the job pool. The IDs of the jobs are stored in an array as well and are assigned from a counter of the
+    job pool.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the class with parameters.
+        """
+        super(AbstractColumnarJobPool, self).__init__()
+
+    def _reset(self) -> None:
+        self._ids = []
+        self._durations = []
+        self._window_starts = []
+        self._window_ends = []
+        self._window_counts = []
+        self._size = 0
+        self._columns = None
+        self._views = []
+        self._positions = None
+        self._next_id = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def jobs(self) -> JobSet:
+        return _ColumnarJobSet(self)
+
+    @jobs.setter
+    def jobs(self, jobs: Iterable[AbstractJob]) -> None:
+        self._reset()
+
+        jobs = list(jobs)
+        columns = JobColumns.from_jobs(jobs)
+
+        self._append(
+            columns.durations,
+            columns.window_starts,
+            columns.window_ends,
+            columns.window_counts,
+            columns.ids,
+        )
+        self._views = jobs
+
+    def _load_columns(self, columns: JobColumns) -> None:
+        self._reset()
+        self._append(
+            columns.durations,
+            columns.window_starts,
+            columns.window_ends,
+            columns.window_counts,
+            columns.ids,
+        )
+
+    def add_columns(
+            self,
+            window_starts: Sequence[int],
+            window_ends: Sequence[int],
+            window_counts: Sequence[int],
+            durations: Sequence[int],
+    ) -> None:
+        """
+        Add jobs given in the columnar form, see JobColumns, to the job pool.
+        :param window_starts: Starts of the execution windows of the jobs to add, ordered by jobs.
+        :param window_ends: Ends of the execution windows of the jobs to add, ordered by jobs.
+        :param window_counts: Numbers of the execution windows of the jobs to add.
+        :param durations: Durations of the jobs to add.
+        """
+        self._append(durations, window_starts, window_ends, window_counts)
+
+    def _append(
+            self,
+            durations: Sequence[int],
+            window_starts: Sequence[int],
+            window_ends: Sequence[int],
+            window_counts: Sequence[int],
+            ids: Optional[Sequence[int]] = None,
+    ) -> ndarray:
+        durations, window_starts, window_ends, window_counts = _check_columns(
+            durations,
+            window_starts,
+            window_ends,
+            window_counts,
+        )
+
+        if ids is None:
+            ids = arange(self._next_id, self._next_id + len(durations), dtype=int64)
+        else:
+            ids = asarray(ids, dtype=int64).reshape(-1)
+
+            if len(ids) != len(durations):
+                raise ValueError("Number of IDs does not match the number of jobs")
+
+        self._ids.append(ids)
+        self._durations.append(durations)
+        self._window_starts.append(window_starts)
+        self._window_ends.append(window_ends)
+        self._window_counts.append(window_counts)
+        self._size += len(durations)
+        self._columns = None
+        self._views.extend([None] * len(durations))
+        self._positions = None
+
+        if len(ids) != 0:
+            self._next_id = max(self._next_id, int(ids.max()) + 1)
+
+        return ids
+
+    def get_columns(self) -> JobColumns:
+        """
+        Get the columnar representation of the jobs of the job pool, the jobs are ordered by their positions.
+        :return: Columns of the jobs.
+        """
+        if self._columns is None:
+            for chunks in [self._ids, self._durations, self._window_starts, self._window_ends, self._window_counts]:
+                if len(chunks) != 1:
+                    chunks[:] = [concatenate(chunks) if len(chunks) != 0 else zeros(0, dtype=int64)]
+
+            self._columns = JobColumns(
+                _JobViews(self),
+                self._durations[0],
+                self._window_starts[0],
+                self._window_ends[0],
+                concatenate([[0], cumsum(self._window_counts[0])]),
+                self._ids[0],
+            )
+
+        return self._columns
+
+    def _get_positions(self) -> Dict[int, int]:
+        if self._positions is None:
+            self._positions = {job_id: i for i, job_id in enumerate(self.get_columns().ids.tolist())}
+        return self._positions
+
+    def get_job(self, position: int) -> AbstractJob:
+        """
+        Get the view of a job.
+        :param position: Position of the job in the job pool.
+        :return: Job at the position.
+        """
+        if self._views[position] is None:
+            self._views[position] = self._create_job(self.get_columns(), position)
+        return self._views[position]
+
+    def get_position(self, job: AbstractJob) -> int:
+        """
+        Get the position of a job in the job pool, raises KeyError if the job is not in the job pool.
+        :param job: Job to find.
+        :return: Position of the job.
+        """
+        position = self._get_positions().get(job.id)
+
+        if position is None or self.get_job(position) != job:
+            raise KeyError(job.id)
+
+        return position
+
+    def remove_job(self, job_id: int) -> None:
+        """
+        Remove a job from the job pool, the positions of the jobs added after it are shifted.
+        :param job_id: The ID of the job to remove.
+        """
+        position = self._get_positions().get(job_id)
+
+        if position is None:
+            raise KeyError(job_id)
+
+        columns = self.get_columns()
+        lo, hi = columns.window_indptr[position:position + 2].tolist()
+
+        self._ids = [delete(columns.ids, position)]
+        self._durations = [delete(columns.durations, position)]
+        self._window_starts = [delete(columns.window_starts, arange(lo, hi))]
+        self._window_ends = [delete(columns.window_ends, arange(lo, hi))]
+        self._window_counts = [delete(columns.window_counts, position)]
+        self._size -= 1
+        self._columns = None
+        self._positions = None
+
+        del self._views[position]
+
+
+class ColumnarJobPoolMI(AbstractColumnarJobPool):
+    """
+    Columnar job pool of jobs with multiple execution windows. MI stands for multiple intervals.
+    """
+
+    def add_job(self, availability_intervals: List[Tuple[int, int]], duration: int) -> int:
+        """
+        Add a job to the job pool.
+        :param availability_intervals: Execution windows of the job to add.
+        :param duration: Duration of the job to add.
+        :return: The ID of the job.
+        """
+        return int(self._append(
+            [duration],
+            [start for start, _ in availability_intervals],
+            [end for _, end in availability_intervals],
+            [len(availability_intervals)],
+        )[0])
+
+    def add_jobs(
+            self,
+            window_starts: Sequence[int],
+            window_ends: Sequence[int],
+            window_counts: Sequence[int],
+            durations: Sequence[int],
+    ) -> ndarray:
+        """
+        Add jobs to the job pool.
+        :param window_starts: Starts of the execution windows of the jobs to add, ordered by jobs.
+        :param window_ends: Ends of the execution windows of the jobs to add, ordered by jobs.
+        :param window_counts: Numbers of the execution windows of the jobs to add.
+        :param durations: Durations of the jobs to add.
+        :return: The IDs of the jobs.
+        """
+        return self._append(durations, window_starts, window_ends, window_counts)
+
+
+class ColumnarJobPool(AbstractColumnarJobPool):
+    """
+    Columnar job pool of jobs with a single execution window.
+    """
+
+    def _create_job(self, columns: JobColumns, position: int) -> Job:
+        return _create_single_window_job(columns, position)
+
+    def add_job(self, release_time: int, deadline: int, duration: int) -> int:
+        """
+        Add a job to the job pool.
+        :param release_time: Release time of the job to add.
+        :param deadline: Deadline of the job to add.
+        :param duration: Duration of the job to add.
+        :return: The ID of the job.
+        """
+        return int(self._append([duration], [release_time], [deadline], [1])[0])
+
+    def add_jobs(self, release_times: Sequence[int], deadlines: Sequence[int], durations: Sequence[int]) -> ndarray:
+        """
+        Add jobs to the job pool.
+        :param release_times: Release times of the jobs to add.
+        :param deadlines: Deadlines of the jobs to add.
+        :param durations: Durations of the jobs to add.
+        :return: The IDs of the jobs.
+        """
+        return self._append(durations, release_times, deadlines, ones(len(durations), dtype=int64))
+
+
+class ColumnarFixedLengthJobPool(ColumnarJobPool):
+    """
+    Columnar job pool of jobs with fixed lengths and a single execution window. Used for batch scheduling.
+    """
+
+    def __init__(self, duration: int) -> None:
+        """
+        Initialize the class with parameters.
+        :param duration: Predefined duration of the jobs.
+        """
+        super(ColumnarFixedLengthJobPool, self).__init__()
+        self.duration = duration
+
+    def add_job(self, release_time: int, deadline: int) -> int:
+        """
+        Add a job to the job pool.
+        :param release_time: Release time of the job to add.
+        :param deadline: Deadline of the job to add.
+        :return: The ID of the job.
+        """
+        return super(ColumnarFixedLengthJobPool, self).add_job(release_time, deadline, self.duration)
+
+    def add_jobs(self, release_times: Sequence[int], deadlines: Sequence[int]) -> ndarray:
+        """
+        Add jobs to the job pool.
+        :param release_times: Release times of the jobs to add.
+        :param deadlines: Deadlines of the jobs to add.
+        :return: The IDs of the jobs.
+        """
+        return super(ColumnarFixedLengthJobPool, self).add_jobs(
+            release_times,
+            deadlines,
+            [self.duration] * len(release_times),
+        )
+
+
+class ColumnarUnitJobPool(ColumnarFixedLengthJobPool):
+    """
+    Columnar job pool with jobs having unit length and a single execution window.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the class with parameters.
+        """
+        super(ColumnarUnitJobPool, self).__init__(duration=1)
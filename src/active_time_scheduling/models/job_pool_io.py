@@ -0,0 +1,436 @@
+# -*- coding: utf-8 -*-
+import os
+import zipfile
+from contextlib import nullcontext
+from itertools import islice
+from numpy import (
+    arange,
+    concatenate,
+    cumsum,
+    diff,
+    dtype,
+    flatnonzero,
+    frombuffer,
+    full,
+    int64,
+    issubdtype,
+    integer,
+    load,
+    loadtxt,
+    ndarray,
+    ones,
+    repeat,
+    savetxt,
+    savez,
+    searchsorted,
+    stack,
+)
+from numpy.lib import format as npy_format
+from typing import IO, Any, ContextManager, Dict, Iterator, List, Union
+
+from . import (
+    AbstractJobPool,
+    ColumnarJobPoolMI,
+    EncodedSchedule,
+    FixedLengthJobPoolMI,
+    JobColumns,
+    JobPoolMI,
+    Schedule,
+)
+
+File = Union[str, os.PathLike, IO[Any]]
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_MULTIPLE_WINDOW_JOB_POOLS = (JobPoolMI, FixedLengthJobPoolMI, ColumnarJobPoolMI)
+
+
+def get_job_pool_fields(job_pool: AbstractJobPool) -> List[str]:
+    """
+    Get the columns of the files that describe the jobs of a job pool. Every row describes a job with a single
+    execution window: release_time, deadline and duration, or an execution window of a job with multiple windows:
+    job, window_start, window_end and duration. The rows of the same job are consecutive and have the same job number
+    and duration, the job numbers only need to differ between the neighbouring jobs. The duration is omitted for the
+    fixed length job pools.
+    :param job_pool: Job pool to describe.
+    :return: Names of the columns.
+    """
+    if isinstance(job_pool, _MULTIPLE_WINDOW_JOB_POOLS):
+        fields = ['job', 'window_start', 'window_end']
+    else:
+        fields = ['release_time', 'deadline']
+
+    if getattr(job_pool, 'duration', None) is None:
+        fields.append('duration')
+
+    return fields
+
+
+def _open(file: File, mode: str) -> ContextManager[IO[Any]]:
+    if hasattr(file, 'read') or hasattr(file, 'write'):
+        return nullcontext(file)
+    return open(file, mode, newline='' if 'b' not in mode else None)
+
+
+def _add_chunks(job_pool: AbstractJobPool, chunks: Iterator[Dict[str, ndarray]]) -> AbstractJobPool:
+    fixed_duration = getattr(job_pool, 'duration', None)
+    pending = None
+
+    for chunk in chunks:
+        if 'job' not in chunk:
+            size = len(chunk['release_time'])
+            durations = chunk['duration'] if fixed_duration is None else full(size, fixed_duration, dtype=int64)
+            job_pool.add_columns(chunk['release_time'], chunk['deadline'], ones(size, dtype=int64), durations)
+            continue
+
+        if pending is not None:
+            chunk = {name: concatenate([pending[name], values]) for name, values in chunk.items()}
+
+        boundaries = flatnonzero(chunk['job'][1:] != chunk['job'][:-1]) + 1
+        split = int(boundaries[-1]) if len(boundaries) != 0 else 0
+
+        _add_windows(job_pool, {name: values[:split] for name, values in chunk.items()}, boundaries[:-1])
+        pending = {name: values[split:] for name, values in chunk.items()}
+
+    if pending is not None:
+        boundaries = flatnonzero(pending['job'][1:] != pending['job'][:-1]) + 1
+        _add_windows(job_pool, pending, boundaries)
+
+    return job_pool
+
+
+def _add_windows(job_pool: AbstractJobPool, rows: Dict[str, ndarray], boundaries: ndarray) -> None:
+    if len(rows['job']) == 0:
+        return
+
+    starts = concatenate([[0], boundaries])
+    counts = diff(concatenate([starts, [len(rows['job'])]]))
+    fixed_duration = getattr(job_pool, 'duration', None)
+
+    if fixed_duration is None:
+        durations = rows['duration'][starts]
+
+        if (rows['duration'] != repeat(durations, counts)).any():
+            raise ValueError("Rows of a job have different durations")
+    else:
+        durations = full(len(counts), fixed_duration, dtype=int64)
+
+    job_pool.add_columns(rows['window_start'], rows['window_end'], counts, durations)
+
+
+def _iterate_rows(columns: JobColumns, fields: List[str], chunk_size: int) -> Iterator[Dict[str, ndarray]]:
+    for lo in range(0, len(columns.window_starts), chunk_size):
+        hi = min(lo + chunk_size, len(columns.window_starts))
+        jobs = searchsorted(columns.window_indptr, arange(lo, hi), side='right') - 1
+        rows = {}
+
+        for name in fields:
+            if name == 'job':
+                rows[name] = jobs
+            elif name in ['window_start', 'release_time']:
+                rows[name] = columns.window_starts[lo:hi]
+            elif name in ['window_end', 'deadline']:
+                rows[name] = columns.window_ends[lo:hi]
+            else:
+                rows[name] = columns.durations[jobs]
+
+        yield rows
+
+
+def _get_job_columns(job_pool: AbstractJobPool, fields: List[str]) -> JobColumns:
+    columns = job_pool.get_columns()
+
+    if 'job' not in fields and columns.has_single_windows is False:
+        raise ValueError("Jobs with multiple execution windows can not be written as single window jobs")
+
+    return columns
+
+
+def read_job_pool_csv(file: File, job_pool: AbstractJobPool, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AbstractJobPool:
+    """
+    Read jobs from a CSV file into a job pool. The file starts with a header naming the columns given by
+    get_job_pool_fields and is parsed in chunks of rows, so the memory used does not depend on the size of the file.
+    :param file: Path to the file or a text file object.
+    :param job_pool: Job pool to add the jobs to, a columnar job pool avoids creating objects for the jobs.
+    :param chunk_size: Number of rows parsed at once.
+    :return: The job pool.
+    """
+    fields = get_job_pool_fields(job_pool)
+
+    def iterate_chunks(stream: IO[str]) -> Iterator[Dict[str, ndarray]]:
+        while True:
+            lines = [line for line in islice(stream, chunk_size) if line.strip() != '']
+
+            if len(lines) == 0:
+                return
+
+            values = loadtxt(lines, delimiter=',', dtype=int64, ndmin=2)
+
+            if values.shape[1] != len(fields):
+                raise ValueError("Expected {0} columns, got {1}".format(len(fields), values.shape[1]))
+
+            yield {name: values[:, i] for i, name in enumerate(fields)}
+
+    with _open(file, 'r') as stream:
+        header = [name.strip() for name in stream.readline().split(',')]
+
+        if header != fields:
+            raise ValueError("Expected the columns {0}, got {1}".format(fields, header))
+
+        return _add_chunks(job_pool, iterate_chunks(stream))
+
+
+def write_job_pool_csv(job_pool: AbstractJobPool, file: File, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """
+    Write the jobs of a job pool into a CSV file readable by read_job_pool_csv, the jobs are numbered by their
+    positions in the job pool.
+    :param job_pool: Job pool to write.
+    :param file: Path to the file or a text file object.
+    :param chunk_size: Number of rows formatted at once.
+    """
+    fields = get_job_pool_fields(job_pool)
+    columns = _get_job_columns(job_pool, fields)
+
+    with _open(file, 'w') as stream:
+        stream.write(','.join(fields) + '\n')
+
+        for rows in _iterate_rows(columns, fields, chunk_size):
+            savetxt(stream, stack([rows[name] for name in fields], axis=1), fmt='%d', delimiter=',')
+
+
+def _read_npy_header(stream: IO[bytes]) -> Any:
+    version = npy_format.read_magic(stream)
+
+    if version == (1, 0):
+        return npy_format.read_array_header_1_0(stream)
+    return npy_format.read_array_header_2_0(stream)
+
+
+def read_job_pool_npz(file: File, job_pool: AbstractJobPool, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AbstractJobPool:
+    """
+    Read jobs from an NPZ archive into a job pool. The archive contains a one-dimensional integer array for every
+    column given by get_job_pool_fields, all of the same length. The arrays are read from the archive in chunks, so
+    the memory used does not depend on the size of the archive, also if it is compressed.
+    :param file: Path to the archive or a binary file object.
+    :param job_pool: Job pool to add the jobs to, a columnar job pool avoids creating objects for the jobs.
+    :param chunk_size: Number of rows read at once.
+    :return: The job pool.
+    """
+    fields = get_job_pool_fields(job_pool)
+
+    with zipfile.ZipFile(file) as archive:
+        streams = {name: archive.open(name + '.npy') for name in fields}
+
+        try:
+            dtypes = {}
+            lengths = set()
+
+            for name, stream in streams.items():
+                shape, _, values_dtype = _read_npy_header(stream)
+
+                if len(shape) != 1 or not issubdtype(values_dtype, integer):
+                    raise ValueError("Array {0} is not a one-dimensional integer array".format(name))
+
+                dtypes[name] = values_dtype
+                lengths.add(shape[0])
+
+            if len(lengths) > 1:
+                raise ValueError("Arrays have different lengths")
+
+            length = lengths.pop() if len(lengths) != 0 else 0
+
+            def iterate_chunks() -> Iterator[Dict[str, ndarray]]:
+                for lo in range(0, length, chunk_size):
+                    count = min(chunk_size, length - lo)
+                    yield {
+                        name: frombuffer(stream.read(count * dtypes[name].itemsize), dtype=dtypes[name]).astype(int64)
+                        for name, stream in streams.items()
+                    }
+
+            return _add_chunks(job_pool, iterate_chunks())
+        finally:
+            for stream in streams.values():
+                stream.close()
+
+
+def write_job_pool_npz(
+        job_pool: AbstractJobPool,
+        file: File,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        compressed: bool = False,
+) -> None:
+    """
+    Write the jobs of a job pool into an NPZ archive readable by read_job_pool_npz and numpy.load, the jobs are
+    numbered by their positions in the job pool. The arrays are written in chunks.
+    :param job_pool: Job pool to write.
+    :param file: Path to the archive or a binary file object.
+    :param chunk_size: Number of rows written at once.
+    :param compressed: Whether to compress the archive.
+    """
+    fields = get_job_pool_fields(job_pool)
+    columns = _get_job_columns(job_pool, fields)
+    length = len(columns.window_starts)
+    compression = zipfile.ZIP_DEFLATED if compressed is True else zipfile.ZIP_STORED
+
+    with zipfile.ZipFile(file, 'w', compression=compression, allowZip64=True) as archive:
+        for name in fields:
+            with archive.open(name + '.npy', 'w', force_zip64=True) as stream:
+                npy_format.write_array_header_2_0(stream, {
+                    'descr': npy_format.dtype_to_descr(dtype(int64)),
+                    'fortran_order': False,
+                    'shape': (length,),
+                })
+
+                for rows in _iterate_rows(columns, [name], chunk_size):
+                    stream.write(rows[name].astype(int64).tobytes())
+
+
+def get_job_pool_dtype(job_pool: AbstractJobPool) -> dtype:
+    """
+    Get the record type of the binary files that describe the jobs of a job pool, a record of little-endian 64-bit
+    integers for the columns given by get_job_pool_fields.
+    :param job_pool: Job pool to describe.
+    :return: Record type.
+    """
+    return dtype([(name, '<i8') for name in get_job_pool_fields(job_pool)])
+
+
+def read_job_pool_binary(
+        path: Union[str, os.PathLike],
+        job_pool: AbstractJobPool,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AbstractJobPool:
+    """
+    Read jobs from a binary file into a job pool. The file is an NPY file with a one-dimensional array of the records
+    given by get_job_pool_dtype, which is a fixed-width layout after the header. The file is memory-mapped and read in
+    chunks, so only the pages being read are loaded.
+    :param path: Path to the file.
+    :param job_pool: Job pool to add the jobs to, a columnar job pool avoids creating objects for the jobs.
+    :param chunk_size: Number of records read at once.
+    :return: The job pool.
+    """
+    records = load(path, mmap_mode='r')
+    fields = get_job_pool_fields(job_pool)
+
+    if records.ndim != 1 or records.dtype.names is None or list(records.dtype.names) != fields:
+        raise ValueError("Expected a one-dimensional array of records with the fields {0}".format(fields))
+
+    def iterate_chunks() -> Iterator[Dict[str, ndarray]]:
+        for lo in range(0, len(records), chunk_size):
+            chunk = records[lo:lo + chunk_size]
+            yield {name: chunk[name].astype(int64) for name in fields}
+
+    return _add_chunks(job_pool, iterate_chunks())
+
+
+def write_job_pool_binary(
+        job_pool: AbstractJobPool,
+        path: Union[str, os.PathLike],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """
+    Write the jobs of a job pool into a binary file readable by read_job_pool_binary, the jobs are numbered by their
+    positions in the job pool. The file is memory-mapped and written in chunks.
+    :param job_pool: Job pool to write.
+    :param path: Path to the file.
+    :param chunk_size: Number of records written at once.
+    """
+    fields = get_job_pool_fields(job_pool)
+    columns = _get_job_columns(job_pool, fields)
+    records = npy_format.open_memmap(
+        path,
+        mode='w+',
+        dtype=get_job_pool_dtype(job_pool),
+        shape=(len(columns.window_starts),),
+    )
+
+    for lo, rows in zip(range(0, len(records), chunk_size), _iterate_rows(columns, fields, chunk_size)):
+        for name in fields:
+            records[name][lo:lo + len(rows[name])] = rows[name]
+
+    records.flush()
+
+
+def _encode_schedule(schedule: Schedule, job_pool: AbstractJobPool) -> EncodedSchedule:
+    ids = job_pool.get_columns().ids.tolist()
+    return EncodedSchedule.encode(schedule, dict(zip(ids, range(len(ids)))))
+
+
+def write_schedule_csv(
+        schedule: Schedule,
+        job_pool: AbstractJobPool,
+        file: File,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """
+    Write the execution intervals of a schedule into a CSV file with the columns job, start and end. The jobs are
+    numbered by their positions in the job pool, as in the files written by the job pool writers, and every job of a
+    batch gets a row with the interval of the batch. The file contains only the header if no feasible schedule was
+    found.
+    :param schedule: Schedule to write.
+    :param job_pool: Job pool the schedule was computed for.
+    :param file: Path to the file or a text file object.
+    :param chunk_size: Number of rows formatted at once.
+    """
+    encoded_schedule = _encode_schedule(schedule, job_pool)
+
+    job_counts = diff(encoded_schedule.job_indptr)
+    interval_counts = diff(encoded_schedule.interval_indptr)
+    row_counts = job_counts * interval_counts
+    row_indptr = concatenate([[0], cumsum(row_counts)])
+    fmt = '%d' if issubdtype(encoded_schedule.intervals.dtype, integer) else '%.17g'
+
+    with _open(file, 'w') as stream:
+        stream.write('job,start,end\n')
+
+        for lo in range(0, int(row_indptr[-1]), chunk_size):
+            rows = arange(lo, min(lo + chunk_size, int(row_indptr[-1])))
+            schedules = searchsorted(row_indptr, rows, side='right') - 1
+            offsets = rows - row_indptr[schedules]
+            jobs = encoded_schedule.job_positions[
+                encoded_schedule.job_indptr[schedules] + offsets // interval_counts[schedules]
+            ]
+            intervals = encoded_schedule.intervals[
+                encoded_schedule.interval_indptr[schedules] + offsets % interval_counts[schedules]
+            ]
+
+            savetxt(
+                stream,
+                stack([jobs, intervals[:, 0], intervals[:, 1]], axis=1),
+                fmt=['%d', fmt, fmt],
+                delimiter=',',
+            )
+
+
+def write_schedule_npz(schedule: Schedule, job_pool: AbstractJobPool, file: File) -> None:
+    """
+    Write a schedule into an NPZ archive with the arrays of EncodedSchedule, the jobs are referred to by their
+    positions in the job pool.
+    :param schedule: Schedule to write.
+    :param job_pool: Job pool the schedule was computed for.
+    :param file: Path to the archive or a binary file object.
+    """
+    encoded_schedule = _encode_schedule(schedule, job_pool)
+
+    savez(
+        file,
+        all_jobs_scheduled=encoded_schedule.all_jobs_scheduled,
+        active_time_intervals=encoded_schedule.active_time_intervals,
+        kinds=encoded_schedule.kinds,
+        job_indptr=encoded_schedule.job_indptr,
+        job_positions=encoded_schedule.job_positions,
+        interval_indptr=encoded_schedule.interval_indptr,
+        intervals=encoded_schedule.intervals,
+    )
+
+
+def write_schedule_binary(schedule: Schedule, job_pool: AbstractJobPool, file: File) -> None:
+    """
+    Write a schedule in the binary form of EncodedSchedule, the jobs are referred to by their positions in the job
+    pool. The file can be memory-mapped and read back with EncodedSchedule.from_buffer.
+    :param schedule: Schedule to write.
+    :param job_pool: Job pool the schedule was computed for.
+    :param file: Path to the file or a binary file object.
+    """
+    with _open(file, 'wb') as stream:
+        stream.write(_encode_schedule(schedule, job_pool).to_bytes())
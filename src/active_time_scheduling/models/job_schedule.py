@@ -9,6 +9,7 @@ class AbstractJobSchedule(object):
     """
     An abstract entity representing the resulting job schedule.
     """
+    __slots__ = ('job', 'execution_intervals')
 
     def __init__(self, job: AbstractJob, execution_intervals: List[TimeInterval]) -> None:
         """
@@ -28,6 +29,7 @@ class JobScheduleMI(AbstractJobSchedule):
     """
     Job schedule that might have more than one execution window. MI stands for multiple intervals.
     """
+    __slots__ = ()
 
     def __str__(self) -> str:
         return "JobScheduleMI(job={0}, execution_intervals={1})".format(
@@ -43,6 +45,7 @@ class JobSchedule(JobScheduleMI):
     """
     Job schedule with a single execution window.
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -64,7 +67,7 @@ class JobSchedule(JobScheduleMI):
 
     @execution_start.setter
     def execution_start(self, execution_start: int) -> None:
-        self.execution_intervals[0].start = execution_start
+        self.execution_intervals[0] = TimeInterval(execution_start, self.execution_intervals[0].end)
 
     @property
     def execution_end(self) -> int:
@@ -72,7 +75,7 @@ class JobSchedule(JobScheduleMI):
 
     @execution_end.setter
     def execution_end(self, execution_end: int) -> None:
-        self.execution_intervals[0].end = execution_end
+        self.execution_intervals[0] = TimeInterval(self.execution_intervals[0].start, execution_end)
 
     def __str__(self) -> str:
         return "JobSchedule(job={0}, execution_start={1}, execution_end={2})".format(
@@ -98,6 +101,7 @@ class BatchJobSchedule(object):
     """
     Schedule of a single batch.
     """
+    __slots__ = ('jobs', 'execution_start', 'execution_end')
 
     def __init__(self, jobs: Set[BatchJob], execution_start: int, execution_end: int) -> None:
         """
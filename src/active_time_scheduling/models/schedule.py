@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from typing import List, Optional, Union
+from typing import Any, List, Optional, Tuple, Union
 
 from . import AbstractJobSchedule, BatchJobSchedule, TimeInterval
 
@@ -12,6 +12,8 @@ class Schedule(object):
        variable all_jobs_scheduled is set to False.
     3. Field job_schedules containing the list of individual job (batch) schedules. This field is allowed to be None if
        the variable all_jobs_scheduled is set to False.
+    The schedule is pickled in the compact form of EncodedSchedule together with the columns of the jobs it refers to,
+    the jobs are recreated with the same IDs on unpickling.
     """
 
     def __init__(
@@ -33,3 +35,7 @@ class Schedule(object):
 
     __repr__ = __str__
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        from .encoded_schedule import _reduce_schedule
+        return _reduce_schedule(self)
+
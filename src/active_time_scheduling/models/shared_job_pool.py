@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+from multiprocessing.shared_memory import SharedMemory
+from numpy import int64, ndarray
+from typing import Any, Dict, List, Optional
+
+from . import AbstractJobPool
+from .job_pool import _restore_job_pool
+
+
+class SharedJobPool(object):
+    """
+    Handle to the columns of a job pool copied into a block of shared memory, see JobColumns. The handle is pickled as
+    the name of the block and the lengths of the columns only, so it is cheap to pass to worker processes, which attach
+    to the block to get a copy of the job pool. Columnar job pools attached to the block use the shared memory as their
+    arrays without copying it, job pools of job objects create their jobs from it. The arrays are never changed in
+    place, so the job pools attached to the block stay independent. The block is freed with unlink by the process that
+    created it, once the worker processes are done. The worker processes are expected to be started by multiprocessing
+    from the creating process, so they share its resource tracker.
+    """
+
+    def __init__(self, job_pool: AbstractJobPool) -> None:
+        """
+        Initialize the class with parameters, copies the columns of the job pool into a new block of shared memory.
+        :param job_pool: Job pool to share.
+        """
+        columns = job_pool.get_columns()
+        arrays = [columns.ids, columns.durations, columns.window_starts, columns.window_ends, columns.window_indptr]
+
+        self.job_pool_class = job_pool.__class__
+        self.state = {key: value for key, value in vars(job_pool).items() if not key.startswith('_')}
+        self.lengths = [len(values) for values in arrays]
+        self._shared_memory: Optional[SharedMemory] = SharedMemory(
+            create=True,
+            size=max(sum(self.lengths) * int64().itemsize, 1),
+        )
+        self.name = self._shared_memory.name
+
+        for source, target in zip(arrays, self._get_arrays(self._shared_memory)):
+            target[:] = source
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {key: value for key, value in vars(self).items() if key != '_shared_memory'}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._shared_memory = None
+
+    def _get_arrays(self, shared_memory: SharedMemory) -> List[ndarray]:
+        arrays = []
+        offset = 0
+
+        for length in self.lengths:
+            arrays.append(ndarray(length, dtype=int64, buffer=shared_memory.buf, offset=offset))
+            offset += length * int64().itemsize
+
+        return arrays
+
+    def attach(self) -> AbstractJobPool:
+        """
+        Attach to the block of shared memory. The block stays mapped while the returned job pool refers to it.
+        :return: Job pool with the shared columns.
+        """
+        shared_memory = SharedMemory(name=self.name)
+        arrays = self._get_arrays(shared_memory)
+
+        for values in arrays:
+            values.flags.writeable = False
+
+        job_pool = _restore_job_pool(self.job_pool_class, self.state, *arrays)
+        job_pool._shared_memory = shared_memory
+
+        return job_pool
+
+    def close(self) -> None:
+        """
+        Unmap the block of shared memory in the creating process, the job pools attached to it stay valid.
+        """
+        if self._shared_memory is not None:
+            self._shared_memory.close()
+            self._shared_memory = None
+
+    def unlink(self) -> None:
+        """
+        Free the block of shared memory, the job pools attached to it stay valid until they are deleted.
+        """
+        shared_memory = self._shared_memory if self._shared_memory is not None else SharedMemory(name=self.name)
+        shared_memory.unlink()
+
+        if self._shared_memory is None:
+            shared_memory.close()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+from numpy import arange, argsort, asarray, bincount, concatenate, cumsum, int64, ndarray, repeat, searchsorted
+from typing import Optional, Sequence, Tuple
+
+from . import JobColumns
+
+
+class TimeSlotIndex(object):
+    """
+    Inverted index from time slots to the jobs available at them. The index is built once for a fixed list of jobs and
+    stores the incidence in CSR form, so the jobs live at a time slot are obtained without scanning the whole job pool.
+    The index can be restricted to a sorted sequence of timestamps, in which case its size is proportional to the number
+    of (job, timestamp) pairs among the given timestamps rather than to the lengths of the execution windows. The index
+    is built from the columnar representation of the jobs, which stays available to the schedulers as the field columns.
+    """
+
+    def __init__(self, columns: JobColumns, timestamps: Optional[Sequence[int]] = None) -> None:
+        """
+        Initialize the class with parameters.
+        :param columns: Columnar representation of the jobs to index. Jobs are referred to by their position in it.
+        :param timestamps: Sorted timestamps to index, all timestamps covered by the jobs if not provided.
+        """
+        self.columns = columns
+        self.jobs = columns.jobs
+
+        starts, ends, window_jobs = columns.window_starts, columns.window_ends, columns.window_jobs
+
+        if timestamps is None:
+            timestamps = arange(starts.min(), ends.max() + 1) if len(starts) != 0 else []
+
+        self.timestamps = asarray(timestamps, dtype=int64)
+
+        lo = searchsorted(self.timestamps, starts, 'left')
+        hi = searchsorted(self.timestamps, ends, 'right')
+        counts = (hi - lo).clip(0)
+
+        slot_positions = arange(counts.sum()) - repeat(cumsum(counts) - counts, counts) + repeat(lo, counts)
+        order = argsort(slot_positions, kind='stable')
+
+        self._job_positions = repeat(window_jobs, counts)[order]
+        self._indptr = concatenate([[0], cumsum(bincount(slot_positions, minlength=len(self.timestamps)))])
+
+    @property
+    def size(self) -> int:
+        return len(self._job_positions)
+
+    def jobs_at(self, t: int) -> ndarray:
+        """
+        Get the jobs available at a time slot.
+        :param t: Time slot.
+        :return: Positions of the jobs available at the time slot.
+        """
+        i = searchsorted(self.timestamps, t)
+
+        if i == len(self.timestamps) or self.timestamps[i] != t:
+            return self._job_positions[:0]
+
+        return self._job_positions[self._indptr[i]:self._indptr[i + 1]]
+
+    def incidence(self) -> Tuple[ndarray, ndarray]:
+        """
+        Get the whole incidence ordered by time slots.
+        :return: Time slots and the positions of the jobs available at them.
+        """
+        return repeat(self.timestamps, self._indptr[1:] - self._indptr[:-1]), self._job_positions
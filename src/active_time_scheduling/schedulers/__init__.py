@@ -1,39 +1,69 @@
 # -*- coding: utf-8 -*-
 from .abstract_scheduler import AbstractScheduler
 from .batch_scheduler import BatchScheduler
+from .feasibility_oracle import AbstractFeasibilityOracle, EarliestDeadlineFirstOracle, FlowFeasibilityOracle
 from .greedy_scheduler import (
     AbstractGreedyScheduler,
+    FeasibilityMethod,
     FlowMethod,
+    GreedyLocalSearchScheduler,
     GreedyLowestDensityFirstScheduler,
     GreedyIntervalsScheduler,
     GreedyScheduler,
     MinFeasScheduler,
 )
 from .brute_force_scheduler import BruteForceScheduler
+from .cached_scheduler import (
+    AbstractScheduleCache,
+    CachedScheduler,
+    CacheStats,
+    DiskScheduleCache,
+    EncodedSchedule,
+    ScheduleCache,
+)
+from .decomposition_scheduler import DecompositionScheduler
 from .lazy_activation_scheduler import LazyActivationScheduler, LazyActivationSchedulerNLogN, LazyActivationSchedulerT
 from .linear_programming_scheduler import (
+    LinearProgrammingFormulation,
     LinearProgrammingMethod,
+    LinearProgrammingModel,
     LinearProgrammingScheduler,
     LinearProgrammingRoundedScheduler,
 )
 from .matching_scheduler import DegreeConstrainedSubgraphScheduler, MatchingScheduler
+from .mixed_integer_programming_scheduler import MixedIntegerProgrammingScheduler
 
 __all__ = [
+    'AbstractFeasibilityOracle',
     'AbstractGreedyScheduler',
+    'AbstractScheduleCache',
     'AbstractScheduler',
     'BatchScheduler',
     'BruteForceScheduler',
+    'CacheStats',
+    'CachedScheduler',
+    'DecompositionScheduler',
     'DegreeConstrainedSubgraphScheduler',
+    'DiskScheduleCache',
+    'EarliestDeadlineFirstOracle',
+    'EncodedSchedule',
+    'FeasibilityMethod',
+    'FlowFeasibilityOracle',
     'FlowMethod',
+    'GreedyLocalSearchScheduler',
     'GreedyLowestDensityFirstScheduler',
     'GreedyIntervalsScheduler',
     'GreedyScheduler',
     'LazyActivationScheduler',
     'LazyActivationSchedulerNLogN',
     'LazyActivationSchedulerT',
+    'LinearProgrammingFormulation',
     'LinearProgrammingMethod',
+    'LinearProgrammingModel',
     'LinearProgrammingScheduler',
     'LinearProgrammingRoundedScheduler',
     'MatchingScheduler',
     'MinFeasScheduler',
+    'MixedIntegerProgrammingScheduler',
+    'ScheduleCache',
 ]
@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+import mmap
+import os
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from enum import Enum
+from hashlib import blake2b
+from numpy import generic, ndarray
+from tempfile import mkstemp
+from typing import Any, List, Optional, Tuple
+
+from ..models import (
+    AbstractJob,
+    AbstractJobPool,
+    EncodedSchedule,
+    Schedule,
+)
+from . import AbstractScheduler
+
+
+class CacheStats(object):
+    """
+    Snapshot of the counters of a schedule cache.
+    """
+
+    def __init__(self, hits: int, misses: int, evictions: int, entries: int, size: int, max_size: int) -> None:
+        """
+        Initialize the class with parameters.
+        :param hits: Number of lookups that found a schedule.
+        :param misses: Number of lookups that did not find a schedule.
+        :param evictions: Number of schedules evicted to stay within the size limit.
+        :param entries: Number of cached schedules.
+        :param size: Total size of the cached schedules in bytes.
+        :param max_size: Size limit of the cache in bytes.
+        """
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.entries = entries
+        self.size = size
+        self.max_size = max_size
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / (self.hits + self.misses) if self.hits + self.misses != 0 else 0.0
+
+    def __str__(self) -> str:
+        return "CacheStats(hits={0}, misses={1}, evictions={2}, entries={3}, size={4}, max_size={5})".format(
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.entries,
+            self.size,
+            self.max_size,
+        )
+
+    __repr__ = __str__
+
+
+class AbstractScheduleCache(ABC):
+    """
+    Abstract class for the caches of encoded schedules keyed by fingerprints used by CachedScheduler.
+    """
+
+    @property
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        pass
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[EncodedSchedule]:
+        """
+        Find a schedule and mark it as the most recently used one.
+        :param key: Fingerprint of the schedule.
+        :return: Cached schedule if present.
+        """
+        pass
+
+    @abstractmethod
+    def put(self, key: str, encoded_schedule: EncodedSchedule) -> None:
+        """
+        Store a schedule, schedules larger than the size limit are not stored.
+        :param key: Fingerprint of the schedule.
+        :param encoded_schedule: Schedule to store.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all schedules, the counters are kept.
+        """
+        pass
+
+
+class ScheduleCache(AbstractScheduleCache):
+    """
+    In-process LRU cache of encoded schedules keyed by fingerprints. The size of an entry is the size of its arrays,
+    and the least recently used entries are evicted once the total size exceeds the limit. The cache can be shared
+    between several CachedScheduler instances, since the fingerprints include the configuration of the scheduler.
+    """
+
+    def __init__(self, max_size: int = 64 * 1024 * 1024) -> None:
+        """
+        Initialize the class with parameters.
+        :param max_size: Size limit of the cache in bytes.
+        """
+        self.max_size = max_size
+
+        self._entries = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._size, self.max_size)
+
+    def get(self, key: str) -> Optional[EncodedSchedule]:
+        """
+        Find a schedule and mark it as the most recently used one.
+        :param key: Fingerprint of the schedule.
+        :return: Cached schedule if present.
+        """
+        encoded_schedule = self._entries.get(key)
+
+        if encoded_schedule is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return encoded_schedule
+
+    def put(self, key: str, encoded_schedule: EncodedSchedule) -> None:
+        """
+        Store a schedule, schedules larger than the size limit are not stored.
+        :param key: Fingerprint of the schedule.
+        :param encoded_schedule: Schedule to store.
+        """
+        if encoded_schedule.nbytes > self.max_size:
+            return
+
+        if key in self._entries:
+            self._size -= self._entries.pop(key).nbytes
+
+        self._entries[key] = encoded_schedule
+        self._size += encoded_schedule.nbytes
+
+        while self._size > self.max_size:
+            _, evicted_schedule = self._entries.popitem(last=False)
+            self._size -= evicted_schedule.nbytes
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all schedules, the counters are kept.
+        """
+        self._entries.clear()
+        self._size = 0
+
+
+class DiskScheduleCache(AbstractScheduleCache):
+    """
+    LRU cache of encoded schedules stored in a directory, one file per fingerprint, so the schedules survive restarts
+    and are shared between the processes on the host. The files hold the binary form of EncodedSchedule and are read
+    back through mmap, the arrays of the returned schedule are views of the mapped file. A file is written to a
+    temporary file in the same directory first and then atomically renamed, so concurrent readers see either the old
+    or the new complete file, and files that cannot be read are treated as misses. The modification time of a file is
+    updated on every hit and the oldest files are removed once the total size exceeds the limit. The total size is
+    kept as a running total that is updated by put and by the eviction, so the directory is only scanned when the total
+    goes over the limit. The running total of an instance does not include the files written by the other instances
+    since its last scan, so with several writers the directory can exceed the limit by their writes until one of the
+    instances scans it. Concurrent writers may both evict, so the cache can shrink below the limit. The counters of the
+    stats are kept per instance, while the number of entries and the size describe the directory.
+    """
+
+    SUFFIX = '.schedule'
+
+    def __init__(self, directory: str, max_size: int = 1024 * 1024 * 1024) -> None:
+        """
+        Initialize the class with parameters.
+        :param directory: Directory to store the schedules in, created if it does not exist.
+        :param max_size: Size limit of the cache in bytes.
+        """
+        self.directory = directory
+        self.max_size = max_size
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._size = None
+
+        os.makedirs(directory, exist_ok=True)
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def _list_entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+
+        with os.scandir(self.directory) as iterator:
+            for entry in iterator:
+                if entry.name.endswith(self.SUFFIX) is False:
+                    continue
+
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        return entries
+
+    @property
+    def stats(self) -> CacheStats:
+        entries = self._list_entries()
+
+        return CacheStats(
+            self._hits,
+            self._misses,
+            self._evictions,
+            len(entries),
+            sum(size for _, size, _ in entries),
+            self.max_size,
+        )
+
+    def get(self, key: str) -> Optional[EncodedSchedule]:
+        """
+        Find a schedule and mark it as the most recently used one.
+        :param key: Fingerprint of the schedule.
+        :return: Cached schedule if present.
+        """
+        path = self._get_path(key)
+
+        try:
+            with open(path, 'rb') as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            encoded_schedule = EncodedSchedule.from_buffer(buffer)
+            os.utime(path)
+        except (OSError, ValueError):
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return encoded_schedule
+
+    def put(self, key: str, encoded_schedule: EncodedSchedule) -> None:
+        """
+        Store a schedule, schedules larger than the size limit are not stored.
+        :param key: Fingerprint of the schedule.
+        :param encoded_schedule: Schedule to store.
+        """
+        data = encoded_schedule.to_bytes()
+
+        if len(data) > self.max_size:
+            return
+
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._list_entries())
+
+        path = self._get_path(key)
+
+        try:
+            replaced_size = os.stat(path).st_size
+        except OSError:
+            replaced_size = 0
+
+        descriptor, temporary_path = mkstemp(suffix='.tmp', dir=self.directory)
+
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(data)
+
+            os.replace(temporary_path, path)
+        except OSError:
+            # The file is mapped by a reader on a platform that does not allow replacing it, the schedule is dropped
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            return
+
+        self._size += len(data) - replaced_size
+
+        if self._size > self.max_size:
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(self._list_entries())
+        size = sum(size for _, size, _ in entries)
+
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+
+            try:
+                os.remove(path)
+                self._evictions += 1
+            except FileNotFoundError:
+                pass
+
+            size -= entry_size
+
+        self._size = size
+
+    def clear(self) -> None:
+        """
+        Remove all schedules, the counters are kept.
+        """
+        for _, _, path in self._list_entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+        self._size = 0
+
+
+def _canonicalize(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return _canonicalize(value.value)
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (generic, ndarray)):
+        return _canonicalize(value.tolist())
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonicalize(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((repr(key), _canonicalize(item)) for key, item in value.items()))
+    if callable(value) is False and hasattr(value, '__dict__'):
+        execution_options = getattr(type(value), 'EXECUTION_OPTIONS', ())
+
+        return type(value).__qualname__, tuple(sorted(
+            (key, _canonicalize(item))
+            for key, item in vars(value).items()
+            if not key.startswith('_') and key not in execution_options
+        ))
+
+    # The representation of functions and other objects contains their addresses, which differ between processes and
+    # may be reused by another object within a process
+    raise ValueError("Option {0!r} has no stable representation, pass configuration_key instead".format(value))
+
+
+class CachedScheduler(AbstractScheduler):
+    """
+    Wraps another scheduler and caches its schedules by the canonical fingerprint of the input. The fingerprint covers
+    the type and the parameters of the job pool, the execution windows and durations of the jobs in the canonical
+    order, the other arguments of the process function and the configuration of the wrapped scheduler, but not the
+    IDs of the jobs or the order of the set, so structurally identical job pools share the schedule. Jobs with the same
+    execution windows and duration are interchangeable, hence on a hit the cached job schedules are remapped onto the
+    jobs of the new job pool by their canonical positions. The configuration of the wrapped scheduler consists of its
+    public fields and is captured when the wrapper is created, so it must not be changed afterwards. The diagnostics
+    the schedulers report about their last call, e.g. saved_feasibility_checks or objective_gap, are kept in private
+    fields, so the fingerprint does not depend on whether the wrapped scheduler has already processed anything. The
+    fields listed in the EXECUTION_OPTIONS of a scheduler, e.g. the number of processes, change how the schedule is
+    computed but not the schedule itself, so they are left out as well. Options without a stable representation, e.g.
+    the weight function of GreedyLowestDensityFirstScheduler, are rejected unless a configuration key is given.
+    """
+
+    def __init__(
+            self,
+            scheduler: AbstractScheduler,
+            cache: Optional[AbstractScheduleCache] = None,
+            configuration_key: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the class with parameters.
+        :param scheduler: Scheduler whose schedules are cached.
+        :param cache: Cache to store the schedules in, a new cache with the default size limit if not provided.
+        :param configuration_key: Stable key that identifies the configuration of the wrapped scheduler and is used
+        instead of its fields, required if the scheduler has options such as functions. The key must differ between the
+        configurations that share a cache.
+        """
+        self.scheduler = scheduler
+        self.cache = cache if cache is not None else ScheduleCache()
+
+        if configuration_key is not None:
+            self._configuration = type(scheduler).__qualname__, configuration_key
+        else:
+            self._configuration = _canonicalize(scheduler)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    @staticmethod
+    def get_canonical_jobs(job_pool: AbstractJobPool) -> List[AbstractJob]:
+        """
+        Order the jobs of the job pool by their execution windows and durations.
+        :param job_pool: Job pool to order.
+        :return: Jobs in the canonical order.
+        """
+        return sorted(
+            job_pool.jobs,
+            key=lambda job: (
+                [(interval.start, interval.end) for interval in job.availability_intervals],
+                -1 if job.duration is None else job.duration,
+            ),
+        )
+
+    def fingerprint(self, job_pool: AbstractJobPool, *args, jobs: Optional[List[AbstractJob]] = None) -> str:
+        """
+        Compute the canonical fingerprint of the input.
+        :param job_pool: Job pool to process.
+        :param args: Other arguments of the process function of the wrapped scheduler, e.g. maximum concurrency.
+        :param jobs: Jobs of the job pool in the canonical order, computed if not provided.
+        :return: Hexadecimal digest.
+        """
+        if jobs is None:
+            jobs = self.get_canonical_jobs(job_pool)
+
+        digest = blake2b(digest_size=16)
+        digest.update(repr((
+            self._configuration,
+            _canonicalize(job_pool.__class__.__qualname__),
+            _canonicalize({
+                key: value for key, value in vars(job_pool).items() if key != 'jobs' and not key.startswith('_')
+            }),
+            _canonicalize(args),
+        )).encode())
+
+        for job in jobs:
+            digest.update(repr((
+                job.duration,
+                [(interval.start, interval.end) for interval in job.availability_intervals],
+            )).encode())
+
+        return digest.hexdigest()
+
+    def process(self, job_pool: AbstractJobPool, *args) -> Schedule:
+        """
+        Return the cached schedule for the input or compute it with the wrapped scheduler.
+        :param job_pool: Job pool of any type accepted by the wrapped scheduler.
+        :param args: Other arguments of the process function of the wrapped scheduler, e.g. maximum concurrency.
+        :return: Computed schedule.
+        """
+        jobs = self.get_canonical_jobs(job_pool)
+        key = self.fingerprint(job_pool, *args, jobs=jobs)
+
+        encoded_schedule = self.cache.get(key)
+
+        if encoded_schedule is not None:
+            return encoded_schedule.decode(jobs)
+
+        schedule = self.scheduler.process(job_pool, *args)
+        self.cache.put(key, EncodedSchedule.encode(schedule, {job.id: i for i, job in enumerate(jobs)}))
+
+        return schedule
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from numbers import Integral
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models import AbstractJob, AbstractJobPool, AbstractJobSchedule, BatchJobSchedule, Schedule, TimeInterval
+from . import AbstractScheduler
+from ..utils import DisjointSetNode
+
+
+def _process_component(scheduler: AbstractScheduler, job_pool: AbstractJobPool, args: Tuple[Any, ...]) -> Schedule:
+    return scheduler.process(job_pool, *args)
+
+
+class DecompositionScheduler(AbstractScheduler):
+    """
+    Wraps another scheduler and applies it to the independent components of the job pool separately. Two jobs belong to
+    the same component if their execution windows are connected by a chain of windows sharing time slots, so different
+    components never compete for the same time slot and the union of their schedules is a schedule for the whole pool.
+    The components are found with a sweep over the execution windows sorted by their start and are processed in a pool
+    of processes, hence the wrapped scheduler must be picklable. Since the components do not interact, exact schedulers
+    keep the optimal active time, approximation algorithms keep their guarantees and greedy schedulers with a
+    deterministic ordering close exactly the same time slots as on the whole pool.
+    """
+
+    # Options that change how the components are processed but not the resulting schedule
+    EXECUTION_OPTIONS = ('max_workers',)
+
+    def __init__(self, scheduler: AbstractScheduler, max_workers: Optional[int] = None) -> None:
+        """
+        Initialize the class with parameters.
+        :param scheduler: Scheduler used to process the components.
+        :param max_workers: Maximum number of processes, the number of processors if not provided. The components are
+        processed in the current process if set to 1.
+        """
+        self.scheduler = scheduler
+        self.max_workers = max_workers
+
+    @staticmethod
+    def split(job_pool: AbstractJobPool) -> List[AbstractJobPool]:
+        """
+        Split the job pool into independent components. Each component is a shallow copy of the job pool that keeps
+        its parameters, e.g. the duration of the jobs in a fixed length job pool, but contains only a part of the jobs
+        in the order of the job pool. Jobs without execution windows are put into the first component, so that the
+        wrapped scheduler decides whether they can be scheduled.
+        :param job_pool: Job pool to split.
+        :return: Components ordered by the start of their earliest execution window.
+        """
+        jobs = list(job_pool.jobs)
+        windows = sorted(
+            (interval.start, interval.end, i) for i, job in enumerate(jobs) for interval in job.availability_intervals
+        )
+        nodes = [DisjointSetNode(i) for i in range(len(jobs))]
+
+        end = None
+        previous_position = None
+
+        for window_start, window_end, i in windows:
+            if end is not None and window_start <= end:
+                nodes[i].unite_with(nodes[previous_position])
+                end = max(end, window_end)
+            else:
+                end = window_end
+
+            previous_position = i
+
+        for i, job in enumerate(jobs):
+            if len(job.availability_intervals) == 0:
+                nodes[i].unite_with(nodes[windows[0][2] if len(windows) != 0 else 0])
+
+        components = {}
+
+        for _, _, i in windows:
+            components.setdefault(nodes[i].root().value, [])
+
+        for i, job in enumerate(jobs):
+            components.setdefault(nodes[i].root().value, []).append(job)
+
+        job_pools = []
+
+        for component_jobs in components.values():
+            component = copy(job_pool)
+            component.jobs = component_jobs
+            job_pools.append(component)
+
+        return job_pools
+
+    @staticmethod
+    def _merge_active_time_intervals(active_time_intervals: List[TimeInterval]) -> List[TimeInterval]:
+        active_time_intervals = sorted(active_time_intervals)
+
+        if all(
+                isinstance(interval.start, Integral) and isinstance(interval.end, Integral)
+                for interval in active_time_intervals
+        ):
+            return TimeInterval.merge_time_intervals(active_time_intervals)
+
+        return active_time_intervals
+
+    @staticmethod
+    def _restore_jobs(job_schedule: AbstractJobSchedule, jobs: Dict[int, AbstractJob]) -> None:
+        if isinstance(job_schedule, BatchJobSchedule):
+            job_schedule.jobs = set(jobs[job.id] for job in job_schedule.jobs)
+        else:
+            job_schedule.job = jobs[job_schedule.job.id]
+
+    def process(self, job_pool: AbstractJobPool, *args) -> Schedule:
+        """
+        Computes the schedule for each component of the job pool with the wrapped scheduler and joins the results.
+        :param job_pool: Job pool of any type accepted by the wrapped scheduler.
+        :param args: Other arguments of the process function of the wrapped scheduler, e.g. maximum concurrency.
+        :return: Computed schedule.
+        """
+        components = self.split(job_pool)
+
+        if len(components) <= 1:
+            return self.scheduler.process(job_pool, *args)
+
+        if self.max_workers == 1:
+            schedules = [_process_component(self.scheduler, component, args) for component in components]
+        else:
+            with ProcessPoolExecutor(self.max_workers) as executor:
+                schedules = list(executor.map(
+                    _process_component,
+                    [self.scheduler] * len(components),
+                    components,
+                    [args] * len(components),
+                ))
+
+        if any(schedule.all_jobs_scheduled is False for schedule in schedules):
+            return Schedule(False, None, None)
+
+        jobs = {job.id: job for job in job_pool.jobs}
+        job_schedules = []
+
+        for schedule in schedules:
+            for job_schedule in schedule.job_schedules:
+                self._restore_jobs(job_schedule, jobs)
+                job_schedules.append(job_schedule)
+
+        return Schedule(
+            True,
+            self._merge_active_time_intervals(
+                [interval for schedule in schedules for interval in schedule.active_time_intervals]
+            ),
+            job_schedules,
+        )
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+from abc import ABC, abstractmethod
+from heapq import heappop, heappush
+from numpy import (
+    arange,
+    array,
+    argsort,
+    concatenate,
+    flatnonzero,
+    full,
+    int64,
+    isin,
+    ndarray,
+    ones,
+    searchsorted,
+    zeros,
+)
+from typing import Iterable, Optional, Tuple
+
+from ..models import TimeSlotIndex
+from ..utils import FlowNetwork, IncrementalMaximumFlow
+
+
+class AbstractFeasibilityOracle(ABC):
+    """
+    Abstract class for the feasibility oracles used by the greedy schedulers. An oracle keeps track of the closed time
+    slots and answers whether all jobs can still be scheduled within the open ones.
+    """
+
+    @abstractmethod
+    def is_feasible(self) -> bool:
+        """
+        Check whether all jobs can be scheduled within the currently open time slots.
+        :return: Whether the jobs can be scheduled.
+        """
+        pass
+
+    @abstractmethod
+    def is_feasible_without(self, timestamps: Iterable[int]) -> bool:
+        """
+        Check whether all jobs can be scheduled if the time slots are closed in addition to the currently closed ones.
+        The set of closed time slots is not changed.
+        :param timestamps: Time slots to close.
+        :return: Whether the jobs can be scheduled.
+        """
+        pass
+
+    @abstractmethod
+    def close_timestamps(self, timestamps: Iterable[int]) -> bool:
+        """
+        Close the time slots if all jobs can still be scheduled without them, otherwise leave the oracle unchanged.
+        :param timestamps: Time slots to close.
+        :return: Whether the time slots were closed.
+        """
+        pass
+
+    @abstractmethod
+    def open_timestamps(self, timestamps: Iterable[int]) -> None:
+        """
+        Reopen closed time slots.
+        :param timestamps: Time slots to open.
+        """
+        pass
+
+    @abstractmethod
+    def get_assignment(self) -> Tuple[ndarray, ndarray]:
+        """
+        Get an assignment of the jobs to the open time slots. Must only be called when the oracle is feasible.
+        :return: Positions of the jobs in the index and the time slots they are executed at, one pair per unit of work.
+        """
+        pass
+
+
+class FlowFeasibilityOracle(AbstractFeasibilityOracle):
+    """
+    Feasibility oracle based on the feasibility network described in "Energy-aware batch scheduling" (Chang, 2013).
+    The network must be laid out as in GreedyScheduler: the source is node 0, jobs are nodes 1..n, the time slot t is
+    node n + 1 + t and the sink is the last node. The maximum flow is maintained by IncrementalMaximumFlow, so closing
+    a time slot only re-routes the flow passing through it, and the assignment is read from the edges carrying flow into
+    the time slots. Works for jobs with any number of execution windows.
+    """
+
+    def __init__(self, network: FlowNetwork, flow: ndarray, number_of_jobs: int) -> None:
+        """
+        Initialize the class with parameters.
+        :param network: Feasibility network.
+        :param flow: Maximum flow on the network.
+        :param number_of_jobs: Number of jobs in the network.
+        """
+        self.network = network
+        self.number_of_jobs = number_of_jobs
+
+        self._demand = int(network.capacities[:number_of_jobs].sum())
+        self._flow = IncrementalMaximumFlow.from_flow_network(network, 0, network.number_of_nodes - 1, flow)
+
+    def is_feasible(self) -> bool:
+        return self._flow.flow_value == self._demand
+
+    def is_feasible_without(self, timestamps: Iterable[int]) -> bool:
+        nodes = [1 + self.number_of_jobs + t for t in timestamps]
+        nodes = [u for u in nodes if u not in self._flow.closed_nodes]
+
+        if self._flow.close_nodes(nodes) is False:
+            return False
+
+        self._flow.open_nodes(nodes)
+        return True
+
+    def close_timestamps(self, timestamps: Iterable[int]) -> bool:
+        return self._flow.close_nodes([1 + self.number_of_jobs + t for t in timestamps])
+
+    def open_timestamps(self, timestamps: Iterable[int]) -> None:
+        self._flow.open_nodes([1 + self.number_of_jobs + t for t in timestamps])
+
+    def get_assignment(self) -> Tuple[ndarray, ndarray]:
+        job_positions = []
+        timestamps = []
+
+        for t in range(self.network.number_of_nodes - 2 - self.number_of_jobs):
+            for u in self._flow.get_incoming_flow(1 + self.number_of_jobs + t):
+                job_positions.append(u - 1)
+                timestamps.append(t)
+
+        return array(job_positions, dtype=int64), array(timestamps, dtype=int64)
+
+    @staticmethod
+    def get_flow_assignment(network: FlowNetwork, flow: ndarray, number_of_jobs: int) -> Tuple[ndarray, ndarray]:
+        """
+        Convert a flow on the feasibility network into an assignment of the jobs to the time slots.
+        :param network: Feasibility network.
+        :param flow: Flow on the network.
+        :param number_of_jobs: Number of jobs in the network.
+        :return: Positions of the jobs in the index and the time slots they are executed at.
+        """
+        edges = flatnonzero((network.tails != 0) & (network.heads != network.number_of_nodes - 1) & (flow != 0))
+        return network.tails[edges] - 1, network.heads[edges] - 1 - number_of_jobs
+
+
+class EarliestDeadlineFirstOracle(AbstractFeasibilityOracle):
+    """
+    Feasibility oracle for jobs with a single execution window that does not build a feasibility network. The open time
+    slots are swept in increasing order and each of them is given to the jobs with the least laxity, ties are broken by
+    the earliest deadline. The sweep takes O(P log n) time, where P is the total duration of the jobs, and whenever it
+    succeeds it yields a valid assignment. A job whose window contains fewer open time slots than its duration proves
+    infeasibility immediately. Since the sweep is not exact when several jobs run concurrently, a failed sweep without
+    such a proof is confirmed by a maximum flow computation on the network restricted to the open time slots.
+    """
+
+    def __init__(self, index: TimeSlotIndex, max_concurrency: int) -> None:
+        """
+        Initialize the class with parameters.
+        :param index: Time slot index of jobs with a single execution window.
+        :param max_concurrency: Maximum number of jobs allowed to run concurrently.
+        """
+        self.index = index
+        self.max_concurrency = max_concurrency
+
+        self._release_times = index.columns.window_starts
+        self._deadlines = index.columns.window_ends
+        self._durations = index.columns.durations
+        self._order = argsort(self._release_times, kind='stable')
+
+        self._closed = set()
+        self._assignment = self._solve(self._closed)
+
+    def _get_open_timestamps(self, closed: Iterable[int]) -> ndarray:
+        return self.index.timestamps[~isin(self.index.timestamps, list(closed))]
+
+    def _sweep(self, timestamps: ndarray) -> Optional[Tuple[ndarray, ndarray]]:
+        open_before_deadline = searchsorted(timestamps, self._deadlines, 'right').tolist()
+        release_times = self._release_times.tolist()
+        durations = self._durations.tolist()
+        deadlines = self._deadlines.tolist()
+        order = [j for j in self._order.tolist() if durations[j] != 0]
+
+        job_positions = []
+        job_timestamps = []
+
+        heap = []
+        i = 0
+
+        for c, t in enumerate(timestamps.tolist()):
+            while i < len(order) and release_times[order[i]] <= t:
+                j = order[i]
+                heappush(heap, (open_before_deadline[j] - durations[j], deadlines[j], j))
+                i += 1
+
+            for key, deadline, j in [heappop(heap) for _ in range(min(self.max_concurrency, len(heap)))]:
+                job_positions.append(j)
+                job_timestamps.append(t)
+
+                if key + 1 < open_before_deadline[j]:
+                    heappush(heap, (key + 1, deadline, j))
+
+            if len(heap) != 0 and heap[0][0] <= c:
+                return None
+
+        if len(heap) != 0 or i != len(order):
+            return None
+
+        return array(job_positions, dtype=int64), array(job_timestamps, dtype=int64)
+
+    def _solve_flow(self, timestamps: ndarray) -> Optional[Tuple[ndarray, ndarray]]:
+        slots, job_positions = self.index.incidence()
+
+        mask = isin(slots, timestamps)
+        slot_positions = searchsorted(timestamps, slots[mask])
+        job_positions = job_positions[mask]
+
+        n, m = len(self.index.jobs), len(timestamps)
+
+        network = FlowNetwork(
+            2 + n + m,
+            concatenate([zeros(n), 1 + job_positions, arange(1 + n, 1 + n + m)]),
+            concatenate([arange(1, 1 + n), 1 + n + slot_positions, full(m, 1 + n + m)]),
+            concatenate([self._durations, ones(len(job_positions)), full(m, self.max_concurrency)]),
+        )
+        flow_value, flow = network.maximum_flow(0, 1 + n + m)
+
+        if flow_value < self._durations.sum():
+            return None
+
+        edges = flatnonzero(flow[n:n + len(job_positions)])
+
+        return job_positions[edges], timestamps[slot_positions[edges]]
+
+    def _solve(self, closed: Iterable[int]) -> Optional[Tuple[ndarray, ndarray]]:
+        timestamps = self._get_open_timestamps(closed)
+
+        open_within_window = (
+            searchsorted(timestamps, self._deadlines, 'right') - searchsorted(timestamps, self._release_times, 'left')
+        )
+
+        if (open_within_window < self._durations).any():
+            return None
+
+        if len(timestamps) * self.max_concurrency < self._durations.sum():
+            return None
+
+        assignment = self._sweep(timestamps)
+
+        if assignment is None:
+            assignment = self._solve_flow(timestamps)
+
+        return assignment
+
+    def is_feasible(self) -> bool:
+        return self._assignment is not None
+
+    def is_feasible_without(self, timestamps: Iterable[int]) -> bool:
+        return self._solve(self._closed.union(timestamps)) is not None
+
+    def close_timestamps(self, timestamps: Iterable[int]) -> bool:
+        closed = self._closed.union(timestamps)
+        assignment = self._solve(closed)
+
+        if assignment is None:
+            return False
+
+        self._closed = closed
+        self._assignment = assignment
+        return True
+
+    def open_timestamps(self, timestamps: Iterable[int]) -> None:
+        self._closed = self._closed.difference(timestamps)
+        self._assignment = self._solve(self._closed)
+
+    def get_assignment(self) -> Tuple[ndarray, ndarray]:
+        return self._assignment
@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from ctypes import Array
 from enum import Enum
-from itertools import permutations
-from networkx import DiGraph
+from itertools import combinations
+from multiprocessing.sharedctypes import RawArray
 from networkx.algorithms.flow import (
     maximum_flow,
     edmonds_karp,
@@ -11,12 +14,33 @@ from networkx.algorithms.flow import (
     dinitz,
     boykov_kolmogorov,
 )
+from numpy import (
+    arange,
+    argsort,
+    asarray,
+    bincount,
+    concatenate,
+    cumsum,
+    diff,
+    flatnonzero,
+    float64,
+    full,
+    int64,
+    lexsort,
+    ndarray,
+    ones,
+    rint,
+    searchsorted,
+    unique,
+    zeros,
+)
 from random import shuffle
-from typing import Callable, Dict, Iterable, List, Optional, Set
+from time import monotonic
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple
 
-from ..models import Job, JobMI, JobPool, JobScheduleMI, Schedule, TimeInterval
-from . import AbstractScheduler
-from ..utils import ford_fulkerson
+from ..models import Job, JobMI, JobPool, JobScheduleMI, Schedule, TimeInterval, TimeSlotIndex
+from . import AbstractFeasibilityOracle, AbstractScheduler, EarliestDeadlineFirstOracle, FlowFeasibilityOracle
+from ..utils import FlowNetwork, ford_fulkerson, scipy_maximum_flow
 
 
 class FlowMethod(str, Enum):
@@ -30,6 +54,37 @@ class FlowMethod(str, Enum):
     DINITZ = 'dinitz'
     BOYKOV_KOLMOGOROV = 'boykov_kolmogorov'
     FORD_FULKERSON = 'ford_fulkerson'
+    SCIPY = 'scipy'
+
+
+class FeasibilityMethod(str, Enum):
+    """
+    Enum representing the method to check whether the jobs can be scheduled within the open time slots.
+    """
+
+    FLOW = 'flow'
+    EARLIEST_DEADLINE_FIRST = 'earliest_deadline_first'
+
+
+_speculation_oracle: Optional[AbstractFeasibilityOracle] = None
+_speculation_log: Optional[Array] = None
+_speculation_epoch = 0
+
+
+def _initialize_speculation(oracle: AbstractFeasibilityOracle, log: Array) -> None:
+    global _speculation_oracle, _speculation_log, _speculation_epoch
+    _speculation_oracle = oracle
+    _speculation_log = log
+    _speculation_epoch = 0
+
+
+def _is_feasible_without(epoch: int, timestamps: List[int]) -> bool:
+    global _speculation_epoch
+
+    _speculation_oracle.close_timestamps(_speculation_log[_speculation_epoch:epoch])
+    _speculation_epoch = epoch
+
+    return _speculation_oracle.is_feasible_without(timestamps)
 
 
 class AbstractGreedyScheduler(AbstractScheduler, ABC):
@@ -54,8 +109,17 @@ class AbstractGreedyScheduler(AbstractScheduler, ABC):
             'dinitz': dinitz,
             'boykov_kolmogorov': boykov_kolmogorov,
             'ford_fulkerson': ford_fulkerson,
+            'scipy': scipy_maximum_flow,
         }[self.flow_method]
 
+    def _compute_maximum_flow(self, network: FlowNetwork, s: int, t: int) -> Tuple[int, ndarray]:
+        if self.flow_method == FlowMethod.SCIPY:
+            return network.maximum_flow(s, t)
+
+        flow_value, flow_dict = maximum_flow(network.to_digraph(), s, t, flow_func=self.flow_func)  # noqa
+
+        return flow_value, network.flow_from_dict(flow_dict)
+
     @abstractmethod
     def process(self, job_pool: JobPool, max_concurrency: int) -> Schedule:
         """
@@ -71,75 +135,246 @@ class GreedyScheduler(AbstractGreedyScheduler):
     """
     Greedy flow algorithm based on "Brief announcement: A greedy 2 approximation for the active time problem" (Kumar et
     al., 2018). The algorithm computes a 2-approximation solution to a set of jobs with arbitrary lengths but single
-    execution interval. The running complexity depends on the selected algorithm used for the maximum flow problem:
-    O(T) flow computations on a network with O(n + T) nodes and O(nT) edges are required to compute the solution.
+    execution interval. The running complexity depends on the selected algorithm used for the maximum flow problem: a
+    single flow computation on a network with O(n + T) nodes and O(nT) edges is followed by O(T) incremental repairs of
+    the residual network, each of which re-routes only the flow passing through the closed time slot. For jobs with a
+    single execution window the feasibility can be checked without a flow network using the earliest deadline first
+    oracle, see EarliestDeadlineFirstOracle. The time slots may also be closed in blocks, see _close_time_slot_block,
+    or speculatively in a process pool, see _close_time_slots_speculatively. The number of feasibility checks saved
+    compared to checking the time slots one by one is reported by the read-only field saved_feasibility_checks, and the
+    number of speculative checks whose results were discarded by wasted_speculative_checks. They are diagnostics of
+    the last call of process rather than a part of the configuration of the scheduler: they are kept out of the
+    fingerprint of CachedScheduler, they are not sent back from the processes of DecompositionScheduler and concurrent
+    calls on a scheduler shared between threads overwrite them.
     """
 
-    @staticmethod
-    def _create_initial_graph(
-            max_concurrency: int,
-            max_t: int,
-            jobs: List[JobMI],
-    ) -> DiGraph:
-        graph = DiGraph()
-
-        for i, job in enumerate(jobs):
-            u, v = 0, 1 + i
+    # Options that change how the time slots are closed but not which ones are closed
+    EXECUTION_OPTIONS = ('speculation_window', 'max_workers', 'block_size')
 
-            graph.add_edge(u, v, capacity=job.duration)
+    def __init__(
+            self,
+            flow_method: FlowMethod = FlowMethod.PREFLOW_PUSH,
+            feasibility_method: FeasibilityMethod = FeasibilityMethod.FLOW,
+            speculation_window: int = 1,
+            max_workers: Optional[int] = None,
+            block_size: int = 1,
+    ) -> None:
+        """
+        Initialize the class with parameters.
+        :param flow_method: Flow method used to solve the feasibility problem.
+        :param feasibility_method: Method used to check the feasibility of the jobs with a single execution window. Jobs
+        with multiple execution windows are always checked with the feasibility network.
+        :param speculation_window: Number of time slots whose closing is checked concurrently. The time slots are closed
+        one by one if set to 1.
+        :param max_workers: Maximum number of processes used for the speculative checks, the number of processors if not
+        provided.
+        :param block_size: Number of consecutive time slots whose closing is tried with a single feasibility check. Not
+        used if the time slots are closed speculatively.
+        """
+        super(GreedyScheduler, self).__init__(flow_method)
+        self.feasibility_method = feasibility_method
+        self.speculation_window = speculation_window
+        self.max_workers = max_workers
+        self.block_size = block_size
 
-        for t in range(max_t):
-            u = 1 + len(jobs) + t
-            v = 1 + len(jobs) + max_t
+        self._saved_feasibility_checks = 0
+        self._wasted_speculative_checks = 0
 
-            graph.add_edge(u, v, capacity=max_concurrency)
+    @property
+    def saved_feasibility_checks(self) -> int:
+        return self._saved_feasibility_checks
 
-        return graph
+    @property
+    def wasted_speculative_checks(self) -> int:
+        return self._wasted_speculative_checks
 
     @staticmethod
-    def _open_time_slot(t: int, jobs: List[JobMI], graph: DiGraph) -> None:
-        for i, job in enumerate(jobs):
-            for interval in job.availability_intervals:
-                if interval.start <= t <= interval.end:
-                    u = 1 + i
-                    v = 1 + len(jobs) + t
-
-                    graph.add_edge(u, v, capacity=1)
+    def _create_flow_network(
+            max_concurrency: int,
+            max_t: int,
+            index: TimeSlotIndex,
+    ) -> FlowNetwork:
+        jobs = index.jobs
+        timestamps, job_positions = index.incidence()
+
+        job_positions = job_positions[timestamps < max_t]
+        timestamps = timestamps[timestamps < max_t]
+
+        tails = concatenate([
+            zeros(len(jobs)),
+            arange(1 + len(jobs), 1 + len(jobs) + max_t),
+            1 + job_positions,
+        ])
+        heads = concatenate([
+            arange(1, 1 + len(jobs)),
+            full(max_t, 1 + len(jobs) + max_t),
+            1 + len(jobs) + timestamps,
+        ])
+        capacities = concatenate([
+            index.columns.durations,
+            full(max_t, max_concurrency),
+            ones(len(timestamps)),
+        ])
+
+        return FlowNetwork(2 + len(jobs) + max_t, tails, heads, capacities)
 
     @staticmethod
-    def _close_time_slot(t: int, jobs: List[JobMI], graph: DiGraph) -> None:
-        for i, job in enumerate(jobs):
-            for interval in job.availability_intervals:
-                if interval.start <= t <= interval.end:
-                    u = 1 + i
-                    v = 1 + len(jobs) + t
+    def _get_max_t(index: TimeSlotIndex) -> int:
+        ends = index.columns.window_ends
+        return int(ends.max()) + 1 if len(ends) != 0 else 1
+
+    def _create_feasibility_oracle(
+            self,
+            max_concurrency: int,
+            max_t: int,
+            index: TimeSlotIndex,
+    ) -> Optional[AbstractFeasibilityOracle]:
+        if self.feasibility_method == FeasibilityMethod.EARLIEST_DEADLINE_FIRST and index.columns.has_single_windows:
+            oracle = EarliestDeadlineFirstOracle(index, max_concurrency)
+        else:
+            network = self._create_flow_network(max_concurrency, max_t, index)
+            _, flow = self._compute_maximum_flow(network, 0, 1 + len(index.jobs) + max_t)
+            oracle = FlowFeasibilityOracle(network, flow, len(index.jobs))
 
-                    graph.remove_edge(u, v)
+        return oracle if oracle.is_feasible() else None
 
     @staticmethod
     def _create_job_schedules(
             jobs: List[JobMI],
-            flow_dict: Dict[int, Dict[int, int]],
+            assignment: Tuple[ndarray, ndarray],
     ) -> Iterable[JobScheduleMI]:
-        for i, job in enumerate(jobs):
-            job_active_timestamps = set()
+        job_positions, timestamps = assignment
+        order = lexsort((timestamps, job_positions))
+        job_positions, timestamps = job_positions[order], timestamps[order]
+
+        run_starts = flatnonzero((diff(job_positions, prepend=-1) != 0) | (diff(timestamps, prepend=-1) != 1))
+        run_ends = flatnonzero((diff(job_positions, append=-1) != 0) | (diff(timestamps, append=-1) != 1))
 
-            for interval in job.availability_intervals:
-                for t in range(interval.start, interval.end + 1):
-                    if flow_dict[1 + i].get(1 + len(jobs) + t, 0) != 0:
-                        job_active_timestamps.add(t)
+        job_execution_intervals = [[] for _ in jobs]
 
-            yield JobScheduleMI(job, TimeInterval.merge_timestamps(job_active_timestamps))
+        for i, start, end in zip(
+                job_positions[run_starts].tolist(),
+                timestamps[run_starts].tolist(),
+                timestamps[run_ends].tolist(),
+        ):
+            job_execution_intervals[i].append(TimeInterval(start, end))
+
+        for job, execution_intervals in zip(jobs, job_execution_intervals):
+            yield JobScheduleMI(job, execution_intervals)
 
     def _get_t_ordering(self, job_pool: JobPool) -> List[int]:
-        min_t = min([job.release_time for job in job_pool.jobs])
-        max_t = max([job.deadline for job in job_pool.jobs]) + 1
-        return list(range(min_t, max_t))
+        columns = job_pool.get_columns()
+        starts, ends = columns.window_starts, columns.window_ends
+        return list(range(int(starts.min()), int(ends.max()) + 1)) if len(starts) != 0 else []
+
+    def _close_time_slot_block(
+            self,
+            oracle: AbstractFeasibilityOracle,
+            block: List[int],
+            active_timestamps: Set[int],
+            refused: bool = False,
+    ) -> int:
+        """
+        Close a block of consecutive time slots of the ordering with a single feasibility check. If the check fails, the
+        block is halved and both halves are processed recursively, the second one after the first one is committed. The
+        result is the same as closing the time slots one by one: a time slot is closed whenever the time slots closed
+        before it and the time slot itself can be closed together. If the first half of a refused block is closed
+        entirely, the second half is known to be refused without a check.
+        :param oracle: Feasibility oracle.
+        :param block: Time slots to close.
+        :param active_timestamps: Set to add the time slots that remain open to.
+        :param refused: Whether the block is known to be refused.
+        :return: Number of feasibility checks performed.
+        """
+        checks = 0
+
+        if refused is False:
+            checks += 1
+
+            if oracle.close_timestamps(block) is True:
+                return checks
+
+        if len(block) == 1:
+            active_timestamps.add(block[0])
+            return checks
+
+        middle = len(block) // 2
+        number_of_active_timestamps = len(active_timestamps)
+
+        checks += self._close_time_slot_block(oracle, block[:middle], active_timestamps)
+        checks += self._close_time_slot_block(
+            oracle,
+            block[middle:],
+            active_timestamps,
+            len(active_timestamps) == number_of_active_timestamps,
+        )
+
+        return checks
+
+    def _close_time_slots_speculatively(self, oracle: AbstractFeasibilityOracle, t_ordering: List[int]) -> Set[int]:
+        """
+        Close the time slots in the given order as the sequential greedy does, but check the next speculation_window
+        time slots concurrently, each under the hypothesis that the closings of the preceding time slots in the window
+        succeed. The results are committed in order. Once a time slot is refused, the hypotheses of the following checks
+        are no longer exact: a positive answer is still valid since the feasibility is monotone in the set of open time
+        slots, while the first negative answer is recomputed in the next window. Hence, the result matches the
+        sequential one. Every worker process keeps its own copy of the oracle and applies the committed closings to it
+        before answering, so a single check costs about as much as a sequential closing. The committed closings are
+        appended to a log shared with the workers and every check only carries the length of the log it assumes, so
+        each worker reads every committed closing once. Every time slot is decided by exactly one consumed check, hence
+        no checks are saved, while the checks computed past the first refusal of a window are counted as wasted.
+        :param oracle: Feasibility oracle without closed time slots.
+        :param t_ordering: Order in which the time slots are closed.
+        :return: Time slots that remain open.
+        """
+        active_timestamps = set()
+        closed_timestamps = []
+        log = RawArray('q', len(t_ordering))
+        checks = 0
+        wasted_checks = 0
+
+        with ProcessPoolExecutor(
+                self.max_workers,
+                initializer=_initialize_speculation,
+                initargs=(oracle, log),
+        ) as executor:
+            i = 0
+
+            while i < len(t_ordering):
+                window = t_ordering[i:i + self.speculation_window]
+                futures = [
+                    executor.submit(_is_feasible_without, len(closed_timestamps), window[:j + 1])
+                    for j in range(len(window))
+                ]
+                refused = False
+                consumed = 0
+
+                for t, future in zip(window, futures):
+                    if future.result() is True:
+                        log[len(closed_timestamps)] = t
+                        closed_timestamps.append(t)
+                    elif refused is False:
+                        active_timestamps.add(t)
+                        refused = True
+                    else:
+                        break
+
+                    consumed += 1
+                    i += 1
+
+                checks += consumed
+                wasted_checks += sum(future.cancel() is False for future in futures[consumed:])
+
+        oracle.close_timestamps(closed_timestamps)
+        self._saved_feasibility_checks = len(t_ordering) - checks
+        self._wasted_speculative_checks = wasted_checks
+
+        return active_timestamps
 
     def _apply_optimizations(
             self,
-            job_pool: JobPool,
-            graph: DiGraph,
+            index: TimeSlotIndex,
+            oracle: AbstractFeasibilityOracle,
             active_timestamps: Set[int],
             max_concurrency: int,
     ) -> None:
@@ -155,97 +390,142 @@ class GreedyScheduler(AbstractGreedyScheduler):
         if job_pool.size == 0:
             return Schedule(True, [], [])
 
-        max_t = max([job.deadline for job in job_pool.jobs]) + 1
-        duration_sum = sum([job.duration for job in job_pool.jobs])
+        index = job_pool.create_time_slot_index()
+        jobs = index.jobs
+        max_t = self._get_max_t(index)
 
-        graph = self._create_initial_graph(max_concurrency, max_t, job_pool.jobs)
+        oracle = self._create_feasibility_oracle(max_concurrency, max_t, index)
 
-        for t in range(max_t):
-            self._open_time_slot(t, job_pool.jobs, graph)
-
-        flow_value, _ = maximum_flow(graph, 0, 1 + len(job_pool.jobs) + max_t, flow_func=self.flow_func)  # noqa
-
-        if flow_value < duration_sum:
+        if oracle is None:
             return Schedule(False, None, None)
 
-        active_timestamps = set()
-
-        for t in self._get_t_ordering(job_pool):
-            self._close_time_slot(t, job_pool.jobs, graph)
+        t_ordering = self._get_t_ordering(job_pool)
 
-            flow_value, _ = maximum_flow(graph, 0, 1 + len(job_pool.jobs) + max_t, flow_func=self.flow_func)  # noqa
+        if self.speculation_window > 1:
+            active_timestamps = self._close_time_slots_speculatively(oracle, t_ordering)
+        else:
+            active_timestamps = set()
+            checks = 0
 
-            if flow_value < duration_sum:
-                self._open_time_slot(t, job_pool.jobs, graph)
-                active_timestamps.add(t)
+            for i in range(0, len(t_ordering), self.block_size):
+                checks += self._close_time_slot_block(oracle, t_ordering[i:i + self.block_size], active_timestamps)
 
-        _, flow_dict = maximum_flow(graph, 0, 1 + len(job_pool.jobs) + max_t, flow_func=self.flow_func)  # noqa
+            self._saved_feasibility_checks = len(t_ordering) - checks
+            self._wasted_speculative_checks = 0
 
-        self._apply_optimizations(job_pool, graph, active_timestamps, max_concurrency)
+        self._apply_optimizations(index, oracle, active_timestamps, max_concurrency)
 
         return Schedule(
             True,
             TimeInterval.merge_timestamps(active_timestamps),
-            list(self._create_job_schedules(job_pool.jobs, flow_dict)),
+            list(self._create_job_schedules(jobs, oracle.get_assignment())),
         )
 
 
 class GreedyLocalSearchScheduler(GreedyScheduler):
     """
     The algorithm applies local optimizations to the resulting schedule as described in "Brief announcement: A greedy 2
-    approximation for the active time problem" (Kumar et al., 2018).
+    approximation for the active time problem" (Kumar et al., 2018): as long as possible, B active time slots are closed
+    at the cost of opening B - 1 closed ones. The candidates are enumerated as combinations, the active time slots with
+    the most unused capacity in the current assignment and the closed time slots available to the most jobs coming
+    first. Every candidate is evaluated by the feasibility oracle, i.e. by an incremental repair of the flow. Since the
+    neighbourhood is of size O(T^(2B - 1)), the search can be bounded by the number of evaluations and by time.
     """
 
-    def _try_close_open(
+    def __init__(
             self,
-            job_pool: JobPool,
-            graph: DiGraph,
+            flow_method: FlowMethod = FlowMethod.PREFLOW_PUSH,
+            feasibility_method: FeasibilityMethod = FeasibilityMethod.FLOW,
+            max_evaluations: Optional[int] = None,
+            time_limit: Optional[float] = None,
+            speculation_window: int = 1,
+            max_workers: Optional[int] = None,
+            block_size: int = 1,
+    ) -> None:
+        """
+        Initialize the class with parameters.
+        :param flow_method: Flow method used to solve the feasibility problem.
+        :param feasibility_method: Method used to check the feasibility of the jobs with a single execution window.
+        :param max_evaluations: Maximum number of candidates to evaluate, unbounded if not provided.
+        :param time_limit: Maximum time in seconds spent on the local search, unbounded if not provided.
+        :param speculation_window: Number of time slots whose closing is checked concurrently.
+        :param max_workers: Maximum number of processes used for the speculative checks.
+        :param block_size: Number of consecutive time slots whose closing is tried with a single feasibility check.
+        """
+        super(GreedyLocalSearchScheduler, self).__init__(
+            flow_method,
+            feasibility_method,
+            speculation_window,
+            max_workers,
+            block_size,
+        )
+        self.max_evaluations = max_evaluations
+        self.time_limit = time_limit
+
+    @staticmethod
+    def _get_candidates(
+            index: TimeSlotIndex,
+            oracle: AbstractFeasibilityOracle,
             active_timestamps: Set[int],
             max_concurrency: int,
-    ) -> bool:
-        if len(active_timestamps) < max_concurrency:
-            return False
-
-        max_t = max([job.deadline for job in job_pool.jobs]) + 1
-        duration_sum = sum([job.duration for job in job_pool.jobs])
-
-        for ts_to_close in permutations(active_timestamps, max_concurrency):
-            for ts_to_open in permutations(active_timestamps, max_concurrency - 1):
-                ts_to_close = set(ts_to_close).intersection(active_timestamps)
-                ts_to_open = set(ts_to_open).difference(active_timestamps)
+    ) -> Iterator[Tuple[Tuple[int, ...], Tuple[int, ...]]]:
+        _, job_timestamps = oracle.get_assignment()
+        load = Counter(job_timestamps.tolist())
+        density = bincount(index.incidence()[0] - index.timestamps[0], minlength=len(index.timestamps))
+
+        ts_to_close_ordering = sorted(active_timestamps, key=lambda t: (load[t], t))
+        ts_to_open_ordering = sorted(
+            [t for t in index.timestamps.tolist() if t not in active_timestamps],
+            key=lambda t: (-density[t - index.timestamps[0]], t),
+        )
 
-                for t in ts_to_close:
-                    active_timestamps.remove(t)
-                    self._close_time_slot(t, job_pool.jobs, graph)
-                for t in ts_to_open:
-                    active_timestamps.add(t)
-                    self._open_time_slot(t, job_pool.jobs, graph)
+        for ts_to_close in combinations(ts_to_close_ordering, max_concurrency):
+            for ts_to_open in combinations(ts_to_open_ordering, max_concurrency - 1):
+                yield ts_to_close, ts_to_open
 
-                flow_value, _ = maximum_flow(graph, 0, 1 + len(job_pool.jobs) + max_t, flow_func=self.flow_func)  # noqa
+    @staticmethod
+    def _try_close_open(
+            oracle: AbstractFeasibilityOracle,
+            active_timestamps: Set[int],
+            ts_to_close: Tuple[int, ...],
+            ts_to_open: Tuple[int, ...],
+    ) -> bool:
+        oracle.open_timestamps(ts_to_open)
 
-                if flow_value == duration_sum:
-                    return True
+        if oracle.close_timestamps(ts_to_close) is True:
+            active_timestamps.difference_update(ts_to_close)
+            active_timestamps.update(ts_to_open)
+            return True
 
-                for t in ts_to_open:
-                    active_timestamps.remove(t)
-                    self._close_time_slot(t, job_pool.jobs, graph)
-                for t in ts_to_close:
-                    active_timestamps.add(t)
-                    self._open_time_slot(t, job_pool.jobs, graph)
+        oracle.close_timestamps(ts_to_open)
 
         return False
 
     def _apply_optimizations(
             self,
-            job_pool: JobPool,
-            graph: DiGraph,
+            index: TimeSlotIndex,
+            oracle: AbstractFeasibilityOracle,
             active_timestamps: Set[int],
             max_concurrency: int,
     ) -> None:
+        deadline = None if self.time_limit is None else monotonic() + self.time_limit
+        evaluations = 0
         any_improvements = True
 
         while any_improvements is True:
-            any_improvements = self._try_close_open(job_pool, graph, active_timestamps, max_concurrency)
+            any_improvements = False
+
+            for ts_to_close, ts_to_open in self._get_candidates(index, oracle, active_timestamps, max_concurrency):
+                if self.max_evaluations is not None and evaluations == self.max_evaluations:
+                    return
+                if deadline is not None and monotonic() > deadline:
+                    return
+
+                evaluations += 1
+
+                if self._try_close_open(oracle, active_timestamps, ts_to_close, ts_to_open) is True:
+                    any_improvements = True
+                    break
 
 
 class GreedyLowestDensityFirstScheduler(GreedyScheduler):
@@ -253,33 +533,84 @@ class GreedyLowestDensityFirstScheduler(GreedyScheduler):
     This algorithm tries to close the time slot in a different manner, preferring denser time slots to the sparser ones.
     The density of a time slot is defined as the number of jobs available at it. If the weight function is not passed to
     the constructor, the method only provides a 3-approximation to the Active Time Problem. However, even in this case
-    it performs noticeably better on random data.
+    it performs noticeably better on random data. Integer densities are accumulated with a difference array, so
+    computing the ordering takes O(n + T) native operations, while fractional weights are added job by job in the order
+    of the pool, so that the time slots covered by the same jobs get equal densities.
     """
 
     def __init__(
             self,
             flow_method: FlowMethod = FlowMethod.PREFLOW_PUSH,
             f: Optional[Callable[[float], float]] = None,
+            feasibility_method: FeasibilityMethod = FeasibilityMethod.FLOW,
+            speculation_window: int = 1,
+            max_workers: Optional[int] = None,
+            block_size: int = 1,
+            vectorized: bool = False,
     ) -> None:
-        super(GreedyLowestDensityFirstScheduler, self).__init__(flow_method)
+        """
+        Initialize the class with parameters.
+        :param flow_method: Flow method used to solve the feasibility problem.
+        :param f: Weight of a job as a function of its relative slack, 1 for every job if not provided.
+        :param feasibility_method: Method used to check the feasibility of the jobs with a single execution window.
+        :param speculation_window: Number of time slots whose closing is checked concurrently.
+        :param max_workers: Maximum number of processes used for the speculative checks.
+        :param block_size: Number of consecutive time slots whose closing is tried with a single feasibility check.
+        :param vectorized: Whether the weight function accepts and returns NumPy arrays of relative slacks.
+        """
+        super(GreedyLowestDensityFirstScheduler, self).__init__(
+            flow_method,
+            feasibility_method,
+            speculation_window,
+            max_workers,
+            block_size,
+        )
         self.f = f
+        self.vectorized = vectorized
 
-    def _get_weight(self, job: Job) -> float:
+    def _get_weights(self, release_times: ndarray, deadlines: ndarray, durations: ndarray) -> ndarray:
         if self.f is None:
-            return 1
-        relative_slack = job.duration / (job.deadline - job.release_time + 1)
-        return self.f(relative_slack)
+            return ones(len(durations), dtype=int64)
 
-    def _get_t_ordering(self, job_pool: JobPool) -> List[int]:
-        frequency = {}
-        for job in job_pool.jobs:
-            for t in range(job.release_time, job.deadline + 1):
-                frequency.setdefault(t, 0)
-                frequency[t] += self._get_weight(job)
+        relative_slacks = durations / (deadlines - release_times + 1)
 
-        t_ordering = sorted((item[1], item[0]) for item in frequency.items())
+        if self.vectorized is True:
+            return asarray(self.f(relative_slacks), dtype=float64)
 
-        return [t for _, t in t_ordering]
+        return asarray([self.f(relative_slack) for relative_slack in relative_slacks.tolist()], dtype=float64)
+
+    def _get_t_ordering(self, job_pool: JobPool) -> List[int]:
+        columns = job_pool.get_columns()
+        release_times, deadlines, durations = columns.release_times, columns.deadlines, columns.durations
+        weights = self._get_weights(release_times, deadlines, durations)
+
+        min_t = release_times.min()
+        number_of_timestamps = deadlines.max() - min_t + 2
+
+        coverage = cumsum(
+            bincount(release_times - min_t, minlength=number_of_timestamps)
+            - bincount(deadlines + 1 - min_t, minlength=number_of_timestamps)
+        )[:-1]
+        if (rint(weights) == weights).all():
+            # Sums of integer weights do not depend on the order of the additions, so the difference array is exact
+            density = cumsum(
+                bincount(release_times - min_t, weights, minlength=number_of_timestamps)
+                - bincount(deadlines + 1 - min_t, weights, minlength=number_of_timestamps)
+            )[:-1]
+        else:
+            # Rounding residues of the difference array would break the ties between the time slots covered by the same
+            # jobs, so fractional weights are added job by job as a slice each
+            density = zeros(number_of_timestamps - 1, dtype=float64)
+            for release_time, deadline, weight in zip(
+                    (release_times - min_t).tolist(),
+                    (deadlines + 1 - min_t).tolist(),
+                    weights.tolist(),
+            ):
+                density[release_time:deadline] += weight
+
+        timestamps = flatnonzero(coverage)
+
+        return (min_t + timestamps[argsort(density[timestamps], kind='stable')]).tolist()
 
 
 class GreedyIntervalsScheduler(AbstractGreedyScheduler):
@@ -290,75 +621,79 @@ class GreedyIntervalsScheduler(AbstractGreedyScheduler):
     """
 
     @staticmethod
-    def _create_initial_graph(
+    def _create_flow_network(
             intervals: List[TimeInterval],
-            jobs: List[Job],
-    ) -> DiGraph:
-        graph = DiGraph()
-
-        for i, job in enumerate(jobs):
-            u, v = 0, 1 + i
-
-            graph.add_edge(u, v, capacity=job.duration)
-
-        for i, interval in enumerate(intervals):
-            u = 1 + len(jobs) + i
-            v = 1 + len(jobs) + len(intervals)
-
-            graph.add_edge(u, v, capacity=0)
-
-        return graph
+            index: TimeSlotIndex,
+    ) -> Tuple[FlowNetwork, List[int]]:
+        jobs = index.jobs
+        timestamps, job_positions = index.incidence()
+
+        interval_positions = searchsorted(index.timestamps, timestamps)
+        offsets = len(jobs) + len(intervals) + searchsorted(interval_positions, arange(len(intervals) + 1))
+
+        tails = concatenate([
+            zeros(len(jobs)),
+            arange(1 + len(jobs), 1 + len(jobs) + len(intervals)),
+            1 + job_positions,
+        ])
+        heads = concatenate([
+            arange(1, 1 + len(jobs)),
+            full(len(intervals), 1 + len(jobs) + len(intervals)),
+            1 + len(jobs) + interval_positions,
+        ])
+        capacities = concatenate([[job.duration for job in jobs], zeros(len(intervals) + len(timestamps))])
+
+        return FlowNetwork(2 + len(jobs) + len(intervals), tails, heads, capacities), offsets.tolist()
 
     @staticmethod
     def _extend_interval(
             jobs: List[Job],
             i: int,
-            intervals: List[TimeInterval],
-            graph: DiGraph,
+            network: FlowNetwork,
+            offsets: List[int],
             max_concurrency: int,
             delta: int,
     ) -> None:
-        for j, job in enumerate(jobs):
-            if job.release_time <= intervals[i].start and intervals[i].end <= job.deadline:
-                u = 1 + j
-                v = 1 + len(jobs) + i
-
-                if graph.has_edge(u, v) is False:
-                    graph.add_edge(u, v, capacity=0)
-
-                graph[u][v]['capacity'] += delta
-
-        u = 1 + len(jobs) + i
-        v = 1 + len(jobs) + len(intervals)
-
-        graph[u][v]['capacity'] += max_concurrency * delta
+        network.capacities[offsets[i]:offsets[i + 1]] += delta
+        network.capacities[len(jobs) + i] += max_concurrency * delta
 
     @staticmethod
     def _reduce_interval(
             jobs: List[Job],
             i: int,
-            intervals: List[TimeInterval],
-            graph: DiGraph,
+            network: FlowNetwork,
+            offsets: List[int],
             max_concurrency: int,
             delta: int,
     ) -> None:
-        GreedyIntervalsScheduler._extend_interval(jobs, i, intervals, graph, max_concurrency, -delta)
+        GreedyIntervalsScheduler._extend_interval(jobs, i, network, offsets, max_concurrency, -delta)
 
     @staticmethod
     def _create_job_schedules(
             jobs: List[Job],
             intervals: List[TimeInterval],
-            flow_dict: Dict[int, Dict[int, int]],
+            network: FlowNetwork,
+            flow: ndarray,
     ) -> Iterable[JobScheduleMI]:
+        job_edges = flatnonzero((network.tails != 0) & (network.heads != network.number_of_nodes - 1) & (flow != 0))
+        job_edges = job_edges[lexsort((network.heads[job_edges], network.tails[job_edges]))]
+
+        job_scheduled_times = [[] for _ in jobs]
+
+        for u, v, f in zip(
+                network.tails[job_edges].tolist(),
+                network.heads[job_edges].tolist(),
+                flow[job_edges].tolist(),
+        ):
+            job_scheduled_times[u - 1].append((v - 1 - len(jobs), f))
+
         time_within_interval = {}
 
-        for j, job in enumerate(jobs):
+        for job, scheduled_times in zip(jobs, job_scheduled_times):
             active_intervals = []
 
-            for i, interval in enumerate(intervals):
-                scheduled_time = flow_dict.get(1 + j, {}).get(1 + len(jobs) + i, 0)
-                if scheduled_time == 0:
-                    continue
+            for i, scheduled_time in scheduled_times:
+                interval = intervals[i]
 
                 time_within_interval.setdefault(i, 0)
 
@@ -385,24 +720,22 @@ class GreedyIntervalsScheduler(AbstractGreedyScheduler):
         if job_pool.size == 0:
             return Schedule(True, [], [])
 
-        duration_sum = sum([job.duration for job in job_pool.jobs])
+        columns = job_pool.get_columns()
+        duration_sum = int(columns.durations.sum())
 
-        release_time_timestamps = [job.release_time for job in job_pool.jobs]
-        deadline_timestamps = [job.deadline + 1 for job in job_pool.jobs]
-
-        timestamps = sorted(set(release_time_timestamps + deadline_timestamps))
+        timestamps = unique(concatenate([columns.window_starts, columns.window_ends + 1])).tolist()
         intervals = [
             TimeInterval(timestamps[i], timestamps[i + 1] - 1) for i in range(len(timestamps) - 1)
         ]
 
-        graph = self._create_initial_graph(intervals, job_pool.jobs)
+        index = TimeSlotIndex(columns, timestamps[:-1])
+        jobs = index.jobs
+        network, offsets = self._create_flow_network(intervals, index)
 
         for i, interval in enumerate(intervals):
-            self._extend_interval(job_pool.jobs, i, intervals, graph, max_concurrency, interval.duration)
+            self._extend_interval(jobs, i, network, offsets, max_concurrency, interval.duration)
 
-        flow_value, _ = maximum_flow(
-            graph, 0, 1 + len(job_pool.jobs) + len(intervals), flow_func=self.flow_func  # noqa
-        )
+        flow_value, _ = self._compute_maximum_flow(network, 0, 1 + len(jobs) + len(intervals))
 
         if flow_value < duration_sum:
             return Schedule(False, None, None)
@@ -415,30 +748,28 @@ class GreedyIntervalsScheduler(AbstractGreedyScheduler):
             while right - left > 1:
                 middle = (left + right) // 2
 
-                self._reduce_interval(job_pool.jobs, i, intervals, graph, max_concurrency, middle)
+                self._reduce_interval(jobs, i, network, offsets, max_concurrency, middle)
 
-                flow_value, _ = maximum_flow(
-                    graph, 0, 1 + len(job_pool.jobs) + len(intervals), flow_func=self.flow_func  # noqa
-                )
+                flow_value, _ = self._compute_maximum_flow(network, 0, 1 + len(jobs) + len(intervals))
 
                 if flow_value == duration_sum:
                     left = middle
                 else:
                     right = middle
 
-                self._extend_interval(job_pool.jobs, i, intervals, graph, max_concurrency, middle)
+                self._extend_interval(jobs, i, network, offsets, max_concurrency, middle)
 
-            self._reduce_interval(job_pool.jobs, i, intervals, graph, max_concurrency, left)
+            self._reduce_interval(jobs, i, network, offsets, max_concurrency, left)
 
             if left != intervals[i].duration:
                 active_intervals.append(TimeInterval(intervals[i].start, intervals[i].end - left))
 
-        _, flow_dict = maximum_flow(graph, 0, 1 + len(job_pool.jobs) + len(intervals), flow_func=self.flow_func)  # noqa
+        _, flow = self._compute_maximum_flow(network, 0, 1 + len(jobs) + len(intervals))
 
         return Schedule(
             True,
             TimeInterval.merge_time_intervals(active_intervals),
-            list(self._create_job_schedules(job_pool.jobs, intervals, flow_dict)),
+            list(self._create_job_schedules(jobs, intervals, network, flow)),
         )
 
 
@@ -450,6 +781,6 @@ class MinFeasScheduler(GreedyScheduler):
     """
 
     def _get_t_ordering(self, job_pool: JobPool) -> List[int]:
-        t_ordering = self._get_t_ordering(job_pool)
+        t_ordering = super(MinFeasScheduler, self)._get_t_ordering(job_pool)
         shuffle(t_ordering)
         return t_ordering
@@ -1,14 +1,43 @@
 # -*- coding: utf-8 -*-
-import math
 import warnings
 from enum import Enum
-from networkx import maximum_flow
+from highspy import Highs, HighsModelStatus
+from numpy import (
+    arange,
+    argsort,
+    array,
+    asarray,
+    bincount,
+    ceil,
+    concatenate,
+    cumsum,
+    flatnonzero,
+    float64,
+    full,
+    inf,
+    int32,
+    int64,
+    isin,
+    lexsort,
+    minimum,
+    ndarray,
+    ones,
+    repeat,
+    searchsorted,
+    setdiff1d,
+    split,
+    stack,
+    tile,
+    unique,
+    zeros,
+)
 from scipy.linalg import LinAlgWarning
 from scipy.optimize import OptimizeResult, OptimizeWarning, linprog
-from typing import Dict, Iterable, List, Tuple, Union
+from scipy.sparse import block_diag, coo_matrix, csr_matrix, hstack
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-from ..models import JobMI, JobPool, JobPoolMI, JobScheduleMI, Schedule, TimeInterval
-from . import AbstractScheduler, FlowMethod, GreedyScheduler
+from ..models import JobMI, JobPool, JobPoolMI, JobScheduleMI, Schedule, TimeInterval, TimeSlotIndex
+from . import AbstractScheduler, EarliestDeadlineFirstOracle, FlowMethod, GreedyScheduler
 
 
 class LinearProgrammingMethod(str, Enum):
@@ -24,83 +53,397 @@ class LinearProgrammingMethod(str, Enum):
     SIMPLEX = 'simplex'
 
 
+class LinearProgrammingFormulation(str, Enum):
+    """
+    Reflects the LP formulation that is used in the schedulers.
+    """
+
+    TIME_SLOTS = 'time_slots'
+    ELEMENTARY_INTERVALS = 'elementary_intervals'
+
+
+class _LinearProgram(object):
+    """
+    LP of a single job pool together with the data needed to convert its solution into a schedule.
+    """
+
+    def __init__(
+            self,
+            jobs: List[JobMI],
+            starts: ndarray,
+            lengths: ndarray,
+            slot_positions: ndarray,
+            job_positions: ndarray,
+            c: ndarray,
+            A_ub: csr_matrix,
+            b_ub: ndarray,
+    ) -> None:
+        self.jobs = jobs
+        self.starts = starts
+        self.lengths = lengths
+        self.slot_positions = slot_positions
+        self.job_positions = job_positions
+        self.c = c
+        self.A_ub = A_ub
+        self.b_ub = b_ub
+
+
 class LinearProgrammingScheduler(AbstractScheduler):
     """
     Computes an optimal solution for the Active Time Problem with preemption allowed at arbitrary time points. The LP
     used in this scheduler was first escribed in "A model for minimizing active processor time" (Chang et al., 2012).
+
+    With the elementary intervals formulation the time slots between consecutive starts and ends of the execution
+    windows are merged into a single variable with the capacity scaled by the length of the interval, since all time
+    slots of such an interval are interchangeable. The LP then has O(n) time variables and O(n^2) (job, interval)
+    variables regardless of T and has the same optimal value as the time slots formulation. The active time and the
+    work of every job within an elementary interval are packed to its start, and the jobs are laid out with the wrap
+    around rule, so the resulting schedule has the same shape for both formulations.
+
+    Many small job pools can be processed at once with process_batch, which stacks their LPs into a single block
+    diagonal LP and solves it with one solver call. If the stacked LP is infeasible, the infeasible blocks are found
+    with a phase 1 LP that minimizes the violation of the job demands, and the remaining blocks are solved again.
+
+    The solver can be limited in time and in the number of iterations. If a limit is hit before the LP is solved, the
+    schedule computed by GreedyScheduler is returned instead, which is feasible for the LP as well. After processing,
+    the read-only fields primal_bound, lower_bound and objective_gap describe the quality of the returned schedule, the
+    gap is 0 if the LP was solved to optimality and None if the job pool is infeasible. If a limit is hit, the lower
+    bound is the Lagrangian bound given by the dual values of the solver when they are available and the larger of the
+    longest duration and the total work divided by the maximum concurrency otherwise. They are diagnostics of the last
+    call of process rather than a part of the configuration of the scheduler and are not used by the other schedulers,
+    so concurrent calls on a scheduler shared between threads only overwrite each other's diagnostics.
     """
 
     EPS = 1e-7
 
-    def __init__(self, lp_method: LinearProgrammingMethod = LinearProgrammingMethod.HIGHS) -> None:
+    def __init__(
+            self,
+            lp_method: LinearProgrammingMethod = LinearProgrammingMethod.HIGHS,
+            formulation: LinearProgrammingFormulation = LinearProgrammingFormulation.TIME_SLOTS,
+            time_limit: Optional[float] = None,
+            max_iterations: Optional[int] = None,
+            tolerance: Optional[float] = None,
+    ) -> None:
         """
         Initialize the class with parameters.
         :param lp_method: LP method used to solve the LP formulated problem.
+        :param formulation: LP formulation, either over unit time slots or over elementary intervals.
+        :param time_limit: Time limit of a single solver call in seconds, not limited if not provided.
+        :param max_iterations: Iteration limit of a single solver call, not limited if not provided.
+        :param tolerance: Primal and dual feasibility tolerance of the solver, the solver default if not provided.
         """
         self.lp_method = lp_method
+        self.formulation = formulation
+        self.time_limit = time_limit
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+
+        self._primal_bound = None
+        self._lower_bound = None
+        self._objective_gap = None
+
+    @property
+    def primal_bound(self) -> Optional[float]:
+        return self._primal_bound
+
+    @property
+    def lower_bound(self) -> Optional[float]:
+        return self._lower_bound
+
+    @property
+    def objective_gap(self) -> Optional[float]:
+        return self._objective_gap
 
     @staticmethod
     def _create_linear_program(
             max_concurrency: int,
+            durations: ndarray,
+            lengths: ndarray,
+            slot_positions: ndarray,
+            job_positions: ndarray,
+    ) -> Tuple[ndarray, csr_matrix, ndarray]:
+        # Variables are the closed lengths of the time intervals followed by one variable per (job, time interval) pair,
+        # rows are the job demands, the time interval capacities and the (job, time interval) bounds
+        n, m, k = len(durations), len(lengths), len(job_positions)
+
+        c = concatenate([full(m, -1.0), zeros(k)])
+
+        pairs = arange(k)
+        rows = concatenate([job_positions, n + arange(m), n + slot_positions, n + m + pairs, n + m + pairs])
+        columns = concatenate([m + pairs, arange(m), m + pairs, m + pairs, slot_positions])
+        data = concatenate([full(k, -1.0), full(m, float(max_concurrency)), ones(k), ones(k), ones(k)])
+
+        A_ub = coo_matrix((data, (rows, columns)), shape=(n + m + k, m + k)).tocsr()
+        b_ub = concatenate([
+            -asarray(durations, dtype=float64),
+            max_concurrency * asarray(lengths, dtype=float64),
+            asarray(lengths, dtype=float64)[slot_positions],
+        ])
+
+        return c, A_ub, b_ub
+
+    def _get_time_intervals(self, job_pool: Union[JobPoolMI, JobPool]) -> Tuple[TimeSlotIndex, ndarray, ndarray]:
+        if self.formulation == LinearProgrammingFormulation.ELEMENTARY_INTERVALS:
+            columns = job_pool.get_columns()
+            boundaries = unique(concatenate([columns.window_starts, columns.window_ends + 1]))
+            index = TimeSlotIndex(columns, boundaries[:-1])
+            lengths = boundaries[1:] - boundaries[:-1]
+        else:
+            index = job_pool.create_time_slot_index()
+            lengths = ones(len(index.timestamps), dtype=int64)
+
+        return index, index.timestamps, lengths
+
+    def _create_job_schedules(
+            self,
             jobs: List[JobMI],
-            var_counter: int,
-            t_to_var: Dict[int, int],
-            js_to_var: Dict[Tuple[int, int], int],
-    ) -> Tuple[List[int], List[List[int]], List[int]]:
-        c = [0] * var_counter
-        for t_var in t_to_var.values():
-            c[t_var] = -1
+            starts: ndarray,
+            active_lengths: ndarray,
+            slot_positions: ndarray,
+            job_positions: ndarray,
+            x: ndarray,
+    ) -> Iterable[JobScheduleMI]:
+        order = lexsort((job_positions, slot_positions))
+        order = order[x[order] > self.EPS]
 
-        A_ub = []
-        b_ub = []
+        job_execution_intervals = [[] for _ in jobs]
+        previous_slot_position, time_within_interval = None, 0.0
 
-        for job in jobs:
-            A_ub.append([0] * var_counter)
-            b_ub.append(-job.duration)
+        for i, slot_position, x_i in zip(
+                job_positions[order].tolist(),
+                slot_positions[order].tolist(),
+                x[order].tolist(),
+        ):
+            start, active_length = starts[slot_position], active_lengths[slot_position]
 
-            for js, js_var in js_to_var.items():
-                if job.id == js[0]:
-                    A_ub[-1][js_var] = -1
+            if slot_position != previous_slot_position:
+                previous_slot_position, time_within_interval = slot_position, 0.0
 
-        for t, t_var in t_to_var.items():
-            A_ub.append([0] * var_counter)
-            b_ub.append(max_concurrency)
+            time_from = time_within_interval
+            time_to = time_within_interval + min(x_i, active_length)
 
-            A_ub[-1][t_var] = max_concurrency
+            if time_to > active_length + self.EPS:
+                job_execution_intervals[i].append(TimeInterval(start, start + time_to - active_length))
+                job_execution_intervals[i].append(TimeInterval(start + time_from, start + active_length))
+                time_within_interval = time_to - active_length
+            else:
+                job_execution_intervals[i].append(TimeInterval(start + time_from, start + time_to))
+                time_within_interval = time_to if time_to < active_length - self.EPS else 0.0
 
-            for js, js_var in js_to_var.items():
-                if t == js[1]:
-                    A_ub[-1][js_var] = 1
+        for job, execution_intervals in zip(jobs, job_execution_intervals):
+            yield JobScheduleMI(job, sorted(execution_intervals))
 
-        for js, js_var in js_to_var.items():
-            A_ub.append([0] * var_counter)
-            b_ub.append(1)
+    def _prepare_linear_program(
+            self,
+            job_pool: Union[JobPoolMI, JobPool],
+            max_concurrency: int,
+    ) -> Optional[_LinearProgram]:
+        index, starts, lengths = self._get_time_intervals(job_pool)
+        jobs = index.jobs
 
-            A_ub[-1][js_var] = 1
+        slots, job_positions = index.incidence()
+        interval_positions, slot_positions = unique(searchsorted(starts, slots), return_inverse=True)
+        starts, lengths = starts[interval_positions], lengths[interval_positions]
 
-            _, t = js
+        if len(starts) == 0:
+            return None
 
-            A_ub[-1][t_to_var[t]] = 1
+        durations = index.columns.durations
+        c, A_ub, b_ub = self._create_linear_program(max_concurrency, durations, lengths, slot_positions, job_positions)
 
-        return c, A_ub, b_ub
+        return _LinearProgram(jobs, starts, lengths, slot_positions, job_positions, c, A_ub, b_ub)
 
-    def _create_job_schedules(
+    def _create_schedule(self, linear_program: _LinearProgram, x: ndarray) -> Schedule:
+        number_of_intervals = len(linear_program.starts)
+
+        active_lengths = (linear_program.lengths - x[:number_of_intervals]).clip(0, linear_program.lengths)
+        starts = linear_program.starts.tolist()
+
+        return Schedule(
+            True,
+            [
+                TimeInterval(start, start + active_length)
+                for start, active_length in zip(starts, active_lengths.tolist()) if active_length > self.EPS
+            ],
+            list(self._create_job_schedules(
+                linear_program.jobs,
+                starts,
+                active_lengths.tolist(),
+                linear_program.slot_positions,
+                linear_program.job_positions,
+                x[number_of_intervals:],
+            )),
+        )
+
+    def _get_options(self) -> Dict[str, Any]:
+        options = {}
+
+        if self.max_iterations is not None:
+            options['maxiter'] = self.max_iterations
+
+        if self.lp_method.startswith('highs'):
+            if self.time_limit is not None:
+                options['time_limit'] = self.time_limit
+            if self.tolerance is not None:
+                options['primal_feasibility_tolerance'] = self.tolerance
+                options['dual_feasibility_tolerance'] = self.tolerance
+        elif self.tolerance is not None:
+            options['tol'] = self.tolerance
+
+        return options
+
+    def _solve(self, c: ndarray, A_ub: csr_matrix, b_ub: ndarray) -> OptimizeResult:
+        with warnings.catch_warnings():
+            # Disable precision warnings from old SciPy solvers
+            warnings.simplefilter('ignore', LinAlgWarning)
+            warnings.simplefilter('ignore', OptimizeWarning)
+
+            return linprog(c, A_ub=A_ub, b_ub=b_ub, method=self.lp_method, options=self._get_options())
+
+    @classmethod
+    def _get_objective_gap(cls, primal_bound: Optional[float], lower_bound: Optional[float]) -> Optional[float]:
+        if primal_bound is None:
+            return None
+        return (primal_bound - lower_bound) / primal_bound if primal_bound > cls.EPS else 0.0
+
+    def _set_bounds(self, primal_bound: Optional[float], lower_bound: Optional[float]) -> None:
+        self._primal_bound = primal_bound
+        self._lower_bound = lower_bound
+        self._objective_gap = self._get_objective_gap(primal_bound, lower_bound)
+
+    def _get_linear_program_bound(self, linear_program: _LinearProgram, result: OptimizeResult) -> Optional[float]:
+        if result.status == 0:
+            return float(linear_program.lengths.sum() + result.fun)
+
+        marginals = getattr(getattr(result, 'ineqlin', None), 'marginals', None)
+
+        if marginals is None or len(marginals) != len(linear_program.b_ub):
+            return None
+
+        # Any non-negative multipliers of the rows give the Lagrangian bound, the variables are bounded by the lengths
+        # of their time intervals through the capacity and the (job, time interval) rows
+        y = (-asarray(marginals, dtype=float64)).clip(0)
+        reduced_costs = linear_program.c + linear_program.A_ub.T @ y
+        upper_bounds = concatenate([linear_program.lengths, linear_program.lengths[linear_program.slot_positions]])
+
+        return float(
+            linear_program.lengths.sum() - linear_program.b_ub @ y + (reduced_costs.clip(max=0) * upper_bounds).sum()
+        )
+
+    def _create_anytime_schedule(
             self,
-            jobs: List[JobMI],
-            js_to_var: Dict[Tuple[int, int], int],
-            optimize_result: OptimizeResult,
-    ) -> Iterable[JobScheduleMI]:
-        for job in jobs:
-            job_schedule = JobScheduleMI(job, [])
+            job_pool: Union[JobPoolMI, JobPool],
+            max_concurrency: int,
+            linear_program: Optional[_LinearProgram],
+            result: Optional[OptimizeResult],
+    ) -> Tuple[Schedule, Optional[float], Optional[float]]:
+        durations = job_pool.get_columns().durations
+        lower_bound = max(int(durations.max(initial=0)), int(durations.sum()) / max_concurrency)
+
+        if linear_program is not None and result is not None:
+            linear_program_bound = self._get_linear_program_bound(linear_program, result)
+
+            if linear_program_bound is not None:
+                lower_bound = max(lower_bound, linear_program_bound)
+
+        if (
+                linear_program is not None
+                and result is not None
+                and result.x is not None
+                and (linear_program.A_ub @ result.x <= linear_program.b_ub + self.EPS).all()
+                and (result.x >= -self.EPS).all()
+        ):
+            schedule = self._create_schedule(linear_program, result.x)
+        else:
+            schedule = GreedyScheduler().process(job_pool, max_concurrency)
+
+            if schedule.all_jobs_scheduled is False:
+                return schedule, None, None
+
+            schedule = Schedule(
+                True,
+                [TimeInterval(t, t + 1) for interval in schedule.active_time_intervals for t in interval],
+                [
+                    JobScheduleMI(job_schedule.job, [
+                        TimeInterval(t, t + 1) for interval in job_schedule.execution_intervals for t in interval
+                    ])
+                    for job_schedule in schedule.job_schedules
+                ],
+            )
+
+        active_time = sum(interval.end - interval.start for interval in schedule.active_time_intervals)
+
+        return schedule, active_time, min(lower_bound, active_time)
 
-            for interval in job.availability_intervals:
-                for t in range(interval.start, interval.end + 1):
-                    if (job.id, t) in js_to_var and optimize_result.x[js_to_var[(job.id, t)]] > self.EPS:
-                        job_schedule.execution_intervals.append(
-                            TimeInterval(t, t + optimize_result.x[js_to_var[(job.id, t)]])
-                        )
+    def _solve_stacked(self, linear_programs: List[_LinearProgram]) -> Optional[List[ndarray]]:
+        result = self._solve(
+            concatenate([linear_program.c for linear_program in linear_programs]),
+            block_diag([linear_program.A_ub for linear_program in linear_programs], format='csr'),
+            concatenate([linear_program.b_ub for linear_program in linear_programs]),
+        )
+
+        if result.status != 0:
+            return None
+
+        offsets = cumsum([len(linear_program.c) for linear_program in linear_programs])[:-1]
 
-            yield job_schedule
+        return split(result.x, offsets)
+
+    def _find_feasible(self, linear_programs: List[_LinearProgram]) -> List[bool]:
+        # Every job demand row gets a slack variable and the total slack is minimized, a block is feasible if and only
+        # if its slack can be reduced to zero
+        blocks = []
+
+        for linear_program in linear_programs:
+            n, (rows, _) = len(linear_program.jobs), linear_program.A_ub.shape
+            slack = coo_matrix((full(n, -1.0), (arange(n), arange(n))), shape=(rows, n))
+            blocks.append(hstack([linear_program.A_ub, slack]))
+
+        result = self._solve(
+            concatenate([
+                concatenate([zeros(len(linear_program.c)), ones(len(linear_program.jobs))])
+                for linear_program in linear_programs
+            ]),
+            block_diag(blocks, format='csr'),
+            concatenate([linear_program.b_ub for linear_program in linear_programs]),
+        )
+
+        if result.status != 0:
+            return [True] * len(linear_programs)
+
+        offsets = cumsum([len(linear_program.c) + len(linear_program.jobs) for linear_program in linear_programs])
+        feasible = []
+
+        for linear_program, offset in zip(linear_programs, offsets.tolist()):
+            slack = result.x[offset - len(linear_program.jobs):offset]
+            feasible.append(bool(slack.sum() <= self.EPS * max(1, len(slack))))
+
+        return feasible
+
+    def _process_with_bounds(
+            self,
+            job_pool: Union[JobPoolMI, JobPool],
+            max_concurrency: int,
+    ) -> Tuple[Schedule, Optional[float], Optional[float]]:
+        if job_pool.size == 0:
+            return Schedule(True, [], []), 0.0, 0.0
+
+        linear_program = self._prepare_linear_program(job_pool, max_concurrency)
+
+        if linear_program is None:
+            return Schedule(True, [], []), 0.0, 0.0
+
+        result = self._solve(linear_program.c, linear_program.A_ub, linear_program.b_ub)
+
+        if result.status == 2:
+            return Schedule(False, None, None), None, None
+
+        if result.status != 0:
+            return self._create_anytime_schedule(job_pool, max_concurrency, linear_program, result)
+
+        active_time = float(linear_program.lengths.sum() + result.fun)
+
+        return self._create_schedule(linear_program, result.x), active_time, active_time
 
     def process(self, job_pool: Union[JobPoolMI, JobPool], max_concurrency: int) -> Schedule:
         """
@@ -109,46 +452,478 @@ class LinearProgrammingScheduler(AbstractScheduler):
         :param max_concurrency: Maximum number of jobs allowed to run concurrently.
         :return: Computed schedule with preemption allowed at arbitrary points.
         """
-        if job_pool.size == 0:
-            return Schedule(True, [], [])
+        schedule, primal_bound, lower_bound = self._process_with_bounds(job_pool, max_concurrency)
+        self._set_bounds(primal_bound, lower_bound)
 
-        # Disable precision warnings from old SciPy solvers
-        warnings.simplefilter('ignore', LinAlgWarning)
-        warnings.simplefilter('ignore', OptimizeWarning)
+        return schedule
 
-        var_counter = 0
+    def process_batch(self, job_pools: List[Union[JobPoolMI, JobPool]], max_concurrency: int) -> List[Schedule]:
+        """
+        Computes the optimal schedules for many independent job pools with a single LP solve.
+        :param job_pools: Job pools of jobs with arbitrary number of intervals.
+        :param max_concurrency: Maximum number of jobs allowed to run concurrently.
+        :return: Computed schedules in the order of the job pools.
+        """
+        schedules = [Schedule(True, [], []) for _ in job_pools]
+        linear_programs = {}
 
-        t_to_var = {}
-        js_to_var = {}
+        for i, job_pool in enumerate(job_pools):
+            if job_pool.size != 0:
+                linear_program = self._prepare_linear_program(job_pool, max_concurrency)
 
-        for job in job_pool.jobs:
-            for interval in job.availability_intervals:
-                for t in range(interval.start, interval.end + 1):
-                    if t not in t_to_var:
-                        t_to_var[t] = var_counter
-                        var_counter += 1
-                    js_to_var[(job.id, t)] = var_counter
-                    var_counter += 1
+                if linear_program is not None:
+                    linear_programs[i] = linear_program
 
-        c, A_ub, b_ub = self._create_linear_program(max_concurrency, job_pool.jobs, var_counter, t_to_var, js_to_var)
+        if len(linear_programs) == 0:
+            return schedules
 
-        if len(c) == 0:
-            return Schedule(True, [], [])
+        solutions = self._solve_stacked(list(linear_programs.values()))
+
+        if solutions is None:
+            for (i, linear_program), feasible in zip(
+                    list(linear_programs.items()),
+                    self._find_feasible(list(linear_programs.values())),
+            ):
+                if feasible is False:
+                    schedules[i] = Schedule(False, None, None)
+                    linear_programs.pop(i)
+
+            if len(linear_programs) == 0:
+                return schedules
+
+            solutions = self._solve_stacked(list(linear_programs.values()))
+
+        if solutions is None:
+            for i in linear_programs:
+                schedules[i] = self.process(job_pools[i], max_concurrency)
+        else:
+            for (i, linear_program), x in zip(linear_programs.items(), solutions):
+                schedules[i] = self._create_schedule(linear_program, x)
+
+        return schedules
+
+
+class _HighsLinearProgram(object):
+    """
+    Time slots LP of LinearProgrammingModel kept in HiGHS between solves. Adding or removing jobs only adds or deletes
+    their own rows and columns together with the time slots no other job covers, so HiGHS keeps the basis of the
+    previous solve and starts the next one from it. Unlike the LP of LinearProgrammingScheduler, the variables are the
+    open lengths of the time slots with cost 1, so the columns of new time slots start at zero with a non-negative
+    cost and added jobs keep the basis dual feasible, hence the LP is re-solved with the dual simplex method. If jobs
+    were only removed, the previous solution stays primal feasible and the primal simplex method is used instead.
+    """
+
+    def __init__(self, max_concurrency: int, scheduler: 'LinearProgrammingScheduler') -> None:
+        self.max_concurrency = max_concurrency
+
+        self.highs = Highs()
+        self.highs.setOptionValue('output_flag', False)
+        self.highs.setOptionValue('solver', 'simplex')
+        self.highs.setOptionValue('presolve', 'off')
+
+        if scheduler.time_limit is not None:
+            self.highs.setOptionValue('time_limit', float(scheduler.time_limit))
+        if scheduler.max_iterations is not None:
+            self.highs.setOptionValue('simplex_iteration_limit', int(scheduler.max_iterations))
+        if scheduler.tolerance is not None:
+            self.highs.setOptionValue('primal_feasibility_tolerance', float(scheduler.tolerance))
+            self.highs.setOptionValue('dual_feasibility_tolerance', float(scheduler.tolerance))
+
+        # Job and time slot of every column and row, the job is -1 for the open lengths and the capacity rows
+        self._column_jobs = zeros(0, dtype=int64)
+        self._column_timestamps = zeros(0, dtype=int64)
+        self._row_jobs = zeros(0, dtype=int64)
+        self._row_timestamps = zeros(0, dtype=int64)
+        self._jobs_added = False
+
+    def _find_time_slots(self, timestamps: ndarray) -> Tuple[ndarray, ndarray]:
+        columns = flatnonzero(self._column_jobs == -1)
+        columns = columns[argsort(self._column_timestamps[columns])]
+        rows = flatnonzero(self._row_jobs == -1)
+        rows = rows[argsort(self._row_timestamps[rows])]
+
+        positions = searchsorted(self._column_timestamps[columns], timestamps)
+
+        return columns[positions], rows[positions]
+
+    def add_jobs(self, job_ids: List[int], job_timestamps: List[ndarray], durations: List[int]) -> None:
+        """
+        Add the rows and columns of the jobs to the LP.
+        :param job_ids: IDs of the jobs.
+        :param job_timestamps: Time slots of every job in increasing order.
+        :param durations: Durations of the jobs.
+        """
+        if len(job_ids) == 0:
+            return
+
+        self._jobs_added = True
+
+        n = len(job_ids)
+        counts = array([len(timestamps) for timestamps in job_timestamps], dtype=int64)
+        timestamps = concatenate(job_timestamps + [zeros(0, dtype=int64)])
+
+        new_timestamps = setdiff1d(timestamps, self._column_timestamps[self._column_jobs == -1])
+        m, columns = len(new_timestamps), self.highs.getNumCol() + arange(len(new_timestamps))
 
-        result = linprog(c, A_ub=A_ub, b_ub=b_ub, method=self.lp_method)
+        self.highs.addCols(
+            m,
+            ones(m),
+            zeros(m),
+            ones(m),
+            0,
+            zeros(m, dtype=int32),
+            zeros(0, dtype=int32),
+            zeros(0),
+        )
+        self.highs.addRows(
+            m,
+            full(m, -inf),
+            zeros(m),
+            m,
+            arange(m, dtype=int32),
+            columns.astype(int32),
+            full(m, -float(self.max_concurrency)),
+        )
+
+        self._column_jobs = concatenate([self._column_jobs, full(m, -1)])
+        self._column_timestamps = concatenate([self._column_timestamps, new_timestamps])
+        self._row_jobs = concatenate([self._row_jobs, full(m, -1)])
+        self._row_timestamps = concatenate([self._row_timestamps, new_timestamps])
+
+        slot_columns, slot_rows = self._find_time_slots(timestamps)
+        k, pair_columns = len(timestamps), self.highs.getNumCol() + arange(len(timestamps))
+
+        self.highs.addCols(
+            k,
+            zeros(k),
+            zeros(k),
+            full(k, inf),
+            k,
+            arange(k, dtype=int32),
+            slot_rows.astype(int32),
+            ones(k),
+        )
+
+        # The job demands are followed by the (job, time slot) bounds
+        starts = concatenate([cumsum(counts) - counts, k + 2 * arange(k)])
+        indices = concatenate([pair_columns, stack([pair_columns, slot_columns], axis=1).ravel()])
+
+        self.highs.addRows(
+            n + k,
+            concatenate([asarray(durations, dtype=float64), full(k, -inf)]),
+            concatenate([full(n, inf), zeros(k)]),
+            len(indices),
+            starts.astype(int32),
+            indices.astype(int32),
+            concatenate([ones(counts.sum()), tile([1.0, -1.0], k)]),
+        )
+
+        self._column_jobs = concatenate([self._column_jobs, repeat(job_ids, counts)])
+        self._column_timestamps = concatenate([self._column_timestamps, timestamps])
+        self._row_jobs = concatenate([self._row_jobs, asarray(job_ids, dtype=int64), repeat(job_ids, counts)])
+        self._row_timestamps = concatenate([self._row_timestamps, full(n, -1), timestamps])
+
+    def remove_jobs(self, job_ids: List[int]) -> None:
+        """
+        Delete the rows and columns of the jobs from the LP together with the time slots no other job covers.
+        :param job_ids: IDs of the jobs.
+        """
+        if len(job_ids) == 0:
+            return
+
+        columns = isin(self._column_jobs, job_ids)
+        rows = isin(self._row_jobs, job_ids)
+
+        slots = self._column_jobs == -1
+        unused_timestamps = setdiff1d(self._column_timestamps[slots], self._column_timestamps[~slots & ~columns])
+        columns |= slots & isin(self._column_timestamps, unused_timestamps)
+        rows |= (self._row_jobs == -1) & isin(self._row_timestamps, unused_timestamps)
+
+        self.highs.deleteRows(int(rows.sum()), flatnonzero(rows).astype(int32))
+        self.highs.deleteCols(int(columns.sum()), flatnonzero(columns).astype(int32))
+
+        self._column_jobs, self._column_timestamps = self._column_jobs[~columns], self._column_timestamps[~columns]
+        self._row_jobs, self._row_timestamps = self._row_jobs[~rows], self._row_timestamps[~rows]
+
+    def solve(self) -> int:
+        """
+        Solve the LP starting from the basis of the previous solve.
+        :return: Status of the solver as in scipy.optimize.linprog.
+        """
+        self.highs.setOptionValue('simplex_strategy', 1 if self._jobs_added is True else 4)
+        self._jobs_added = False
+
+        self.highs.run()
+
+        return {
+            HighsModelStatus.kOptimal: 0,
+            HighsModelStatus.kIterationLimit: 1,
+            HighsModelStatus.kTimeLimit: 1,
+            HighsModelStatus.kInfeasible: 2,
+            HighsModelStatus.kUnboundedOrInfeasible: 2,
+        }.get(self.highs.getModelStatus(), 4)
+
+    def get_solution(self) -> Tuple[ndarray, ndarray, ndarray, Dict[int, ndarray]]:
+        """
+        Get the last solution of the LP.
+        :return: Time slots in increasing order, their closed lengths and loads, and the work of every job at its time
+        slots.
+        """
+        x = asarray(self.highs.getSolution().col_value, dtype=float64)
+
+        slots = flatnonzero(self._column_jobs == -1)
+        slots = slots[argsort(self._column_timestamps[slots])]
+        timestamps = self._column_timestamps[slots]
+
+        # The columns of a job are contiguous and ordered by time slot, since deleting columns keeps the order
+        pairs = flatnonzero(self._column_jobs != -1)
+        job_ids, offsets = unique(self._column_jobs[pairs], return_index=True)
+        order = argsort(offsets)
+        job_ids, offsets = job_ids[order], offsets[order]
+
+        load = bincount(
+            searchsorted(timestamps, self._column_timestamps[pairs]),
+            x[pairs],
+            minlength=len(timestamps),
+        )
+
+        return timestamps, 1 - x[slots], load, dict(zip(job_ids.tolist(), split(x[pairs], offsets[1:])))
+
+
+class LinearProgrammingModel(object):
+    """
+    Persistent time slots LP of LinearProgrammingScheduler tied to a job pool, meant for job pools that change by a few
+    jobs between solves. The model keeps the time slots of every job and the last solution, and synchronizes with the
+    job pool on every solve, so the jobs can be added and removed either through the model or directly in the job pool.
+    Jobs must not be modified in place. The LP is only re-solved if the last solution cannot be kept: a new job that
+    fits into the spare capacity of the open time slots within its windows is assigned to them directly, since adding
+    a job never decreases the optimal active time, and adding a job to an infeasible job pool keeps it infeasible.
+    With the HiGHS and HiGHS dual simplex methods the LP is kept in HiGHS through highspy: a changed job only adds or
+    deletes its own rows and columns, and the LP is re-solved from the previous basis, see _HighsLinearProgram. The
+    other methods solve the LP from scratch with SciPy whenever it has to be re-solved.
+    """
+
+    def __init__(
+            self,
+            job_pool: Union[JobPoolMI, JobPool],
+            max_concurrency: int,
+            scheduler: Optional[LinearProgrammingScheduler] = None,
+    ) -> None:
+        """
+        Initialize the class with parameters.
+        :param job_pool: Job pool of jobs with arbitrary number of intervals.
+        :param max_concurrency: Maximum number of jobs allowed to run concurrently.
+        :param scheduler: Scheduler whose LP method and solver limits are used, the default scheduler if not provided.
+        If a limit is hit, the model returns the anytime schedule of the scheduler and solves the LP again next time.
+        """
+        self.job_pool = job_pool
+        self.max_concurrency = max_concurrency
+        self.scheduler = scheduler if scheduler is not None else LinearProgrammingScheduler()
+        self.number_of_solves = 0
+
+        self._jobs = {}
+        self._job_timestamps = {}
+        self._job_work = {}
+
+        if self.scheduler.lp_method in (LinearProgrammingMethod.HIGHS, LinearProgrammingMethod.HIGHS_DS):
+            self._linear_program = _HighsLinearProgram(max_concurrency, self.scheduler)
+        else:
+            self._linear_program = None
+
+        self._feasible = True
+        self._is_solved = False
+        self._timestamps = zeros(0, dtype=int64)
+        self._closed = zeros(0)
+        self._load = zeros(0)
+        self._schedule = None
+
+    def add_job(self, *args) -> int:
+        """
+        Add a job to the job pool.
+        :param args: Arguments of the add_job function of the job pool.
+        :return: The ID of the job.
+        """
+        return self.job_pool.add_job(*args)
+
+    def remove_job(self, job_id: int) -> None:
+        """
+        Remove a job from the job pool.
+        :param job_id: The ID of the job to remove.
+        """
+        self.job_pool.remove_job(job_id)
+
+    def _insert(self, job: JobMI) -> None:
+        timestamps = unique([t for interval in job.availability_intervals for t in interval]).astype(int64)
+
+        self._jobs[job.id] = job
+        self._job_timestamps[job.id] = timestamps
+        self._schedule = None
+
+        if self._is_solved is False or self._feasible is False:
+            return
+
+        positions = searchsorted(self._timestamps, timestamps)
+        known = positions < len(self._timestamps)
+        known[known] = self._timestamps[positions[known]] == timestamps[known]
+        positions = positions[known]
+
+        open_lengths = 1 - self._closed[positions]
+        spare = zeros(len(timestamps))
+        spare[known] = minimum(open_lengths, self.max_concurrency * open_lengths - self._load[positions]).clip(0)
+
+        if spare.sum() < job.duration - self.scheduler.EPS:
+            self._is_solved = False
+            return
+
+        work = (job.duration - (cumsum(spare) - spare)).clip(0, spare)
+
+        self._job_work[job.id] = work
+        self._load[positions] += work[known]
+
+    def _erase(self, job: JobMI) -> None:
+        self._jobs.pop(job.id)
+        self._job_timestamps.pop(job.id)
+        self._job_work.pop(job.id, None)
+
+        self._is_solved = False
+        self._schedule = None
+
+    def _synchronize(self) -> None:
+        jobs = self.job_pool.jobs
+
+        removed_job_ids = [job_id for job_id, job in self._jobs.items() if job not in jobs]
+        added_jobs = [job for job in jobs if job.id not in self._jobs]
+
+        for job_id in removed_job_ids:
+            self._erase(self._jobs[job_id])
+
+        for job in added_jobs:
+            self._insert(job)
+
+        if self._linear_program is not None:
+            self._linear_program.remove_jobs(removed_job_ids)
+            self._linear_program.add_jobs(
+                [job.id for job in added_jobs],
+                [self._job_timestamps[job.id] for job in added_jobs],
+                [job.duration for job in added_jobs],
+            )
+
+    def _solve_from_scratch(self) -> Tuple[int, Optional[Tuple[ndarray, ndarray, ndarray, Dict[int, ndarray]]]]:
+        jobs = list(self._jobs.values())
+        job_timestamps = [self._job_timestamps[job.id] for job in jobs]
+
+        slots = concatenate(job_timestamps + [zeros(0, dtype=int64)])
+        job_positions = repeat(arange(len(jobs)), [len(timestamps) for timestamps in job_timestamps])
+        unique_timestamps, slot_positions = unique(slots, return_inverse=True)
+
+        c, A_ub, b_ub = self.scheduler._create_linear_program(
+            self.max_concurrency,
+            array([job.duration for job in jobs], dtype=int64),
+            ones(len(unique_timestamps), dtype=int64),
+            slot_positions,
+            job_positions,
+        )
+
+        result = self.scheduler._solve(c, A_ub, b_ub)
 
         if result.status != 0:
+            return result.status, None
+
+        x = result.x[len(unique_timestamps):]
+        offsets = cumsum([len(timestamps) for timestamps in job_timestamps])[:-1]
+
+        return 0, (
+            unique_timestamps,
+            result.x[:len(unique_timestamps)],
+            bincount(slot_positions, x, minlength=len(unique_timestamps)),
+            {job.id: work for job, work in zip(jobs, split(x, offsets))},
+        )
+
+    def _solve(self) -> None:
+        self._is_solved = True
+        self._feasible = True
+
+        if len(self._jobs) == 0:
+            self._timestamps, self._closed, self._load = zeros(0, dtype=int64), zeros(0), zeros(0)
+            return
+
+        if self._linear_program is not None:
+            status = self._linear_program.solve()
+            solution = self._linear_program.get_solution() if status == 0 else None
+        else:
+            status, solution = self._solve_from_scratch()
+
+        self.number_of_solves += 1
+
+        if status not in (0, 2):
+            self._is_solved = False
+            return
+
+        self._feasible = bool(status == 0)
+
+        if self._feasible is False:
+            return
+
+        self._timestamps, self._closed, self._load, job_work = solution
+        self._job_work.update(job_work)
+
+    def _create_schedule(self) -> Schedule:
+        if self._feasible is False:
             return Schedule(False, None, None)
 
-        return Schedule(
-            True,
-            list(sorted(filter(
-                lambda x: x.end - x.start > self.EPS,
-                [TimeInterval(t, t + 1 - result.x[t_var]) for t, t_var in t_to_var.items()]
-            ))),
-            list(self._create_job_schedules(job_pool.jobs, js_to_var, result)),
+        if len(self._jobs) == 0:
+            return Schedule(True, [], [])
+
+        jobs = list(self._jobs.values())
+        job_timestamps = [self._job_timestamps[job.id] for job in jobs]
+
+        # Time slots that are not in the model yet only appear in the jobs added without re-solving, and their work at
+        # such time slots is zero, so they are dropped together with the other zero work pairs
+        linear_program = _LinearProgram(
+            jobs,
+            self._timestamps,
+            ones(len(self._timestamps), dtype=int64),
+            searchsorted(self._timestamps, concatenate(job_timestamps)),
+            repeat(arange(len(jobs)), [len(timestamps) for timestamps in job_timestamps]),
+            None,
+            None,
+            None,
         )
 
+        return self.scheduler._create_schedule(
+            linear_program,
+            concatenate([self._closed] + [self._job_work[job.id] for job in jobs]),
+        )
+
+    def _solve_with_bounds(self) -> Tuple[Schedule, Optional[float], Optional[float]]:
+        self._synchronize()
+
+        if self._is_solved is False:
+            self._solve()
+
+        if self._is_solved is False:
+            return self.scheduler._create_anytime_schedule(self.job_pool, self.max_concurrency, None, None)
+
+        if self._schedule is None:
+            self._schedule = self._create_schedule()
+
+        if self._schedule.all_jobs_scheduled is False:
+            return self._schedule, None, None
+
+        active_time = sum(interval.end - interval.start for interval in self._schedule.active_time_intervals)
+
+        return self._schedule, active_time, active_time
+
+    def solve(self) -> Schedule:
+        """
+        Synchronize the model with the job pool and compute the optimal schedule.
+        :return: Computed schedule with preemption allowed at arbitrary points.
+        """
+        schedule, primal_bound, lower_bound = self._solve_with_bounds()
+        self.scheduler._set_bounds(primal_bound, lower_bound)
+
+        return schedule
+
 
 class LinearProgrammingRoundedScheduler(GreedyScheduler):
     """
@@ -161,9 +936,69 @@ class LinearProgrammingRoundedScheduler(GreedyScheduler):
             self,
             lp_method: LinearProgrammingMethod = LinearProgrammingMethod.HIGHS,
             flow_method: FlowMethod = FlowMethod.PREFLOW_PUSH,
+            formulation: LinearProgrammingFormulation = LinearProgrammingFormulation.TIME_SLOTS,
+            reuse_model: bool = False,
+            time_limit: Optional[float] = None,
+            max_iterations: Optional[int] = None,
+            tolerance: Optional[float] = None,
     ) -> None:
+        """
+        Initialize the class with parameters.
+        :param lp_method: LP method used to solve the LP formulated problem.
+        :param flow_method: Method used to compute the maximum flow.
+        :param formulation: LP formulation, either over unit time slots or over elementary intervals.
+        :param reuse_model: Whether to keep a LinearProgrammingModel for the last processed job pool and reuse it when
+        the same job pool is processed again, e.g. after adding or removing a few jobs. Implies the time slots
+        formulation.
+        :param time_limit: Time limit of a single LP solver call in seconds, not limited if not provided.
+        :param max_iterations: Iteration limit of a single LP solver call, not limited if not provided.
+        :param tolerance: Primal and dual feasibility tolerance of the LP solver, the solver default if not provided.
+        """
         super(LinearProgrammingRoundedScheduler, self).__init__(flow_method)
-        self.linear_programming_scheduler = LinearProgrammingScheduler(lp_method)
+        self.linear_programming_scheduler = LinearProgrammingScheduler(
+            lp_method,
+            formulation,
+            time_limit,
+            max_iterations,
+            tolerance,
+        )
+        self.reuse_model = reuse_model
+
+        self._model = None
+
+    def _solve_linear_program(
+            self,
+            job_pool: JobPool,
+            max_concurrency: int,
+    ) -> Tuple[Schedule, Optional[float], Optional[float]]:
+        if self.reuse_model is False:
+            return self.linear_programming_scheduler._process_with_bounds(job_pool, max_concurrency)
+
+        if (
+                self._model is None
+                or self._model.job_pool is not job_pool
+                or self._model.max_concurrency != max_concurrency
+        ):
+            self._model = LinearProgrammingModel(job_pool, max_concurrency, self.linear_programming_scheduler)
+
+        return self._model._solve_with_bounds()
+
+    @staticmethod
+    def _round(job_pool: JobPool, active_time_intervals: List[TimeInterval]) -> List[TimeInterval]:
+        # Fractional active time that ends within (previous deadline, deadline] is rounded up and opened right before
+        # the deadline
+        deadlines = unique(job_pool.get_columns().deadlines + 1)
+
+        ends = array([interval.end for interval in active_time_intervals], dtype=float64)
+        lengths = ends - array([interval.start for interval in active_time_intervals], dtype=float64)
+
+        counts = ceil(bincount(searchsorted(deadlines, ends), lengths, minlength=len(deadlines) + 1)[:-1]).astype(int64)
+        mask = counts > 0
+
+        return TimeInterval.merge_time_intervals([
+            TimeInterval(start, end)
+            for start, end in zip((deadlines - counts)[mask].tolist(), (deadlines - 1)[mask].tolist())
+        ])
 
     def process(self, job_pool: JobPool, max_concurrency: int) -> Schedule:
         """
@@ -172,40 +1007,32 @@ class LinearProgrammingRoundedScheduler(GreedyScheduler):
         :param max_concurrency: Maximum number of jobs allowed to run concurrently.
         :return: Computed schedule.
         """
-        schedule = self.linear_programming_scheduler.process(job_pool, max_concurrency)
+        schedule, primal_bound, lower_bound = self._solve_linear_program(job_pool, max_concurrency)
 
         if schedule.all_jobs_scheduled is False:
             return Schedule(False, None, None)
 
-        deadlines = set([max([interval.end for interval in job.availability_intervals]) + 1 for job in job_pool.jobs])
-
-        i = 0
-        active_timestamps = set()
-
-        for deadline in sorted(deadlines):
-            duration_sum = 0
-
-            while i < len(schedule.active_time_intervals) and schedule.active_time_intervals[i].end <= deadline:
-                duration_sum += (schedule.active_time_intervals[i].end - schedule.active_time_intervals[i].start)
-                i += 1
+        if LinearProgrammingScheduler._get_objective_gap(primal_bound, lower_bound) != 0:
+            # The rounding relies on an optimal LP solution, fall back to the greedy 2-approximation
+            return super(LinearProgrammingRoundedScheduler, self).process(job_pool, max_concurrency)
 
-            for t in range(deadline - 1, deadline - 1 - math.ceil(duration_sum), -1):
-                active_timestamps.add(t)
+        active_time_intervals = self._round(job_pool, schedule.active_time_intervals)
 
-        if len(active_timestamps) == 0:
+        if len(active_time_intervals) == 0:
             return Schedule(True, [], [JobScheduleMI(job, []) for job in job_pool.jobs])
 
-        max_t = max(active_timestamps) + 1
-        graph = self._create_initial_graph(max_concurrency, max_t, job_pool.jobs)
+        starts = array([interval.start for interval in active_time_intervals], dtype=int64)
+        counts = array([interval.duration for interval in active_time_intervals], dtype=int64)
+        timestamps = arange(counts.sum()) - repeat(cumsum(counts) - counts, counts) + repeat(starts, counts)
 
-        for t in range(max_t):
-            if t in active_timestamps:
-                self._open_time_slot(t, job_pool.jobs, graph)
+        index = job_pool.create_time_slot_index(timestamps)
+        oracle = EarliestDeadlineFirstOracle(index, max_concurrency)
 
-        _, flow_dict = maximum_flow(graph, 0, 1 + len(job_pool.jobs) + max_t, flow_func=self.flow_func)  # noqa
+        if oracle.is_feasible() is False:
+            return super(LinearProgrammingRoundedScheduler, self).process(job_pool, max_concurrency)
 
         return Schedule(
             True,
-            TimeInterval.merge_timestamps(active_timestamps),
-            list(GreedyScheduler._create_job_schedules(job_pool.jobs, flow_dict)),
+            active_time_intervals,
+            list(self._create_job_schedules(index.jobs, oracle.get_assignment())),
         )
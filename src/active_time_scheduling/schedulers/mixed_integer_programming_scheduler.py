@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+import warnings
+from math import ceil
+from numpy import concatenate, flatnonzero, full, int64, ones, unique, zeros
+from scipy.optimize import Bounds, LinearConstraint, OptimizeWarning, milp
+from scipy.sparse import coo_matrix, vstack
+from typing import Optional, Union
+
+from ..models import JobPool, JobPoolMI, Schedule, TimeInterval
+from . import FeasibilityMethod, FlowMethod, GreedyScheduler, LinearProgrammingScheduler
+
+
+class MixedIntegerProgrammingScheduler(GreedyScheduler):
+    """
+    Computes an optimal integral solution for jobs with arbitrary durations and any number of execution windows. The
+    model is the time indexed LP of LinearProgrammingScheduler with the closed time slot variables restricted to 0 or 1,
+    the (job, time slot) variables stay continuous since the assignment polytope is integral once the open time slots
+    are fixed. The model is solved by the HiGHS branch and bound through scipy.optimize.milp. The schedule computed by
+    GreedyScheduler is used as the incumbent, for jobs with several execution windows GreedyScheduler is run as a plain
+    heuristic. The active time of the incumbent bounds the objective by an additional constraint and the incumbent is
+    returned if the solver does not find a better solution within the limits. The final assignment of the jobs to
+    the open time slots is computed with the feasibility oracle of GreedyScheduler. After processing, the read-only
+    fields primal_bound, lower_bound and objective_gap describe the quality of the returned schedule. Like
+    saved_feasibility_checks they are diagnostics of the last call of process, not a part of the configuration.
+    """
+
+    EPS = 1e-7
+
+    def __init__(
+            self,
+            flow_method: FlowMethod = FlowMethod.PREFLOW_PUSH,
+            feasibility_method: FeasibilityMethod = FeasibilityMethod.FLOW,
+            time_limit: Optional[float] = None,
+            mip_gap: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the class with parameters.
+        :param flow_method: Method used to compute the maximum flow.
+        :param feasibility_method: Method used to check the feasibility of the job pool.
+        :param time_limit: Time limit of the solver in seconds, not limited if not provided.
+        :param mip_gap: Relative gap between the primal and the dual bounds at which the solver stops, the solver
+        default if not provided.
+        """
+        super(MixedIntegerProgrammingScheduler, self).__init__(flow_method, feasibility_method)
+        self.time_limit = time_limit
+        self.mip_gap = mip_gap
+
+        self._primal_bound = None
+        self._lower_bound = None
+        self._objective_gap = None
+
+    @property
+    def primal_bound(self) -> Optional[int]:
+        return self._primal_bound
+
+    @property
+    def lower_bound(self) -> Optional[float]:
+        return self._lower_bound
+
+    @property
+    def objective_gap(self) -> Optional[float]:
+        return self._objective_gap
+
+    def _set_bounds(self, primal_bound: Optional[int], lower_bound: Optional[float]) -> None:
+        self._primal_bound = primal_bound
+        self._lower_bound = lower_bound
+        self._objective_gap = None
+
+        if primal_bound is not None:
+            self._objective_gap = (primal_bound - lower_bound) / primal_bound if primal_bound != 0 else 0.0
+
+    def process(self, job_pool: Union[JobPoolMI, JobPool], max_concurrency: int) -> Schedule:
+        """
+        Computes the optimal schedule given a set of jobs and maximum concurrency.
+        :param job_pool: Job pool of jobs with arbitrary number of intervals.
+        :param max_concurrency: Maximum number of jobs allowed to run concurrently.
+        :return: Computed schedule.
+        """
+        incumbent = super(MixedIntegerProgrammingScheduler, self).process(job_pool, max_concurrency)
+
+        if incumbent.all_jobs_scheduled is False:
+            self._set_bounds(None, None)
+            return incumbent
+
+        incumbent_active_time = sum(interval.duration for interval in incumbent.active_time_intervals)
+        self._set_bounds(incumbent_active_time, incumbent_active_time)
+
+        if incumbent_active_time == 0:
+            return incumbent
+
+        index = job_pool.create_time_slot_index()
+        jobs = index.jobs
+
+        slots, job_positions = index.incidence()
+        timestamps, slot_positions = unique(slots, return_inverse=True)
+        m, k = len(timestamps), len(job_positions)
+
+        c, A_ub, b_ub = LinearProgrammingScheduler._create_linear_program(
+            max_concurrency,
+            index.columns.durations,
+            ones(m, dtype=int64),
+            slot_positions,
+            job_positions,
+        )
+
+        # At least m - incumbent_active_time time slots must be closed, which only rules out the solutions worse than
+        # the incumbent, so the solver may still return a solution as good as the incumbent
+        incumbent_row = coo_matrix(concatenate([full(m, -1.0), zeros(k)])[None, :])
+
+        options = {}
+
+        if self.time_limit is not None:
+            options['time_limit'] = self.time_limit
+        if self.mip_gap is not None:
+            options['mip_rel_gap'] = self.mip_gap
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', OptimizeWarning)
+
+            result = milp(
+                c,
+                integrality=concatenate([ones(m), zeros(k)]),
+                bounds=Bounds(zeros(m + k), concatenate([ones(m), full(k, float('inf'))])),
+                constraints=LinearConstraint(
+                    vstack([A_ub, incumbent_row]),
+                    full(len(b_ub) + 1, -float('inf')),
+                    concatenate([b_ub, [incumbent_active_time - m]]),
+                ),
+                options=options,
+            )
+
+        # The active time is integral, so the dual bound of the solver can be rounded up
+        lower_bound = 0
+
+        if getattr(result, 'mip_dual_bound', None) is not None:
+            lower_bound = max(0, ceil(m + result.mip_dual_bound - self.EPS))
+
+        if result.x is None:
+            self._set_bounds(incumbent_active_time, min(lower_bound, incumbent_active_time))
+            return incumbent
+
+        closed_timestamps = timestamps[flatnonzero(result.x[:m] > 0.5)].tolist()
+        active_timestamps = set(timestamps.tolist()).difference(closed_timestamps)
+
+        oracle = self._create_feasibility_oracle(max_concurrency, int(timestamps[-1]) + 1, index)
+
+        if len(active_timestamps) >= incumbent_active_time or oracle.close_timestamps(closed_timestamps) is False:
+            self._set_bounds(incumbent_active_time, min(lower_bound, incumbent_active_time))
+            return incumbent
+
+        self._set_bounds(len(active_timestamps), min(lower_bound, len(active_timestamps)))
+
+        return Schedule(
+            True,
+            TimeInterval.merge_timestamps(active_timestamps),
+            list(self._create_job_schedules(jobs, oracle.get_assignment())),
+        )
@@ -1,15 +1,19 @@
 # -*- coding: utf-8 -*-
 from .create_image import save_image_from_schedule, show_image_from_schedule
 from .disjoint_set_node import DisjointSetNode
-from .maximum_flow import FordFulkerson, ford_fulkerson
+from .flow_network import FlowNetwork
+from .maximum_flow import FordFulkerson, IncrementalMaximumFlow, ford_fulkerson, scipy_maximum_flow
 from .maximum_matching import EdmondsBlossomMatching, UpperDegreeConstrainedSubgraph
 
 __all__ = [
     'DisjointSetNode',
     'EdmondsBlossomMatching',
+    'FlowNetwork',
     'FordFulkerson',
+    'IncrementalMaximumFlow',
     'UpperDegreeConstrainedSubgraph',
     'ford_fulkerson',
+    'scipy_maximum_flow',
     'save_image_from_schedule',
     'show_image_from_schedule',
 ]
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+from networkx import DiGraph
+from numpy import arange, asarray, int32, lexsort, ndarray, searchsorted
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import maximum_flow
+from typing import Dict, Tuple
+
+
+class FlowNetwork(object):
+    """
+    Integer-indexed flow network that stores its edges in plain arrays instead of per-edge attribute dicts. The nodes
+    are numbered from 0 to number_of_nodes - 1, parallel edges are not allowed. Edges are addressed by their position in
+    the arrays passed to the constructor, and their capacities can be changed in place, which allows reusing the same
+    network for several flow computations. Internally the edges are kept in CSR order, so the maximum flow is computed
+    with scipy.sparse.csgraph.maximum_flow without any conversion.
+    """
+
+    def __init__(self, number_of_nodes: int, tails: ndarray, heads: ndarray, capacities: ndarray) -> None:
+        """
+        Initialize the class with parameters.
+        :param number_of_nodes: Number of nodes in the network.
+        :param tails: Tails of the edges.
+        :param heads: Heads of the edges.
+        :param capacities: Capacities of the edges.
+        """
+        self.number_of_nodes = number_of_nodes
+        self.tails = asarray(tails, dtype=int32)
+        self.heads = asarray(heads, dtype=int32)
+        self.capacities = asarray(capacities, dtype=int32).copy()
+
+        self._order = lexsort((self.heads, self.tails))
+        self._indptr = searchsorted(self.tails[self._order], arange(number_of_nodes + 1)).astype(int32)
+
+    @property
+    def number_of_edges(self) -> int:
+        return len(self.tails)
+
+    def to_digraph(self) -> DiGraph:
+        """
+        Convert the network into a networkx graph with the capacities stored in the 'capacity' attribute.
+        :return: Resulting graph.
+        """
+        graph = DiGraph()
+        graph.add_nodes_from(range(self.number_of_nodes))
+        graph.add_edges_from(
+            (u, v, {'capacity': c})
+            for u, v, c in zip(self.tails.tolist(), self.heads.tolist(), self.capacities.tolist())
+        )
+        return graph
+
+    def flow_from_dict(self, flow_dict: Dict[int, Dict[int, int]]) -> ndarray:
+        """
+        Convert the flow in the format returned by networkx into the array of flows along the edges of the network.
+        :param flow_dict: Flow to convert.
+        :return: Array of flows.
+        """
+        return asarray(
+            [flow_dict.get(u, {}).get(v, 0) for u, v in zip(self.tails.tolist(), self.heads.tolist())],
+            dtype=int32,
+        )
+
+    def maximum_flow(self, s: int, t: int) -> Tuple[int, ndarray]:
+        """
+        Find the maximum flow from source to sink.
+        :param s: Source of the network.
+        :param t: Sink of the network.
+        :return: Flow value and the array of flows along the edges of the network.
+        """
+        graph = csr_matrix(
+            (self.capacities[self._order], self.heads[self._order], self._indptr),
+            shape=(self.number_of_nodes, self.number_of_nodes),
+        )
+
+        result = maximum_flow(graph, s, t)
+
+        return int(result.flow_value), asarray(result.flow[self.tails, self.heads]).ravel()
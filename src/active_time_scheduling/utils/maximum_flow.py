@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
+from collections import deque
 from networkx import DiGraph
 from networkx.algorithms.flow import build_residual_network
-from typing import Any, Dict
+from numpy import ndarray
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from .flow_network import FlowNetwork
 
 
 class FordFulkerson(object):
@@ -87,3 +91,289 @@ def ford_fulkerson(graph: DiGraph, s: Any, t: Any, *args, **kwargs) -> DiGraph:
     """
     ff = FordFulkerson(graph)
     return ff.process(s, t)
+
+
+class IncrementalMaximumFlow(object):
+    """
+    Maintains a maximum flow on an acyclic network while its nodes are being closed and reopened. Closing a node only
+    cancels the flow currently routed through it and tries to re-augment the same amount from the nodes that lost it,
+    so each step costs work proportional to the flow through the closed node instead of a full maximum flow
+    computation. If the amount cannot be re-augmented, the residual network is rolled back to its previous state.
+    """
+
+    def __init__(self, graph: DiGraph, s: Any, t: Any, flow_dict: Dict[Any, Dict[Any, int]]) -> None:
+        """
+        Initialize the class with parameters.
+        :param graph: Flow network.
+        :param s: Source of the network.
+        :param t: Sink of the network.
+        :param flow_dict: Maximum flow on the network in the format returned by networkx.
+        """
+        self._initialize(s, t, (
+            (u, v, graph[u][v]['capacity'], flow_dict.get(u, {}).get(v, 0)) for u, v in graph.edges
+        ), graph.nodes)
+
+    @classmethod
+    def from_flow_network(cls, network: FlowNetwork, s: int, t: int, flow: ndarray) -> 'IncrementalMaximumFlow':
+        """
+        Create the object from an array-backed flow network.
+        :param network: Flow network.
+        :param s: Source of the network.
+        :param t: Sink of the network.
+        :param flow: Maximum flow on the network as returned by FlowNetwork.maximum_flow.
+        :return: Created object.
+        """
+        incremental_maximum_flow = cls.__new__(cls)
+        incremental_maximum_flow._initialize(s, t, zip(
+            network.tails.tolist(), network.heads.tolist(), network.capacities.tolist(), flow.tolist()
+        ), range(network.number_of_nodes))
+        return incremental_maximum_flow
+
+    def _initialize(self, s: Any, t: Any, edges: Iterable[Tuple[Any, Any, int, int]], nodes: Iterable[Any]) -> None:
+        self.s = s
+        self.t = t
+
+        self._capacity = {u: {} for u in nodes}
+        self._flow = {u: {} for u in self._capacity}
+        self._predecessors = {u: [] for u in self._capacity}
+        self._open_successors = {u: set() for u in self._capacity}
+        self._flow_predecessors = {u: set() for u in self._capacity}
+        self._closed = set()
+        self._log = []
+
+        for u, v, c, f in edges:
+            self._capacity[u][v] = c
+            self._flow[u][v] = f
+            self._predecessors[v].append(u)
+            self._open_successors[u].add(v)
+
+            if f != 0:
+                self._flow_predecessors[v].add(u)
+
+        self.flow_value = sum(self._flow[s].values())
+
+    @property
+    def flow_dict(self) -> Dict[Any, Dict[Any, int]]:
+        return self._flow
+
+    @property
+    def closed_nodes(self) -> Set[Any]:
+        return self._closed
+
+    def get_incoming_flow(self, v: Any) -> Dict[Any, int]:
+        """
+        Get the flow entering the node, only the edges carrying a nonzero flow are visited.
+        :param v: Node of the network.
+        :return: Mapping from the tails of the edges with a nonzero flow into the node to their flow.
+        """
+        return {u: self._flow[u][v] for u in self._flow_predecessors[v]}
+
+    def _set_flow(self, u: Any, v: Any, f: int) -> None:
+        self._flow[u][v] = f
+
+        if f != 0:
+            self._flow_predecessors[v].add(u)
+        else:
+            self._flow_predecessors[v].discard(u)
+
+    def _push(self, u: Any, v: Any, a: int) -> None:
+        self._set_flow(u, v, self._flow[u][v] + a)
+        self._log.append((u, v, a))
+
+    def _rollback(self) -> None:
+        while self._log:
+            u, v, a = self._log.pop()
+            self._set_flow(u, v, self._flow[u][v] - a)
+
+    def _close(self, nodes: Iterable[Any]) -> None:
+        for u in nodes:
+            self._closed.add(u)
+
+            for v in self._predecessors[u]:
+                self._open_successors[v].discard(u)
+
+    def _open(self, nodes: Iterable[Any]) -> None:
+        for u in nodes:
+            self._closed.discard(u)
+
+            for v in self._predecessors[u]:
+                self._open_successors[v].add(u)
+
+    def _retract_to_sink(self, u: Any, amount: int) -> None:
+        if u == self.t:
+            return
+
+        for v, f in self._flow[u].items():
+            if amount == 0:
+                break
+
+            a = min(amount, f)
+            if a == 0:
+                continue
+
+            self._push(u, v, -a)
+            self._retract_to_sink(v, a)
+            amount -= a
+
+    def _find_augmenting_path(self, u: Any) -> Optional[Dict[Any, Tuple[Any, bool]]]:
+        p = {u: None}
+        q = deque([u])
+
+        while q:
+            v = q.popleft()
+
+            for w in self._open_successors[v]:
+                if w in p or self._capacity[v][w] == self._flow[v][w]:
+                    continue
+
+                p[w] = (v, True)
+                if w == self.t:
+                    return p
+                if self.t in self._flow[w] and self._capacity[w][self.t] != self._flow[w][self.t]:
+                    p[self.t] = (w, True)
+                    return p
+                q.append(w)
+
+            for w in self._flow_predecessors[v]:
+                if w in p or w in self._closed or w == self.s:
+                    continue
+
+                p[w] = (v, False)
+                q.append(w)
+
+        return None
+
+    def _augment(self, u: Any, excess: int) -> int:
+        p = self._find_augmenting_path(u)
+
+        if p is None:
+            return 0
+
+        a = excess
+        v = self.t
+
+        while p[v] is not None:
+            w, forward = p[v]
+            a = min(a, self._capacity[w][v] - self._flow[w][v] if forward else self._flow[v][w])
+            v = w
+
+        v = self.t
+
+        while p[v] is not None:
+            w, forward = p[v]
+            if forward:
+                self._push(w, v, a)
+            else:
+                self._push(v, w, -a)
+            v = w
+
+        return a
+
+    def _augment_from_source(self, u: Any) -> int:
+        a = self._augment(u, self._capacity[self.s][u] - self._flow[self.s][u])
+
+        if a != 0:
+            self._push(self.s, u, a)
+
+        return a
+
+    def close_nodes(self, nodes: Iterable[Any]) -> bool:
+        """
+        Close the nodes and try to re-route the flow passing through them. The nodes stay closed only if the flow value
+        is preserved, otherwise the flow is restored to its state prior to the call.
+        :param nodes: Nodes to close.
+        :return: Whether the nodes were closed.
+        """
+        nodes = [u for u in nodes if u not in self._closed]
+        self._log = []
+        self._close(nodes)
+
+        excess = {}
+
+        for u in nodes:
+            for v in list(self._flow_predecessors[u]):
+                f = self._flow[v][u]
+
+                self._push(v, u, -f)
+                self._retract_to_sink(u, f)
+                excess[v] = excess.get(v, 0) + f
+
+        for u, amount in excess.items():
+            if u in self._closed:
+                continue
+
+            while amount > 0:
+                a = self._augment(u, amount)
+
+                if a == 0:
+                    self._rollback()
+                    self._open(nodes)
+                    return False
+
+                amount -= a
+
+        self._log = []
+        return True
+
+    def open_nodes(self, nodes: Iterable[Any]) -> int:
+        """
+        Reopen closed nodes and augment the flow from the source as far as the network allows.
+        :param nodes: Nodes to open.
+        :return: Resulting flow value.
+        """
+        self._open([u for u in nodes if u in self._closed])
+        self._log = []
+
+        while True:
+            a = 0
+
+            for v in self._flow[self.s]:
+                if v in self._closed or self._capacity[self.s][v] - self._flow[self.s][v] == 0:
+                    continue
+
+                a = self._augment_from_source(v)
+                if a != 0:
+                    break
+
+            if a == 0:
+                break
+
+            self.flow_value += a
+
+        self._log = []
+        return self.flow_value
+
+
+def scipy_maximum_flow(graph: DiGraph, s: Any, t: Any, *args, **kwargs) -> DiGraph:
+    """
+    Function that converts the network into a FlowNetwork and computes the maximum flow with scipy. Can be used as the
+    flow_func argument of the maximum_flow function in the networkx package.
+    :param graph: Network to process.
+    :param s: Source of the network.
+    :param t: Sink of the network.
+    :param args: Args to pass to the function.
+    :param kwargs: Kwargs to pass to the function.
+    :return: Resulting residual network.
+    """
+    node_to_idx = {u: i for i, u in enumerate(graph.nodes)}
+    edges = list(graph.edges(data='capacity'))
+
+    network = FlowNetwork(
+        len(node_to_idx),
+        [node_to_idx[u] for u, _, _ in edges],
+        [node_to_idx[v] for _, v, _ in edges],
+        [capacity for _, _, capacity in edges],
+    )
+    flow_value, flow = network.maximum_flow(node_to_idx[s], node_to_idx[t])
+
+    r = build_residual_network(graph, 'capacity')
+    r.graph['flow_value'] = flow_value
+
+    for u, v in r.edges:
+        r[u][v]['flow'] = 0
+
+    for (u, v, _), f in zip(edges, flow.tolist()):
+        r[u][v]['flow'] += f
+        r[v][u]['flow'] -= f
+
+    return r
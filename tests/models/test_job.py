@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import pickle
+import pytest
+import tracemalloc
+from typing import Callable, List
+
+from src.active_time_scheduling.models import BatchJob, Job, JobMI, JobSchedule, JobScheduleMI, TimeInterval
+
+
+class _DictTimeInterval(object):
+
+    def __init__(self, start: int, end: int) -> None:
+        self.start = start
+        self.end = end
+
+
+class _DictJob(object):
+
+    def __init__(self, job_id: int, release_time: int, deadline: int, duration: int) -> None:
+        self.id = job_id
+        self.availability_intervals = [_DictTimeInterval(release_time, deadline)]
+        self.duration = duration
+
+
+def _measure_memory(create: Callable[[int], object], number_of_objects: int) -> float:
+    tracemalloc.start()
+
+    try:
+        objects: List[object] = [create(i) for i in range(number_of_objects)]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(objects) == number_of_objects
+
+    return size / number_of_objects
+
+
+class TestModels(object):
+
+    def test_time_interval(self) -> None:
+        interval = TimeInterval(1, 3)
+
+        with pytest.raises(AttributeError):
+            interval.start = 2
+
+        assert hash(interval) == hash(TimeInterval(1, 3))
+        assert len({interval, TimeInterval(1, 3), TimeInterval(1, 4)}) == 2
+        assert pickle.loads(pickle.dumps(interval)) == interval
+        assert list(interval) == [1, 2, 3]
+
+    def test_setters(self) -> None:
+        job = Job(1, 3, 2)
+        jobs = {job}
+
+        job.release_time = 0
+        job.deadline = 5
+
+        assert job.availability_intervals == [TimeInterval(0, 5)]
+        assert job in jobs
+
+        batch_job = BatchJob(1, 3)
+        batch_job.deadline = 4
+
+        assert (batch_job.release_time, batch_job.deadline) == (1, 4)
+
+        job_schedule = JobSchedule(job, 1, 2)
+        job_schedule.execution_end = 1
+
+        assert job_schedule.execution_intervals == [TimeInterval(1, 1)]
+
+    def test_slots(self) -> None:
+        job = Job(1, 3, 2)
+
+        for model in [
+            TimeInterval(1, 3),
+            job,
+            JobMI([TimeInterval(1, 3)], 2),
+            BatchJob(1, 3),
+            JobSchedule(job, 1, 2),
+            JobScheduleMI(job, []),
+        ]:
+            assert hasattr(model, '__dict__') is False
+
+        copy = pickle.loads(pickle.dumps(job))
+
+        assert (copy.id, copy.release_time, copy.deadline, copy.duration) == (job.id, 1, 3, 2)
+        assert hash(copy) == hash(job)
+
+    def test_memory(self) -> None:
+        number_of_jobs = 10000
+
+        dict_memory = _measure_memory(lambda i: _DictJob(i, i, i + 3, 2), number_of_jobs)
+        slots_memory = _measure_memory(lambda i: Job(i, i + 3, 2), number_of_jobs)
+
+        assert slots_memory < 0.9 * dict_memory
@@ -0,0 +1,437 @@
+# -*- coding: utf-8 -*-
+import pickle
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from numpy import array
+from numpy.random import randint
+
+from src.active_time_scheduling.models import (
+    ColumnarFixedLengthJobPool,
+    ColumnarJobPool,
+    ColumnarJobPoolMI,
+    FixedLengthJobPool,
+    Job,
+    JobMI,
+    JobPool,
+    JobPoolMI,
+    Schedule,
+    SharedJobPool,
+    TimeInterval,
+)
+from src.active_time_scheduling.schedulers import (
+    BatchScheduler,
+    DecompositionScheduler,
+    FeasibilityMethod,
+    GreedyLowestDensityFirstScheduler,
+    GreedyScheduler,
+    LinearProgrammingScheduler,
+)
+from tests.schedulers.common import check_equality, generate_jobs_uniform_distribution
+
+
+def _process_shared_job_pool(shared_job_pool: SharedJobPool) -> Schedule:
+    return GreedyScheduler().process(shared_job_pool.attach(), 2)
+
+
+class TestColumnarJobPool(object):
+
+    def test_add_jobs(self) -> None:
+        job_pool = ColumnarJobPool()
+
+        assert job_pool.add_job(0, 3, 1) == 0
+        assert job_pool.add_jobs(array([2, 1]), array([5, 2]), array([2, 1])).tolist() == [1, 2]
+        assert job_pool.size == 3
+
+        columns = job_pool.get_columns()
+
+        assert columns.durations.tolist() == [1, 2, 1]
+        assert columns.window_starts.tolist() == [0, 2, 1]
+        assert columns.window_ends.tolist() == [3, 5, 2]
+        assert columns.window_indptr.tolist() == [0, 1, 2, 3]
+        assert columns.has_single_windows is True
+
+        job = job_pool.get_job(1)
+
+        assert isinstance(job, Job)
+        assert (job.release_time, job.deadline, job.duration) == (2, 5, 2)
+        assert job_pool.get_job(1) is job
+        assert columns.jobs[1] is job
+        assert job in job_pool.jobs
+        assert len(job_pool.jobs) == 3
+
+        job_pool.add_job(4, 4, 1)
+
+        assert job_pool.size == 4
+        assert len(job_pool.jobs) == 4
+        assert job_pool.get_columns().window_starts.tolist() == [0, 2, 1, 4]
+        assert job_pool.get_job(1) is job
+
+        with pytest.raises(ValueError):
+            job_pool.add_jobs([1, 2], [3], [1, 1])
+
+    def test_mi(self) -> None:
+        job_pool = ColumnarJobPoolMI()
+        job_pool.add_job([(0, 1), (4, 5)], 2)
+        job_pool.add_jobs([1, 7, 9, 3], [2, 7, 9, 3], [3, 1], [1, 1])
+
+        columns = job_pool.get_columns()
+
+        assert columns.window_indptr.tolist() == [0, 2, 5, 6]
+        assert columns.release_times.tolist() == [0, 1, 3]
+        assert columns.deadlines.tolist() == [5, 9, 3]
+        assert columns.has_single_windows is False
+
+        job = job_pool.get_job(1)
+
+        assert isinstance(job, JobMI)
+        assert job.availability_intervals == [TimeInterval(1, 2), TimeInterval(7, 7), TimeInterval(9, 9)]
+
+    def test_fixed_length(self) -> None:
+        job_pool = ColumnarFixedLengthJobPool(3)
+        job_pool.add_jobs([0, 6], [4, 9])
+
+        assert [job_pool.get_job(i).duration for i in range(job_pool.size)] == [3, 3]
+        assert [component.duration for component in DecompositionScheduler.split(job_pool)] == [3, 3]
+        assert [component.size for component in DecompositionScheduler.split(job_pool)] == [1, 1]
+
+    @pytest.mark.repeat(100)
+    def test_against_job_pool(self) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(10, 31)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // 2 + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+        jobs = list(job_pool.jobs)
+
+        columnar_job_pool = ColumnarJobPool()
+        columnar_job_pool.add_jobs(
+            array([job.release_time for job in jobs]),
+            array([job.deadline for job in jobs]),
+            array([job.duration for job in jobs]),
+        )
+
+        for scheduler in [
+            GreedyScheduler(),
+            GreedyScheduler(feasibility_method=FeasibilityMethod.EARLIEST_DEADLINE_FIRST),
+            GreedyLowestDensityFirstScheduler(),
+        ]:
+            schedule_a = scheduler.process(job_pool, max_concurrency)
+            schedule_b = scheduler.process(columnar_job_pool, max_concurrency)
+
+            check_equality(schedule_a, schedule_b, columnar_job_pool, max_concurrency)
+
+            if schedule_b.all_jobs_scheduled is True:
+                assert set(job_schedule.job for job_schedule in schedule_b.job_schedules) == columnar_job_pool.jobs
+
+        schedule_a = LinearProgrammingScheduler().process(job_pool, max_concurrency)
+        schedule_b = LinearProgrammingScheduler().process(columnar_job_pool, max_concurrency)
+
+        assert schedule_a.all_jobs_scheduled == schedule_b.all_jobs_scheduled
+
+        if schedule_a.all_jobs_scheduled is True:
+            active_time_a = sum(interval.end - interval.start for interval in schedule_a.active_time_intervals)
+            active_time_b = sum(interval.end - interval.start for interval in schedule_b.active_time_intervals)
+
+            assert abs(active_time_a - active_time_b) < 1e-6
+
+    @pytest.mark.repeat(100)
+    def test_batch_against_job_pool(self) -> None:
+        max_t = randint(10, 31)
+        duration = randint(1, 4)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // 2 + 1)
+
+        release_times = randint(0, max_t, number_of_jobs)
+        deadlines = release_times + duration - 1 + randint(0, 5, number_of_jobs)
+
+        job_pool = FixedLengthJobPool(duration)
+
+        for release_time, deadline in zip(release_times.tolist(), deadlines.tolist()):
+            job_pool.add_job(release_time, deadline)
+
+        columnar_job_pool = ColumnarFixedLengthJobPool(duration)
+        columnar_job_pool.add_jobs(release_times, deadlines)
+
+        schedule_a = BatchScheduler().process(job_pool, max_concurrency)
+        schedule_b = BatchScheduler().process(columnar_job_pool, max_concurrency)
+
+        assert schedule_a.all_jobs_scheduled == schedule_b.all_jobs_scheduled
+
+        if schedule_a.all_jobs_scheduled is True:
+            assert sum(interval.duration for interval in schedule_a.active_time_intervals) == sum(
+                interval.duration for interval in schedule_b.active_time_intervals
+            )
+
+    def test_empty(self) -> None:
+        job_pool = ColumnarJobPool()
+        job_pool.add_jobs([], [], [])
+
+        schedule = GreedyScheduler().process(job_pool, 2)
+
+        assert schedule.all_jobs_scheduled is True
+        assert schedule.active_time_intervals == []
+        assert job_pool.get_columns().release_times.tolist() == []
+        assert JobPool().get_columns().size == 0
+
+    def test_job_set(self) -> None:
+        job_pool = ColumnarJobPool()
+        job_pool.add_jobs([0, 2], [3, 5], [1, 2])
+
+        jobs = job_pool.jobs
+        job = Job(1, 4, 3, job_id=jobs.create_id())
+        jobs.add(job)
+
+        assert job_pool.size == len(jobs) == 3
+        assert job_pool.get_columns().durations.tolist() == [1, 2, 3]
+        assert job_pool.get_job(2) is job
+        assert job_pool.add_job(6, 7, 1) == 3
+
+        jobs.discard(job_pool.get_job(0))
+
+        assert job_pool.size == 3
+        assert job_pool.get_columns().ids.tolist() == [1, 2, 3]
+        assert [job.release_time for job in jobs] == [2, 1, 6]
+        assert jobs.find(0) is None
+
+        with pytest.raises(ValueError):
+            job_pool.jobs.add(Job(0, 1, 1, job_id=1))
+
+
+class TestJobSet(object):
+
+    def test_positions(self) -> None:
+        job_pool = JobPool()
+        job_ids = [job_pool.add_job(t, t + 2, 1) for t in [5, 0, 3, 1]]
+
+        assert [job.id for job in job_pool.jobs] == job_ids
+        assert [job_pool.get_position(job_pool.get_job(i)) for i in range(4)] == [0, 1, 2, 3]
+        assert [job.release_time for job in job_pool.get_columns().jobs] == [5, 0, 3, 1]
+
+        job = job_pool.get_job(1)
+        job_pool.remove_job(job.id)
+
+        assert job not in job_pool.jobs
+        assert [job.release_time for job in job_pool.jobs] == [5, 3, 1]
+        assert job_pool.get_position(job_pool.get_job(2)) == 2
+
+        with pytest.raises(KeyError):
+            job_pool.get_position(job)
+        with pytest.raises(KeyError):
+            job_pool.remove_job(job.id)
+
+        assert job_pool.jobs == set(job_pool.jobs)
+
+        job_pool.jobs.add(job)
+
+        assert job_pool.get_position(job) == 3
+        assert job_pool.size == 4
+
+    def test_ids(self) -> None:
+        job_pool_a = JobPool()
+        job_pool_b = JobPool()
+
+        assert [job_pool_a.add_job(0, 2, 1) for _ in range(3)] == [0, 1, 2]
+        assert [job_pool_b.add_job(1, 3, 1) for _ in range(2)] == [0, 1]
+
+        job_pool_a.remove_job(2)
+
+        assert job_pool_a.add_job(0, 2, 1) == 3
+
+        with pytest.raises(ValueError):
+            job_pool_a.jobs.add(job_pool_b.get_job(0))
+
+        columnar_job_pool = ColumnarJobPool()
+        columnar_job_pool.add_jobs([0, 1], [2, 3], [1, 1])
+        columnar_job_pool.remove_job(1)
+        columnar_job_pool.add_job(0, 2, 1)
+
+        assert columnar_job_pool.get_columns().ids.tolist() == [0, 2]
+        assert [job.id for job in columnar_job_pool.jobs] == [0, 2]
+
+    def test_columnar_ids(self) -> None:
+        job_pool = ColumnarJobPool()
+
+        assert job_pool.add_jobs([0, 1, 2], [2, 3, 4], [1, 1, 1]).tolist() == [0, 1, 2]
+
+        job_pool.remove_job(0)
+        job_id = job_pool.add_job(5, 7, 2)
+
+        assert job_id == 3
+        assert job_pool.add_jobs([6], [8], [1]).tolist() == [4]
+
+        job_pool.remove_job(2)
+
+        assert job_pool.get_columns().ids.tolist() == [1, 3, 4]
+        assert [job.release_time for job in job_pool.jobs] == [1, 5, 6]
+
+        job_pool.remove_job(job_id)
+
+        assert [job.id for job in job_pool.jobs] == [1, 4]
+
+        job_pool_mi = ColumnarJobPoolMI()
+        job_pool_mi.add_job([(0, 1)], 1)
+        job_pool_mi.remove_job(0)
+
+        assert job_pool_mi.add_job([(3, 4), (6, 7)], 2) == 1
+
+        fixed_length_job_pool = ColumnarFixedLengthJobPool(2)
+        fixed_length_job_pool.add_jobs([0, 6], [4, 9])
+        fixed_length_job_pool.remove_job(0)
+
+        assert fixed_length_job_pool.add_job(1, 5) == 2
+        assert fixed_length_job_pool.get_job(1).id == 2
+
+    def test_columnar_positions(self) -> None:
+        job_pool = ColumnarJobPoolMI()
+        job_pool.add_jobs([0, 4, 1, 7, 3], [1, 5, 2, 7, 3], [2, 2, 1], [2, 1, 1])
+
+        job = job_pool.get_job(0)
+        job_pool.remove_job(job.id)
+
+        columns = job_pool.get_columns()
+
+        assert job_pool.size == 2
+        assert columns.window_starts.tolist() == [1, 7, 3]
+        assert columns.window_indptr.tolist() == [0, 2, 3]
+        assert [interval.start for interval in job_pool.get_job(1).availability_intervals] == [3]
+        assert job_pool.get_position(job_pool.get_job(1)) == 1
+        assert list(job_pool.jobs) == [job_pool.get_job(0), job_pool.get_job(1)]
+
+    @pytest.mark.repeat(20)
+    def test_reproducible(self) -> None:
+        max_t = randint(10, 31)
+        number_of_jobs = randint(1, max_t // 2 + 1)
+
+        job_pool_a = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, 5), (1, 5))
+        job_pool_b = JobPool()
+
+        for job in job_pool_a.jobs:
+            job_pool_b.add_job(job.release_time, job.deadline, job.duration)
+
+        for scheduler in [GreedyScheduler(), LinearProgrammingScheduler()]:
+            schedule_a = scheduler.process(job_pool_a, 2)
+            schedule_b = scheduler.process(job_pool_b, 2)
+
+            assert schedule_a.all_jobs_scheduled == schedule_b.all_jobs_scheduled
+
+            if schedule_a.all_jobs_scheduled is True:
+                assert [job_pool_a.get_position(job_schedule.job) for job_schedule in schedule_a.job_schedules] == [
+                    job_pool_b.get_position(job_schedule.job) for job_schedule in schedule_b.job_schedules
+                ]
+                assert [job_schedule.execution_intervals for job_schedule in schedule_a.job_schedules] == [
+                    job_schedule.execution_intervals for job_schedule in schedule_b.job_schedules
+                ]
+
+
+class TestPickling(object):
+
+    def test_job_pools(self) -> None:
+        job_pool = JobPool()
+        job_pool.add_job(0, 3, 1)
+        job_pool.add_job(2, 5, 2)
+        job_pool.remove_job(0)
+
+        copy = pickle.loads(pickle.dumps(job_pool))
+
+        assert isinstance(copy, JobPool)
+        assert list(copy.jobs) == list(job_pool.jobs)
+        assert copy.add_job(1, 4, 1) == 2
+
+        job_pool_mi = JobPoolMI()
+        job_pool_mi.add_job([(0, 1), (4, 5)], 2)
+
+        job = pickle.loads(pickle.dumps(job_pool_mi)).get_job(0)
+
+        assert (job.id, job.availability_intervals, job.duration) == (0, [TimeInterval(0, 1), TimeInterval(4, 5)], 2)
+
+        fixed_length_job_pool = pickle.loads(pickle.dumps(ColumnarFixedLengthJobPool(3)))
+        fixed_length_job_pool.add_jobs([0, 6], [4, 9])
+
+        assert fixed_length_job_pool.duration == 3
+        assert pickle.loads(pickle.dumps(fixed_length_job_pool)).get_columns().durations.tolist() == [3, 3]
+
+    def test_out_of_band(self) -> None:
+        job_pool = ColumnarJobPool()
+        job_pool.add_jobs(randint(0, 100, 1000), randint(100, 200, 1000), randint(1, 10, 1000))
+
+        buffers = []
+        data = pickle.dumps(job_pool, protocol=5, buffer_callback=buffers.append)
+        copy = pickle.loads(data, buffers=buffers)
+
+        assert len(buffers) != 0
+        assert len(data) < 1000
+        assert (copy.get_columns().window_ends == job_pool.get_columns().window_ends).all()
+
+        object_job_pool = JobPool()
+
+        for job in job_pool.jobs:
+            object_job_pool.add_job(job.release_time, job.deadline, job.duration)
+
+        buffers = []
+        data = pickle.dumps(object_job_pool, protocol=5, buffer_callback=buffers.append)
+
+        assert len(data) < 1000
+        assert list(pickle.loads(data, buffers=buffers).jobs) == list(object_job_pool.jobs)
+
+    @pytest.mark.repeat(20)
+    def test_schedules(self) -> None:
+        max_t = randint(10, 31)
+        number_of_jobs = randint(1, max_t // 2 + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, 5), (1, 5))
+
+        for schedule in [
+            GreedyScheduler().process(job_pool, 2),
+            LinearProgrammingScheduler().process(job_pool, 2),
+        ]:
+            copy = pickle.loads(pickle.dumps(schedule))
+
+            assert copy.all_jobs_scheduled == schedule.all_jobs_scheduled
+
+            if schedule.all_jobs_scheduled is True:
+                assert copy.active_time_intervals == schedule.active_time_intervals
+                assert [job_schedule.job for job_schedule in copy.job_schedules] == [
+                    job_schedule.job for job_schedule in schedule.job_schedules
+                ]
+                assert [job_schedule.execution_intervals for job_schedule in copy.job_schedules] == [
+                    job_schedule.execution_intervals for job_schedule in schedule.job_schedules
+                ]
+
+    def test_batch_schedule(self) -> None:
+        job_pool = FixedLengthJobPool(2)
+
+        for release_time, deadline in [(0, 3), (1, 4), (5, 8)]:
+            job_pool.add_job(release_time, deadline)
+
+        schedule = BatchScheduler().process(job_pool, 2)
+        copy = pickle.loads(pickle.dumps(schedule))
+
+        assert [job_schedule.jobs for job_schedule in copy.job_schedules] == [
+            job_schedule.jobs for job_schedule in schedule.job_schedules
+        ]
+        assert copy.active_time_intervals == schedule.active_time_intervals
+
+    def test_shared_job_pool(self) -> None:
+        job_pool = ColumnarJobPool()
+        job_pool.add_jobs([0, 2, 5], [3, 6, 9], [1, 2, 3])
+
+        shared_job_pool = SharedJobPool(job_pool)
+
+        try:
+            copy = shared_job_pool.attach()
+
+            assert copy.get_columns().window_starts.flags.owndata is False
+            assert list(copy.jobs) == list(job_pool.jobs)
+
+            copy.add_job(7, 9, 1)
+
+            assert job_pool.size == 3
+
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                schedule = executor.submit(_process_shared_job_pool, shared_job_pool).result()
+
+            check_equality(GreedyScheduler().process(job_pool, 2), schedule, job_pool, 2)
+        finally:
+            shared_job_pool.close()
+            shared_job_pool.unlink()
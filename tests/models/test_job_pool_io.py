@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+import io
+import mmap
+import pytest
+from numpy import array, load, savez
+from numpy.random import randint
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from src.active_time_scheduling.models import (
+    AbstractJobPool,
+    ColumnarFixedLengthJobPool,
+    ColumnarJobPool,
+    ColumnarJobPoolMI,
+    EncodedSchedule,
+    FixedLengthJobPool,
+    FixedLengthJobPoolMI,
+    JobPool,
+    JobPoolMI,
+    get_job_pool_dtype,
+    read_job_pool_binary,
+    read_job_pool_csv,
+    read_job_pool_npz,
+    write_job_pool_binary,
+    write_job_pool_csv,
+    write_job_pool_npz,
+    write_schedule_binary,
+    write_schedule_csv,
+    write_schedule_npz,
+)
+from src.active_time_scheduling.schedulers import BatchScheduler, GreedyScheduler, LinearProgrammingScheduler
+
+
+def _get_jobs(job_pool: AbstractJobPool) -> List[Tuple[List[Tuple[int, int]], int]]:
+    return [
+        ([(interval.start, interval.end) for interval in job.availability_intervals], job.duration)
+        for job in job_pool.jobs
+    ]
+
+
+def _generate_job_pools() -> List[Tuple[AbstractJobPool, Callable[[], AbstractJobPool]]]:
+    number_of_jobs = randint(1, 50)
+    release_times = randint(0, 20, number_of_jobs)
+    deadlines = release_times + randint(1, 10, number_of_jobs)
+    durations = randint(1, 4, number_of_jobs)
+
+    job_pool = JobPool()
+    job_pool_mi = JobPoolMI()
+    fixed_length_job_pool = FixedLengthJobPool(2)
+    fixed_length_job_pool_mi = FixedLengthJobPoolMI(2)
+
+    for release_time, deadline, duration in zip(release_times.tolist(), deadlines.tolist(), durations.tolist()):
+        windows = [(release_time, deadline), (deadline + 2, deadline + 4)][:randint(1, 3)]
+
+        job_pool.add_job(release_time, deadline, duration)
+        job_pool_mi.add_job(windows, duration)
+        fixed_length_job_pool.add_job(release_time, deadline)
+        fixed_length_job_pool_mi.add_job(windows)
+
+    return [
+        (job_pool, JobPool),
+        (job_pool, ColumnarJobPool),
+        (job_pool_mi, JobPoolMI),
+        (job_pool_mi, ColumnarJobPoolMI),
+        (fixed_length_job_pool, lambda: FixedLengthJobPool(2)),
+        (fixed_length_job_pool, lambda: ColumnarFixedLengthJobPool(2)),
+        (fixed_length_job_pool_mi, lambda: FixedLengthJobPoolMI(2)),
+    ]
+
+
+def _as_single_window_pool(job_pool: ColumnarJobPoolMI) -> ColumnarJobPool:
+    copy = ColumnarJobPool()
+    copy.jobs = list(job_pool.jobs)
+    return copy
+
+
+class TestJobPoolIO(object):
+
+    @pytest.mark.repeat(10)
+    def test_csv(self) -> None:
+        for job_pool, create_job_pool in _generate_job_pools():
+            stream = io.StringIO()
+            write_job_pool_csv(job_pool, stream, chunk_size=7)
+            stream.seek(0)
+
+            assert _get_jobs(read_job_pool_csv(stream, create_job_pool(), chunk_size=5)) == _get_jobs(job_pool)
+
+    @pytest.mark.repeat(10)
+    def test_npz(self) -> None:
+        for compressed in [False, True]:
+            for job_pool, create_job_pool in _generate_job_pools():
+                stream = io.BytesIO()
+                write_job_pool_npz(job_pool, stream, chunk_size=7, compressed=compressed)
+                stream.seek(0)
+
+                assert _get_jobs(read_job_pool_npz(stream, create_job_pool(), chunk_size=5)) == _get_jobs(job_pool)
+
+    @pytest.mark.repeat(10)
+    def test_binary(self, tmp_path: Path) -> None:
+        for job_pool, create_job_pool in _generate_job_pools():
+            path = tmp_path / 'jobs.npy'
+            write_job_pool_binary(job_pool, path, chunk_size=7)
+
+            assert load(path, mmap_mode='r').dtype == get_job_pool_dtype(job_pool)
+            assert _get_jobs(read_job_pool_binary(path, create_job_pool(), chunk_size=5)) == _get_jobs(job_pool)
+
+    def test_formats(self, tmp_path: Path) -> None:
+        stream = io.StringIO("job,window_start,window_end,duration\n4,0,1,2\n4,5,6,2\n1,3,4,1\n")
+        job_pool = read_job_pool_csv(stream, ColumnarJobPoolMI(), chunk_size=1)
+
+        assert job_pool.get_columns().window_indptr.tolist() == [0, 2, 3]
+        assert job_pool.get_columns().durations.tolist() == [2, 1]
+
+        savez(tmp_path / 'jobs.npz', release_time=array([0, 2], dtype='int32'), deadline=array([3, 5]))
+        job_pool = read_job_pool_npz(tmp_path / 'jobs.npz', ColumnarFixedLengthJobPool(2))
+
+        assert job_pool.get_columns().window_ends.tolist() == [3, 5]
+        assert job_pool.get_columns().durations.tolist() == [2, 2]
+
+        with pytest.raises(ValueError):
+            read_job_pool_csv(io.StringIO("release_time,deadline\n0,3\n"), ColumnarJobPool())
+        with pytest.raises(ValueError):
+            read_job_pool_csv(io.StringIO("job,window_start,window_end,duration\n0,0,1,2\n0,5,6,1\n"), JobPoolMI())
+
+        job_pool_mi = ColumnarJobPoolMI()
+        job_pool_mi.add_job([(0, 1), (3, 4)], 1)
+
+        with pytest.raises(ValueError):
+            write_job_pool_csv(_as_single_window_pool(job_pool_mi), io.StringIO())
+
+        assert _get_jobs(read_job_pool_csv(io.StringIO("release_time,deadline,duration\n"), JobPool())) == []
+
+    def test_schedules(self, tmp_path: Path) -> None:
+        job_pool = ColumnarJobPool()
+        job_pool.add_jobs([0, 2, 5], [3, 6, 9], [1, 2, 3])
+
+        schedule = GreedyScheduler().process(job_pool, 2)
+        stream = io.StringIO()
+        write_schedule_csv(schedule, job_pool, stream, chunk_size=2)
+        rows = [line.split(',') for line in stream.getvalue().splitlines()[1:]]
+
+        assert sorted((int(job), int(start), int(end)) for job, start, end in rows) == sorted(
+            (job_pool.get_position(job_schedule.job), interval.start, interval.end)
+            for job_schedule in schedule.job_schedules
+            for interval in job_schedule.execution_intervals
+        )
+
+        write_schedule_binary(schedule, job_pool, tmp_path / 'schedule.bin')
+
+        with open(tmp_path / 'schedule.bin', 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                encoded_schedule = EncodedSchedule.from_buffer(buffer)
+                copy = encoded_schedule.decode(list(job_pool.jobs))
+                del encoded_schedule
+
+        assert copy.active_time_intervals == schedule.active_time_intervals
+
+        write_schedule_npz(LinearProgrammingScheduler().process(job_pool, 2), job_pool, tmp_path / 'schedule.npz')
+
+        assert load(tmp_path / 'schedule.npz')['intervals'].shape[1] == 2
+
+        batch_job_pool = ColumnarFixedLengthJobPool(2)
+        batch_job_pool.add_jobs([0, 1, 5], [3, 4, 8])
+        stream = io.StringIO()
+        write_schedule_csv(BatchScheduler().process(batch_job_pool, 2), batch_job_pool, stream)
+
+        assert sorted(int(line.split(',')[0]) for line in stream.getvalue().splitlines()[1:]) == [0, 1, 2]
@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+import os
+import pytest
+from multiprocessing import Process
+from numpy.random import randint, permutation
+
+from src.active_time_scheduling.models import FixedLengthJobPool, JobPool, JobPoolMI, TimeInterval
+from src.active_time_scheduling.schedulers import (
+    BatchScheduler,
+    CachedScheduler,
+    DecompositionScheduler,
+    DiskScheduleCache,
+    EncodedSchedule,
+    FeasibilityMethod,
+    GreedyLowestDensityFirstScheduler,
+    GreedyScheduler,
+    LinearProgrammingRoundedScheduler,
+    LinearProgrammingScheduler,
+    MixedIntegerProgrammingScheduler,
+    ScheduleCache,
+)
+from tests.schedulers.common import check_equality, generate_jobs_uniform_distribution
+
+
+def _process_with_disk_cache(directory: str, release_time: int) -> None:
+    job_pool = JobPool()
+    job_pool.add_job(release_time, release_time + 3, 2)
+    job_pool.add_job(release_time + 1, release_time + 5, 3)
+
+    CachedScheduler(GreedyScheduler(), DiskScheduleCache(directory)).process(job_pool, 2)
+
+
+class TestCachedScheduler(object):
+
+    @staticmethod
+    def _copy_job_pool(job_pool: JobPool) -> JobPool:
+        jobs = list(job_pool.jobs)
+        job_pool_copy = JobPool()
+
+        for i in permutation(len(jobs)):
+            job_pool_copy.add_job(jobs[i].release_time, jobs[i].deadline, jobs[i].duration)
+
+        return job_pool_copy
+
+    def test_simple_examples(self) -> None:
+        job_pool_a = JobPool()
+        job_pool_a.add_job(0, 3, 1)
+        job_pool_a.add_job(2, 5, 2)
+        job_pool_a.add_job(1, 2, 1)
+
+        job_pool_b = JobPool()
+        job_pool_b.add_job(1, 2, 1)
+        job_pool_b.add_job(0, 3, 1)
+        job_pool_b.add_job(2, 5, 2)
+
+        scheduler = CachedScheduler(GreedyScheduler())
+
+        assert scheduler.fingerprint(job_pool_a, 2) == scheduler.fingerprint(job_pool_b, 2)
+        assert scheduler.fingerprint(job_pool_a, 2) != scheduler.fingerprint(job_pool_b, 3)
+
+        schedule_a = scheduler.process(job_pool_a, 2)
+        schedule_b = scheduler.process(job_pool_b, 2)
+
+        assert scheduler.stats.hits == 1
+        assert scheduler.stats.misses == 1
+        assert scheduler.stats.entries == 1
+        assert schedule_b.active_time_intervals == schedule_a.active_time_intervals
+        assert set(job_schedule.job for job_schedule in schedule_b.job_schedules) == job_pool_b.jobs
+
+        for job_schedule in schedule_b.job_schedules:
+            assert all(
+                job_schedule.job.release_time <= interval.start and interval.end <= job_schedule.job.deadline + 1
+                for interval in job_schedule.execution_intervals
+            )
+
+        for _ in range(3):
+            job_pool_b.add_job(1, 1, 1)
+
+        schedule = scheduler.process(job_pool_b, 2)
+
+        assert schedule.all_jobs_scheduled is False
+        assert scheduler.process(job_pool_b, 2).all_jobs_scheduled is False
+        assert scheduler.stats.hits == 2
+        assert scheduler.stats.misses == 2
+
+    def test_configuration(self) -> None:
+        job_pool = JobPool()
+        job_pool.add_job(0, 3, 1)
+
+        cache = ScheduleCache()
+        scheduler_a = CachedScheduler(GreedyScheduler(), cache)
+        scheduler_b = CachedScheduler(GreedyScheduler(feasibility_method=FeasibilityMethod.EARLIEST_DEADLINE_FIRST))
+        scheduler_c = CachedScheduler(GreedyScheduler(), cache)
+
+        assert scheduler_a.fingerprint(job_pool, 2) != scheduler_b.fingerprint(job_pool, 2)
+        assert scheduler_a.fingerprint(job_pool, 2) == scheduler_c.fingerprint(job_pool, 2)
+
+        scheduler_a.process(job_pool, 2)
+        scheduler_c.process(job_pool, 2)
+
+        assert scheduler_c.stats.hits == 1
+
+        job_pool_a = FixedLengthJobPool(2)
+        job_pool_a.add_job(0, 3)
+        job_pool_b = FixedLengthJobPool(3)
+        job_pool_b.add_job(0, 3)
+
+        assert scheduler_a.fingerprint(job_pool_a, 2) != scheduler_a.fingerprint(job_pool, 2)
+        assert scheduler_a.fingerprint(job_pool_a, 2) != scheduler_a.fingerprint(job_pool_b, 2)
+
+    @pytest.mark.parametrize('create_scheduler', [
+        lambda: GreedyScheduler(block_size=2),
+        LinearProgrammingScheduler,
+        LinearProgrammingRoundedScheduler,
+        MixedIntegerProgrammingScheduler,
+    ])
+    def test_used_scheduler(self, create_scheduler) -> None:
+        job_pool = JobPool()
+        job_pool.add_job(0, 3, 1)
+
+        used_scheduler = create_scheduler()
+        used_scheduler.process(generate_jobs_uniform_distribution(10, 10, (1, 3), (1, 3)), 3)
+
+        assert CachedScheduler(create_scheduler()).fingerprint(job_pool, 2) == CachedScheduler(
+            used_scheduler,
+        ).fingerprint(job_pool, 2)
+
+    def test_options(self) -> None:
+        job_pool = JobPool()
+        job_pool.add_job(0, 3, 1)
+
+        scheduler_a = CachedScheduler(GreedyScheduler())
+        scheduler_b = CachedScheduler(GreedyScheduler(speculation_window=4, max_workers=2, block_size=8))
+        scheduler_c = CachedScheduler(DecompositionScheduler(GreedyScheduler(), max_workers=1))
+        scheduler_d = CachedScheduler(DecompositionScheduler(GreedyScheduler(block_size=2), max_workers=3))
+
+        assert scheduler_a.fingerprint(job_pool, 2) == scheduler_b.fingerprint(job_pool, 2)
+        assert scheduler_c.fingerprint(job_pool, 2) == scheduler_d.fingerprint(job_pool, 2)
+
+        with pytest.raises(ValueError):
+            CachedScheduler(GreedyLowestDensityFirstScheduler(f=lambda x: 1 / x))
+
+        scheduler_e = CachedScheduler(GreedyLowestDensityFirstScheduler(f=lambda x: 1 / x), configuration_key='1/x')
+        scheduler_f = CachedScheduler(GreedyLowestDensityFirstScheduler(f=lambda x: 1 / x), configuration_key='1/x')
+        scheduler_g = CachedScheduler(GreedyLowestDensityFirstScheduler(f=lambda x: x), configuration_key='x')
+
+        assert scheduler_e.fingerprint(job_pool, 2) == scheduler_f.fingerprint(job_pool, 2)
+        assert scheduler_e.fingerprint(job_pool, 2) != scheduler_g.fingerprint(job_pool, 2)
+        assert CachedScheduler(GreedyLowestDensityFirstScheduler()).fingerprint(job_pool, 2) != scheduler_e.fingerprint(
+            job_pool,
+            2,
+        )
+
+    def test_eviction(self) -> None:
+        scheduler = CachedScheduler(GreedyScheduler(), ScheduleCache(max_size=400))
+
+        for release_time in range(10):
+            job_pool = JobPool()
+            job_pool.add_job(release_time, release_time + 2, 1)
+            job_pool.add_job(release_time + 1, release_time + 4, 2)
+            scheduler.process(job_pool, 1)
+
+        stats = scheduler.stats
+
+        assert stats.misses == 10
+        assert stats.evictions > 0
+        assert stats.entries == 10 - stats.evictions
+        assert 0 < stats.size <= stats.max_size
+
+        job_pool = JobPool()
+        job_pool.add_job(9, 11, 1)
+        job_pool.add_job(10, 13, 2)
+        scheduler.process(job_pool, 1)
+
+        job_pool = JobPool()
+        job_pool.add_job(0, 2, 1)
+        job_pool.add_job(1, 4, 2)
+        scheduler.process(job_pool, 1)
+
+        assert scheduler.stats.hits == 1
+        assert scheduler.stats.misses == 11
+
+    def test_batch(self) -> None:
+        job_pool_a = FixedLengthJobPool(2)
+        job_pool_a.add_job(0, 3)
+        job_pool_a.add_job(1, 4)
+        job_pool_a.add_job(6, 8)
+
+        job_pool_b = FixedLengthJobPool(2)
+        job_pool_b.add_job(6, 8)
+        job_pool_b.add_job(1, 4)
+        job_pool_b.add_job(0, 3)
+
+        scheduler = CachedScheduler(BatchScheduler())
+
+        schedule_a = scheduler.process(job_pool_a, 2)
+        schedule_b = scheduler.process(job_pool_b, 2)
+
+        assert scheduler.stats.hits == 1
+        assert schedule_b.active_time_intervals == schedule_a.active_time_intervals
+        assert set(job for batch in schedule_b.job_schedules for job in batch.jobs) == job_pool_b.jobs
+        assert [len(batch.jobs) for batch in schedule_b.job_schedules] == [
+            len(batch.jobs) for batch in schedule_a.job_schedules
+        ]
+
+    def test_mi(self) -> None:
+        job_pool_a = JobPoolMI()
+        job_pool_a.add_job([(0, 1), (4, 5)], 2)
+        job_pool_a.add_job([(1, 2)], 1)
+
+        job_pool_b = JobPoolMI()
+        job_pool_b.add_job([(1, 2)], 1)
+        job_pool_b.add_job([(0, 1), (4, 5)], 2)
+
+        scheduler = CachedScheduler(GreedyScheduler())
+
+        schedule_a = scheduler.process(job_pool_a, 2)
+        schedule_b = scheduler.process(job_pool_b, 2)
+
+        assert scheduler.stats.hits == 1
+        assert schedule_b.active_time_intervals == schedule_a.active_time_intervals
+        assert set(job_schedule.job for job_schedule in schedule_b.job_schedules) == job_pool_b.jobs
+
+    def test_fractional(self) -> None:
+        job_pool = JobPool()
+        job_pool.add_job(0, 2, 1)
+        job_pool.add_job(1, 3, 2)
+
+        scheduler = CachedScheduler(LinearProgrammingScheduler())
+
+        schedule_a = scheduler.process(job_pool, 2)
+        schedule_b = scheduler.process(self._copy_job_pool(job_pool), 2)
+
+        assert scheduler.stats.hits == 1
+        assert schedule_b.active_time_intervals == schedule_a.active_time_intervals
+        assert all(isinstance(interval, TimeInterval) for interval in schedule_b.active_time_intervals)
+
+    @pytest.mark.repeat(100)
+    def test_against_greedy(self) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(10, 31)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // 2 + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+        job_pool_copy = self._copy_job_pool(job_pool)
+
+        scheduler = CachedScheduler(GreedyScheduler())
+
+        schedule_a = scheduler.process(job_pool, max_concurrency)
+        schedule_b = scheduler.process(job_pool_copy, max_concurrency)
+
+        assert scheduler.stats.hits == 1
+        check_equality(schedule_a, schedule_b, job_pool_copy, max_concurrency)
+
+        if schedule_b.all_jobs_scheduled is True:
+            assert set(job_schedule.job for job_schedule in schedule_b.job_schedules) == job_pool_copy.jobs
+
+    def test_binary_encoding(self) -> None:
+        job_pool = JobPool()
+        job_pool.add_job(0, 3, 1)
+        job_pool.add_job(2, 5, 2)
+        job_pool.add_job(1, 2, 1)
+
+        jobs = CachedScheduler.get_canonical_jobs(job_pool)
+        positions = {job.id: i for i, job in enumerate(jobs)}
+
+        for schedule in [
+            GreedyScheduler().process(job_pool, 2),
+            LinearProgrammingScheduler().process(job_pool, 2),
+            GreedyScheduler().process(job_pool, 1),
+        ]:
+            encoded_schedule = EncodedSchedule.encode(schedule, positions)
+            data = encoded_schedule.to_bytes()
+            decoded_schedule = EncodedSchedule.from_buffer(data).decode(jobs)
+
+            assert len(data) == EncodedSchedule.HEADER.size + encoded_schedule.nbytes
+            assert decoded_schedule.all_jobs_scheduled == schedule.all_jobs_scheduled
+            assert decoded_schedule.active_time_intervals == schedule.active_time_intervals
+
+            if schedule.all_jobs_scheduled is True:
+                assert [
+                    (job_schedule.job, job_schedule.execution_intervals)
+                    for job_schedule in decoded_schedule.job_schedules
+                ] == [
+                    (job_schedule.job, job_schedule.execution_intervals)
+                    for job_schedule in schedule.job_schedules
+                ]
+
+        with pytest.raises(ValueError):
+            EncodedSchedule.from_buffer(data[:-1])
+
+        with pytest.raises(ValueError):
+            EncodedSchedule.from_buffer(b'\0' * len(data))
+
+    def test_disk_cache(self, tmp_path) -> None:
+        job_pool_a = JobPool()
+        job_pool_a.add_job(0, 3, 1)
+        job_pool_a.add_job(2, 5, 2)
+
+        job_pool_b = JobPool()
+        job_pool_b.add_job(2, 5, 2)
+        job_pool_b.add_job(0, 3, 1)
+
+        directory = str(tmp_path / 'cache')
+
+        schedule_a = CachedScheduler(GreedyScheduler(), DiskScheduleCache(directory)).process(job_pool_a, 2)
+
+        # A new instance reads the schedule stored by the previous one
+        scheduler = CachedScheduler(GreedyScheduler(), DiskScheduleCache(directory))
+        schedule_b = scheduler.process(job_pool_b, 2)
+
+        assert scheduler.stats.hits == 1
+        assert scheduler.stats.misses == 0
+        assert scheduler.stats.entries == 1
+        assert schedule_b.active_time_intervals == schedule_a.active_time_intervals
+        assert set(job_schedule.job for job_schedule in schedule_b.job_schedules) == job_pool_b.jobs
+
+        # Truncated files are treated as misses and overwritten
+        path = os.path.join(directory, scheduler.fingerprint(job_pool_b, 2) + DiskScheduleCache.SUFFIX)
+
+        with open(path, 'r+b') as file:
+            file.truncate(10)
+
+        assert scheduler.process(job_pool_b, 2).active_time_intervals == schedule_a.active_time_intervals
+        assert scheduler.stats.misses == 1
+        assert scheduler.process(job_pool_b, 2).active_time_intervals == schedule_a.active_time_intervals
+        assert scheduler.stats.hits == 2
+
+        scheduler.cache.clear()
+
+        assert scheduler.stats.entries == 0
+        assert os.listdir(directory) == []
+
+    def test_disk_cache_eviction(self, tmp_path) -> None:
+        cache = DiskScheduleCache(str(tmp_path), max_size=500)
+        scheduler = CachedScheduler(GreedyScheduler(), cache)
+
+        for release_time in range(10):
+            job_pool = JobPool()
+            job_pool.add_job(release_time, release_time + 2, 1)
+            job_pool.add_job(release_time + 1, release_time + 4, 2)
+            scheduler.process(job_pool, 1)
+
+        stats = scheduler.stats
+
+        assert stats.evictions > 0
+        assert stats.entries == 10 - stats.evictions
+        assert 0 < stats.size <= stats.max_size
+
+    def test_disk_cache_scans(self, tmp_path, monkeypatch) -> None:
+        cache = DiskScheduleCache(str(tmp_path), max_size=500)
+        scans = []
+        list_entries = cache._list_entries
+        monkeypatch.setattr(cache, '_list_entries', lambda: scans.append(None) or list_entries())
+
+        scheduler = CachedScheduler(GreedyScheduler(), cache)
+        sizes = []
+
+        for release_time in range(10):
+            job_pool = JobPool()
+            job_pool.add_job(release_time, release_time + 2, 1)
+            scheduler.process(job_pool, 1)
+            sizes.append(cache._size)
+
+        assert 0 < cache._evictions < 9
+        assert len(scans) <= 1 + cache._evictions
+        assert sizes[-1] == sum(os.path.getsize(os.path.join(str(tmp_path), name)) for name in os.listdir(tmp_path))
+        assert max(sizes) <= cache.max_size
+
+    def test_disk_cache_processes(self, tmp_path) -> None:
+        directory = str(tmp_path)
+
+        processes = [Process(target=_process_with_disk_cache, args=(directory, i % 3)) for i in range(6)]
+
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert all(process.exitcode == 0 for process in processes)
+
+        scheduler = CachedScheduler(GreedyScheduler(), DiskScheduleCache(directory))
+
+        for release_time in range(3):
+            job_pool = JobPool()
+            job_pool.add_job(release_time + 1, release_time + 5, 3)
+            job_pool.add_job(release_time, release_time + 3, 2)
+
+            schedule = scheduler.process(job_pool, 2)
+
+            assert schedule.active_time_intervals == GreedyScheduler().process(job_pool, 2).active_time_intervals
+
+        assert scheduler.stats.hits == 3
+        assert scheduler.stats.entries == 3
+        assert sorted(os.listdir(directory)) == sorted(
+            name for name in os.listdir(directory) if name.endswith(DiskScheduleCache.SUFFIX)
+        )
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+import pytest
+from numpy.random import randint
+
+from src.active_time_scheduling.models import FixedLengthJobPool, JobPool, JobPoolMI, TimeInterval, UnitJobPool
+from src.active_time_scheduling.schedulers import (
+    AbstractScheduler,
+    BatchScheduler,
+    DecompositionScheduler,
+    DegreeConstrainedSubgraphScheduler,
+    GreedyLowestDensityFirstScheduler,
+    GreedyScheduler,
+    LazyActivationSchedulerT,
+    LinearProgrammingScheduler,
+    MatchingScheduler,
+)
+from tests.schedulers.common import check_equality, generate_jobs_uniform_distribution
+
+
+class TestDecompositionScheduler(object):
+
+    def test_split(self) -> None:
+        job_pool = JobPool()
+        job_pool.add_job(1, 3, 1)
+        job_pool.add_job(3, 5, 2)
+        job_pool.add_job(7, 8, 1)
+        job_pool.add_job(10, 12, 3)
+        job_pool.add_job(12, 12, 1)
+
+        components = DecompositionScheduler.split(job_pool)
+
+        assert [sorted((job.release_time, job.deadline) for job in component.jobs) for component in components] == [
+            [(1, 3), (3, 5)],
+            [(7, 8)],
+            [(10, 12), (12, 12)],
+        ]
+        assert all(isinstance(component, JobPool) for component in components)
+
+        job_pool = JobPoolMI()
+        job_pool.add_job([(0, 1), (10, 11)], 2)
+        job_pool.add_job([(5, 6)], 1)
+        job_pool.add_job([(11, 12)], 1)
+
+        components = DecompositionScheduler.split(job_pool)
+
+        assert [len(component.jobs) for component in components] == [2, 1]
+
+        job_pool = FixedLengthJobPool(3)
+        job_pool.add_job(0, 4)
+        job_pool.add_job(6, 9)
+
+        components = DecompositionScheduler.split(job_pool)
+
+        assert [component.duration for component in components] == [3, 3]
+
+        job_pool = JobPoolMI()
+        job_pool.add_job([], 1)
+        job_pool.add_job([(5, 6)], 1)
+        job_pool.add_job([(0, 1)], 1)
+
+        components = DecompositionScheduler.split(job_pool)
+
+        assert [[job.availability_intervals for job in component.jobs] for component in components] == [
+            [[], [TimeInterval(0, 1)]],
+            [[TimeInterval(5, 6)]],
+        ]
+
+        job_pool = JobPoolMI()
+        job_pool.add_job([], 1)
+        job_pool.add_job([], 2)
+
+        assert [len(component.jobs) for component in DecompositionScheduler.split(job_pool)] == [2]
+
+    def test_simple_examples(self) -> None:
+        job_pool = JobPool()
+        job_pool.add_job(1, 4, 2)
+        job_pool.add_job(3, 8, 2)
+        job_pool.add_job(10, 11, 2)
+
+        schedule = DecompositionScheduler(GreedyScheduler(), 1).process(job_pool, 2)
+
+        assert schedule.all_jobs_scheduled is True
+        assert schedule.active_time_intervals == [
+            TimeInterval(3, 4),
+            TimeInterval(10, 11),
+        ]
+        assert set(job_schedule.job for job_schedule in schedule.job_schedules) == job_pool.jobs
+
+        job_pool = JobPool()
+        job_pool.add_job(1, 2, 2)
+        job_pool.add_job(1, 2, 2)
+        job_pool.add_job(5, 6, 1)
+
+        schedule = DecompositionScheduler(GreedyScheduler(), 1).process(job_pool, 1)
+
+        assert schedule.all_jobs_scheduled is False
+        assert schedule.active_time_intervals is None
+        assert schedule.job_schedules is None
+
+    @pytest.mark.parametrize('max_workers', [1, 2])
+    def test_jobs_without_windows(self, max_workers: int) -> None:
+        job_pool = JobPoolMI()
+        job_pool.add_job([(0, 3)], 2)
+        job_pool.add_job([(10, 13)], 2)
+        job_pool.add_job([], 1)
+
+        for scheduler in [GreedyScheduler(), LinearProgrammingScheduler()]:
+            schedule = DecompositionScheduler(scheduler, max_workers).process(job_pool, 2)
+
+            assert schedule.all_jobs_scheduled is scheduler.process(job_pool, 2).all_jobs_scheduled is False
+
+    def test_empty(self) -> None:
+        job_pool = JobPool()
+
+        schedule = DecompositionScheduler(GreedyScheduler()).process(job_pool, 2)
+
+        assert schedule.all_jobs_scheduled is True
+        assert schedule.active_time_intervals == []
+        assert len(schedule.job_schedules) == 0
+
+    @pytest.mark.repeat(100)
+    @pytest.mark.parametrize('max_workers', [1, 2])
+    @pytest.mark.parametrize('scheduler', [GreedyScheduler(), GreedyLowestDensityFirstScheduler()])
+    def test_against_greedy(self, scheduler: GreedyScheduler, max_workers: int) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(30, 61)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // 2 + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = scheduler.process(job_pool, max_concurrency)
+        schedule_b = DecompositionScheduler(scheduler, max_workers).process(job_pool, max_concurrency)
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+        assert schedule_a.active_time_intervals == schedule_b.active_time_intervals
+
+        if schedule_b.all_jobs_scheduled is True:
+            assert set(job_schedule.job for job_schedule in schedule_b.job_schedules) == job_pool.jobs
+
+    @pytest.mark.repeat(100)
+    @pytest.mark.parametrize('scheduler', [LazyActivationSchedulerT(), DegreeConstrainedSubgraphScheduler()])
+    def test_against_exact(self, scheduler: AbstractScheduler) -> None:
+        max_t = randint(30, 61)
+        max_concurrency = 2
+        number_of_jobs = randint(1, max_t // 2 + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, 5), (1, 1))
+        args = (max_concurrency,) if isinstance(scheduler, LazyActivationSchedulerT) else ()
+
+        schedule_a = scheduler.process(job_pool, *args)
+        schedule_b = DecompositionScheduler(scheduler, 1).process(job_pool, *args)
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+
+    @pytest.mark.repeat(100)
+    def test_against_matching(self) -> None:
+        max_t = randint(30, 61)
+        number_of_jobs = randint(1, max_t // 2 + 1)
+
+        job_pool = UnitJobPool()
+
+        for _ in range(number_of_jobs):
+            release_time = randint(0, max_t)
+            job_pool.add_job(release_time, release_time + randint(0, 5))
+
+        schedule_a = MatchingScheduler().process(job_pool)
+        schedule_b = DecompositionScheduler(MatchingScheduler(), 1).process(job_pool)
+
+        check_equality(schedule_a, schedule_b, job_pool, 2)
+
+    @pytest.mark.repeat(100)
+    def test_against_batch(self) -> None:
+        max_t = randint(30, 61)
+        duration = randint(1, 4)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // 2 + 1)
+
+        job_pool = FixedLengthJobPool(duration)
+
+        for _ in range(number_of_jobs):
+            release_time = randint(0, max_t)
+            job_pool.add_job(release_time, release_time + duration - 1 + randint(0, 5))
+
+        schedule_a = BatchScheduler().process(job_pool, max_concurrency)
+        schedule_b = DecompositionScheduler(BatchScheduler(), 1).process(job_pool, max_concurrency)
+
+        assert schedule_a.all_jobs_scheduled == schedule_b.all_jobs_scheduled
+
+        if schedule_a.all_jobs_scheduled is True:
+            assert sum(interval.duration for interval in schedule_a.active_time_intervals) == sum(
+                interval.duration for interval in schedule_b.active_time_intervals
+            )
+            assert sum(len(batch.jobs) for batch in schedule_b.job_schedules) == number_of_jobs
+
+    @pytest.mark.repeat(20)
+    def test_against_linear_programming(self) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(30, 61)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // 2 + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = LinearProgrammingScheduler().process(job_pool, max_concurrency)
+        schedule_b = DecompositionScheduler(LinearProgrammingScheduler(), 2).process(job_pool, max_concurrency)
+
+        assert schedule_a.all_jobs_scheduled == schedule_b.all_jobs_scheduled
+
+        if schedule_a.all_jobs_scheduled is True:
+            active_time_a = sum(interval.end - interval.start for interval in schedule_a.active_time_intervals)
+            active_time_b = sum(interval.end - interval.start for interval in schedule_b.active_time_intervals)
+
+            assert abs(active_time_a - active_time_b) < 1e-6
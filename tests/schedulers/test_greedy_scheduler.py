@@ -1,20 +1,51 @@
 # -*- coding: utf-8 -*-
 import pytest
+import random
+from networkx import maximum_flow
 from numpy.random import randint
-from typing import Type
+from typing import List, Type
 
 from src.active_time_scheduling.models import JobPool, TimeInterval
 from src.active_time_scheduling.schedulers import (
     AbstractGreedyScheduler,
     BruteForceScheduler,
+    EarliestDeadlineFirstOracle,
+    FeasibilityMethod,
+    FlowMethod,
+    FlowFeasibilityOracle,
     GreedyIntervalsScheduler,
+    GreedyLocalSearchScheduler,
+    GreedyLowestDensityFirstScheduler,
     GreedyScheduler,
     LazyActivationSchedulerT,
     DegreeConstrainedSubgraphScheduler,
+    MinFeasScheduler,
 )
 from tests.schedulers.common import check_equality, check_2_approximation, generate_jobs_uniform_distribution
 
 
+def _compute_from_scratch(scheduler: GreedyScheduler, job_pool: JobPool, max_concurrency: int) -> List[TimeInterval]:
+    index = job_pool.create_time_slot_index()
+    jobs = index.jobs
+    max_t = max([job.deadline for job in jobs]) + 1
+    duration_sum = sum([job.duration for job in jobs])
+
+    network = scheduler._create_flow_network(max_concurrency, max_t, index)
+
+    active_timestamps = set()
+
+    for t in scheduler._get_t_ordering(job_pool):
+        network.capacities[len(jobs) + t] = 0
+
+        flow_value, _ = maximum_flow(network.to_digraph(), 0, 1 + len(jobs) + max_t)
+
+        if flow_value < duration_sum:
+            network.capacities[len(jobs) + t] = max_concurrency
+            active_timestamps.add(t)
+
+    return TimeInterval.merge_timestamps(active_timestamps)
+
+
 class TestGreedyScheduler(object):
 
     @pytest.mark.parametrize('scheduler', [GreedyIntervalsScheduler, GreedyScheduler])
@@ -77,6 +108,286 @@ class TestGreedyScheduler(object):
 
         check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
 
+    @pytest.mark.repeat(1000)
+    @pytest.mark.parametrize('scheduler', [GreedyScheduler, GreedyLowestDensityFirstScheduler, MinFeasScheduler])
+    def test_against_flow_from_scratch(self, scheduler: Type[GreedyScheduler]) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(15, 31)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t * 2 + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+        seed = randint(0, 2 ** 31)
+
+        random.seed(seed)
+        schedule_a = scheduler().process(job_pool, max_concurrency)
+
+        if schedule_a.all_jobs_scheduled is False:
+            return
+
+        random.seed(seed)
+        active_time_intervals_b = _compute_from_scratch(scheduler(), job_pool, max_concurrency)
+
+        assert schedule_a.active_time_intervals == active_time_intervals_b
+        check_equality(schedule_a, schedule_a, job_pool, max_concurrency)
+
+    @pytest.mark.repeat(100)
+    @pytest.mark.parametrize('flow_method', list(FlowMethod))
+    @pytest.mark.parametrize('scheduler', [GreedyIntervalsScheduler, GreedyScheduler, BruteForceScheduler])
+    def test_flow_methods(self, scheduler: Type[AbstractGreedyScheduler], flow_method: FlowMethod) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(4, 9)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = scheduler().process(job_pool, max_concurrency)
+        schedule_b = scheduler(flow_method).process(job_pool, max_concurrency)
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+        assert schedule_a.active_time_intervals == schedule_b.active_time_intervals
+
+    @pytest.mark.repeat(1000)
+    @pytest.mark.parametrize(
+        'scheduler',
+        [GreedyScheduler, GreedyLowestDensityFirstScheduler, MinFeasScheduler, BruteForceScheduler],
+    )
+    def test_feasibility_methods(self, scheduler: Type[GreedyScheduler]) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(4, 9)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+        seed = randint(0, 2 ** 31)
+
+        random.seed(seed)
+        schedule_a = scheduler().process(job_pool, max_concurrency)
+
+        random.seed(seed)
+        schedule_b = scheduler(feasibility_method=FeasibilityMethod.EARLIEST_DEADLINE_FIRST).process(
+            job_pool, max_concurrency
+        )
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+        assert schedule_a.active_time_intervals == schedule_b.active_time_intervals
+
+    @pytest.mark.repeat(20)
+    @pytest.mark.parametrize('feasibility_method', list(FeasibilityMethod))
+    @pytest.mark.parametrize('scheduler', [GreedyScheduler, GreedyLowestDensityFirstScheduler, MinFeasScheduler])
+    def test_speculation(self, scheduler: Type[GreedyScheduler], feasibility_method: FeasibilityMethod) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(15, 31)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t * 2 + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+        seed = randint(0, 2 ** 31)
+
+        random.seed(seed)
+        schedule_a = scheduler(feasibility_method=feasibility_method).process(job_pool, max_concurrency)
+
+        random.seed(seed)
+        speculation_window = randint(2, 7)
+        scheduler_b = scheduler(
+            feasibility_method=feasibility_method,
+            speculation_window=speculation_window,
+            max_workers=2,
+        )
+        schedule_b = scheduler_b.process(job_pool, max_concurrency)
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+        assert schedule_a.active_time_intervals == schedule_b.active_time_intervals
+
+        if schedule_b.all_jobs_scheduled is True:
+            assert scheduler_b.saved_feasibility_checks == 0
+            assert 0 <= scheduler_b.wasted_speculative_checks <= (speculation_window - 1) * len(
+                scheduler_b._get_t_ordering(job_pool)
+            )
+
+    @pytest.mark.repeat(1000)
+    @pytest.mark.parametrize('feasibility_method', list(FeasibilityMethod))
+    @pytest.mark.parametrize('scheduler', [GreedyScheduler, GreedyLowestDensityFirstScheduler, MinFeasScheduler])
+    def test_block_closing(self, scheduler: Type[GreedyScheduler], feasibility_method: FeasibilityMethod) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(15, 31)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t * 2 + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+        seed = randint(0, 2 ** 31)
+
+        random.seed(seed)
+        scheduler_a = scheduler(feasibility_method=feasibility_method)
+        schedule_a = scheduler_a.process(job_pool, max_concurrency)
+
+        random.seed(seed)
+        scheduler_b = scheduler(feasibility_method=feasibility_method, block_size=randint(2, 17))
+        schedule_b = scheduler_b.process(job_pool, max_concurrency)
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+        assert schedule_a.active_time_intervals == schedule_b.active_time_intervals
+        assert scheduler_a.saved_feasibility_checks == 0
+
+    def test_block_closing_saves_checks(self) -> None:
+        job_pool = JobPool()
+        job_pool.add_job(0, 63, 1)
+
+        scheduler = GreedyScheduler(block_size=16)
+        schedule = scheduler.process(job_pool, 1)
+
+        assert schedule.active_time_intervals == [TimeInterval(63, 63)]
+        assert scheduler.saved_feasibility_checks == 64 - 8
+
+    @pytest.mark.repeat(1000)
+    @pytest.mark.parametrize('feasibility_method', list(FeasibilityMethod))
+    def test_local_search(self, feasibility_method: FeasibilityMethod) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(4, 9)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = BruteForceScheduler().process(job_pool, max_concurrency)
+        schedule_b = GreedyScheduler().process(job_pool, max_concurrency)
+        schedule_c = GreedyLocalSearchScheduler(feasibility_method=feasibility_method).process(
+            job_pool, max_concurrency
+        )
+        schedule_d = GreedyLocalSearchScheduler(max_evaluations=0).process(job_pool, max_concurrency)
+
+        check_2_approximation(schedule_a, schedule_c, job_pool, max_concurrency)
+        check_2_approximation(schedule_b, schedule_c, job_pool, max_concurrency)
+        check_equality(schedule_b, schedule_d, job_pool, max_concurrency)
+
+        if schedule_a.all_jobs_scheduled is True:
+            duration_sum_b = sum(interval.duration for interval in schedule_b.active_time_intervals)
+            duration_sum_c = sum(interval.duration for interval in schedule_c.active_time_intervals)
+
+            assert duration_sum_c <= duration_sum_b
+            assert schedule_b.active_time_intervals == schedule_d.active_time_intervals
+
+    @pytest.mark.repeat(100)
+    @pytest.mark.parametrize('options', [{'block_size': 3}, {'speculation_window': 3, 'max_workers': 2}])
+    def test_local_search_closing_modes(self, options: dict) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(4, 9)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        scheduler = GreedyLocalSearchScheduler(**options)
+
+        assert all(getattr(scheduler, key) == value for key, value in options.items())
+
+        schedule_a = GreedyScheduler(**options).process(job_pool, max_concurrency)
+        schedule_b = GreedyLocalSearchScheduler(max_evaluations=0, **options).process(job_pool, max_concurrency)
+        schedule_c = scheduler.process(job_pool, max_concurrency)
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+        check_2_approximation(schedule_a, schedule_c, job_pool, max_concurrency)
+
+        if schedule_a.all_jobs_scheduled is True:
+            assert schedule_a.active_time_intervals == schedule_b.active_time_intervals
+            assert sum(interval.duration for interval in schedule_c.active_time_intervals) <= sum(
+                interval.duration for interval in schedule_a.active_time_intervals
+            )
+
+    def test_local_search_improvement(self) -> None:
+        job_pool = JobPool()
+        job_pool.add_job(0, 3, 1)
+        job_pool.add_job(2, 5, 2)
+        job_pool.add_job(1, 2, 1)
+
+        schedule_a = GreedyScheduler().process(job_pool, 2)
+        schedule_b = GreedyLocalSearchScheduler().process(job_pool, 2)
+
+        assert sum(interval.duration for interval in schedule_a.active_time_intervals) == 3
+        assert sum(interval.duration for interval in schedule_b.active_time_intervals) == 2
+        check_equality(schedule_b, schedule_b, job_pool, 2)
+
+    @pytest.mark.repeat(100)
+    def test_density_ordering(self) -> None:
+        max_length = randint(1, 16)
+        max_t = randint(15, 101)
+        number_of_jobs = randint(1, max_t * 2 + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        frequency = {}
+        for job in job_pool.jobs:
+            for t in range(job.release_time, job.deadline + 1):
+                frequency.setdefault(t, 0)
+                frequency[t] += 1
+
+        t_ordering = [t for _, t in sorted((item[1], item[0]) for item in frequency.items())]
+
+        assert GreedyLowestDensityFirstScheduler()._get_t_ordering(job_pool) == t_ordering
+
+        frequency = {}
+        for job in job_pool.jobs:
+            for t in range(job.release_time, job.deadline + 1):
+                frequency.setdefault(t, 0)
+                frequency[t] += 1 / (job.duration / (job.deadline - job.release_time + 1))
+
+        t_ordering = [t for _, t in sorted((item[1], item[0]) for item in frequency.items())]
+
+        scheduler_a = GreedyLowestDensityFirstScheduler(f=lambda x: 1 / x)
+        scheduler_b = GreedyLowestDensityFirstScheduler(f=lambda x: 1 / x, vectorized=True)
+
+        assert scheduler_a._get_t_ordering(job_pool) == t_ordering
+        assert scheduler_b._get_t_ordering(job_pool) == t_ordering
+
+    def test_earliest_deadline_first_fallback(self) -> None:
+        job_pool = JobPool()
+        job_pool.add_job(1, 3, 2)
+        job_pool.add_job(0, 1, 2)
+        job_pool.add_job(1, 2, 1)
+        job_pool.add_job(3, 3, 1)
+        job_pool.add_job(3, 3, 1)
+
+        oracle = EarliestDeadlineFirstOracle(job_pool.create_time_slot_index(), 2)
+
+        assert oracle._sweep(oracle.index.timestamps) is None
+        assert oracle.is_feasible() is True
+        assert len(oracle.get_assignment()[0]) == 7
+        assert oracle.close_timestamps([2]) is False
+        assert oracle.is_feasible() is True
+
+    @pytest.mark.repeat(100)
+    def test_flow_assignment(self) -> None:
+        max_length = randint(1, 8)
+        max_t = randint(8, 31)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+        index = job_pool.create_time_slot_index()
+
+        scheduler = GreedyScheduler()
+        oracle = scheduler._create_feasibility_oracle(max_concurrency, scheduler._get_max_t(index), index)
+
+        if oracle is None:
+            return
+
+        for t in scheduler._get_t_ordering(job_pool):
+            oracle.close_timestamps([t])
+
+        flow = oracle.network.flow_from_dict(oracle._flow.flow_dict)
+        job_positions, timestamps = oracle.get_assignment()
+        expected_job_positions, expected_timestamps = FlowFeasibilityOracle.get_flow_assignment(
+            oracle.network,
+            flow,
+            len(index.jobs),
+        )
+
+        assert sorted(zip(job_positions.tolist(), timestamps.tolist())) == sorted(
+            zip(expected_job_positions.tolist(), expected_timestamps.tolist())
+        )
+        assert len(job_positions) == sum(job.duration for job in index.jobs)
+
     @pytest.mark.repeat(1000)
     @pytest.mark.parametrize('scheduler_b', [GreedyIntervalsScheduler, GreedyScheduler])
     def test_against_brute_force(self, scheduler_b: Type[AbstractGreedyScheduler]) -> None:
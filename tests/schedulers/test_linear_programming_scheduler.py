@@ -1,15 +1,52 @@
 # -*- coding: utf-8 -*-
 import pytest
-from random import randint
+import warnings
+from random import randint, random
+from scipy.optimize import OptimizeResult
 
-from src.active_time_scheduling.models import JobPool
+from src.active_time_scheduling.models import AbstractJobPool, JobPool, Schedule
 from src.active_time_scheduling.schedulers import (
     BruteForceScheduler,
     LazyActivationSchedulerT,
+    LinearProgrammingFormulation,
+    LinearProgrammingModel,
     LinearProgrammingRoundedScheduler,
+    LinearProgrammingScheduler,
     DegreeConstrainedSubgraphScheduler,
 )
-from tests.schedulers.common import check_2_approximation, generate_jobs_uniform_distribution
+from tests.schedulers.common import check_2_approximation, generate_jobs_uniform_distribution, generate_mi_jobs
+
+
+def _check_fractional_feasibility(schedule: Schedule, job_pool: AbstractJobPool, max_concurrency: int) -> None:
+    eps = 1e-6
+
+    events = []
+
+    for job_schedule in schedule.job_schedules:
+        work = sum(interval.end - interval.start for interval in job_schedule.execution_intervals)
+        assert work >= job_schedule.job.duration - eps
+
+        for a, b in zip(job_schedule.execution_intervals, job_schedule.execution_intervals[1:]):
+            assert a.end <= b.start + eps
+
+        for interval in job_schedule.execution_intervals:
+            assert any(
+                window.start - eps <= interval.start and interval.end <= window.end + 1 + eps
+                for window in job_schedule.job.availability_intervals
+            )
+            assert any(
+                active.start - eps <= interval.start and interval.end <= active.end + eps
+                for active in schedule.active_time_intervals
+            )
+
+            events.append((interval.start, 1))
+            events.append((interval.end - eps, -1))
+
+    concurrency = 0
+
+    for _, delta in sorted(events):
+        concurrency += delta
+        assert concurrency <= max_concurrency
 
 
 class TestLinearProgrammingScheduler(object):
@@ -34,7 +71,8 @@ class TestLinearProgrammingScheduler(object):
         assert len(schedule.job_schedules) == 2
 
     @pytest.mark.repeat(1000)
-    def test_against_brute_force(self) -> None:
+    @pytest.mark.parametrize('formulation', list(LinearProgrammingFormulation))
+    def test_against_brute_force(self, formulation: LinearProgrammingFormulation) -> None:
         max_length = randint(1, 5)
         max_t = randint(4, 9)
         max_concurrency = randint(1, 4)
@@ -43,10 +81,308 @@ class TestLinearProgrammingScheduler(object):
         job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
 
         schedule_a = BruteForceScheduler().process(job_pool, max_concurrency)
-        schedule_b = LinearProgrammingRoundedScheduler().process(job_pool, max_concurrency)
+        schedule_b = LinearProgrammingRoundedScheduler(formulation=formulation).process(job_pool, max_concurrency)
 
         check_2_approximation(schedule_a, schedule_b, job_pool, max_concurrency)
 
+    @pytest.mark.repeat(300)
+    @pytest.mark.parametrize('mi', [False, True])
+    def test_formulations(self, mi: bool) -> None:
+        max_length = randint(1, 10)
+        max_t = randint(10, 40)
+        max_concurrency = randint(1, 4)
+
+        if mi is True:
+            job_pool = generate_mi_jobs(randint(1, max_t), max_t, (0, random()), max_length)
+        else:
+            job_pool = generate_jobs_uniform_distribution(randint(1, max_t), max_t, (1, max_length), (1, max_length))
+
+        schedule_a = LinearProgrammingScheduler().process(job_pool, max_concurrency)
+        schedule_b = LinearProgrammingScheduler(
+            formulation=LinearProgrammingFormulation.ELEMENTARY_INTERVALS,
+        ).process(job_pool, max_concurrency)
+
+        assert schedule_a.all_jobs_scheduled == schedule_b.all_jobs_scheduled
+
+        if schedule_a.all_jobs_scheduled is True:
+            active_time_a = sum(interval.end - interval.start for interval in schedule_a.active_time_intervals)
+            active_time_b = sum(interval.end - interval.start for interval in schedule_b.active_time_intervals)
+
+            assert abs(active_time_a - active_time_b) < 1e-6
+
+            _check_fractional_feasibility(schedule_a, job_pool, max_concurrency)
+            _check_fractional_feasibility(schedule_b, job_pool, max_concurrency)
+
+    @pytest.mark.repeat(100)
+    @pytest.mark.parametrize('formulation', list(LinearProgrammingFormulation))
+    def test_batch(self, formulation: LinearProgrammingFormulation) -> None:
+        max_concurrency = randint(1, 4)
+        job_pools = [JobPool()]
+
+        for _ in range(randint(1, 20)):
+            max_length = randint(1, 5)
+            max_t = randint(4, 15)
+            number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+            job_pools.append(
+                generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+            )
+
+        scheduler = LinearProgrammingScheduler(formulation=formulation)
+        schedules = scheduler.process_batch(job_pools, max_concurrency)
+
+        assert len(schedules) == len(job_pools)
+
+        for job_pool, schedule_b in zip(job_pools, schedules):
+            schedule_a = scheduler.process(job_pool, max_concurrency)
+
+            assert schedule_a.all_jobs_scheduled == schedule_b.all_jobs_scheduled
+
+            if schedule_a.all_jobs_scheduled is True:
+                active_time_a = sum(interval.end - interval.start for interval in schedule_a.active_time_intervals)
+                active_time_b = sum(interval.end - interval.start for interval in schedule_b.active_time_intervals)
+
+                assert abs(active_time_a - active_time_b) < 1e-6
+                assert set(job_schedule.job for job_schedule in schedule_b.job_schedules) == job_pool.jobs
+
+                _check_fractional_feasibility(schedule_b, job_pool, max_concurrency)
+
+    def test_model(self) -> None:
+        job_pool = JobPool()
+        job_pool.add_job(0, 3, 2)
+        job_pool.add_job(2, 5, 2)
+
+        model = LinearProgrammingModel(job_pool, 3)
+        schedule = model.solve()
+
+        assert model.number_of_solves == 1
+        assert sum(interval.end - interval.start for interval in schedule.active_time_intervals) == pytest.approx(2)
+
+        model.add_job(2, 3, 1)
+        schedule = model.solve()
+
+        assert model.number_of_solves == 1
+        assert len(schedule.job_schedules) == 3
+        assert sum(interval.end - interval.start for interval in schedule.active_time_intervals) == pytest.approx(2)
+
+        job_id = model.add_job(7, 8, 2)
+        schedule = model.solve()
+
+        assert model.number_of_solves == 2
+        assert sum(interval.end - interval.start for interval in schedule.active_time_intervals) == pytest.approx(4)
+
+        model.remove_job(job_id)
+        schedule = model.solve()
+
+        assert model.number_of_solves == 3
+        assert sum(interval.end - interval.start for interval in schedule.active_time_intervals) == pytest.approx(2)
+
+        for _ in range(4):
+            job_pool.add_job(0, 0, 1)
+
+        assert model.solve().all_jobs_scheduled is False
+        assert model.number_of_solves == 4
+
+        model.add_job(1, 1, 1)
+
+        assert model.solve().all_jobs_scheduled is False
+        assert model.number_of_solves == 4
+
+    def test_model_warm_start(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        job_pool = JobPool()
+
+        for i in range(200):
+            job_pool.add_job(i % 100, i % 100 + 9, 1 + i % 5)
+
+        model = LinearProgrammingModel(job_pool, 8)
+        active_time = sum(interval.end - interval.start for interval in model.solve().active_time_intervals)
+
+        highs = model._linear_program.highs
+        number_of_columns, number_of_rows = highs.getNumCol(), highs.getNumRow()
+        iterations = highs.getInfo().simplex_iteration_count
+
+        def rebuild(*args, **kwargs) -> None:
+            raise AssertionError('The LP must not be rebuilt')
+
+        monkeypatch.setattr(LinearProgrammingScheduler, '_create_linear_program', rebuild)
+        monkeypatch.setattr(LinearProgrammingScheduler, '_solve', rebuild)
+
+        job_id = model.add_job(150, 159, 10)
+        schedule = model.solve()
+
+        assert model.number_of_solves == 2
+        assert (highs.getNumCol(), highs.getNumRow()) == (number_of_columns + 20, number_of_rows + 21)
+        assert highs.getInfo().simplex_iteration_count < iterations // 10
+        assert sum(interval.end - interval.start for interval in schedule.active_time_intervals) == pytest.approx(
+            active_time + 10
+        )
+
+        model.remove_job(job_id)
+        schedule = model.solve()
+
+        assert model.number_of_solves == 3
+        assert (highs.getNumCol(), highs.getNumRow()) == (number_of_columns, number_of_rows)
+        assert sum(interval.end - interval.start for interval in schedule.active_time_intervals) == pytest.approx(
+            active_time
+        )
+
+        model.add_job(50, 59, 10)
+        schedule_b = model.solve()
+
+        monkeypatch.undo()
+        schedule_a = LinearProgrammingScheduler().process(job_pool, 8)
+
+        assert model.number_of_solves == 4
+        assert sum(interval.end - interval.start for interval in schedule_b.active_time_intervals) == pytest.approx(
+            sum(interval.end - interval.start for interval in schedule_a.active_time_intervals)
+        )
+
+        _check_fractional_feasibility(schedule_b, job_pool, 8)
+
+    @pytest.mark.repeat(100)
+    def test_model_against_linear_programming(self) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(4, 20)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+        model = LinearProgrammingModel(job_pool, max_concurrency)
+
+        for _ in range(10):
+            if random() < 0.3 and job_pool.size != 0:
+                model.remove_job(next(iter(job_pool.jobs)).id)
+            else:
+                release_time = randint(0, max_t)
+                model.add_job(release_time, release_time + max_length - 1, randint(1, max_length))
+
+            schedule_a = LinearProgrammingScheduler().process(job_pool, max_concurrency)
+            schedule_b = model.solve()
+
+            assert schedule_a.all_jobs_scheduled == schedule_b.all_jobs_scheduled
+
+            if schedule_a.all_jobs_scheduled is True:
+                active_time_a = sum(interval.end - interval.start for interval in schedule_a.active_time_intervals)
+                active_time_b = sum(interval.end - interval.start for interval in schedule_b.active_time_intervals)
+
+                assert abs(active_time_a - active_time_b) < 1e-6
+                assert set(job_schedule.job for job_schedule in schedule_b.job_schedules) == job_pool.jobs
+
+                _check_fractional_feasibility(schedule_b, job_pool, max_concurrency)
+
+    @pytest.mark.repeat(100)
+    def test_reuse_model(self) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(4, 9)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+        scheduler = LinearProgrammingRoundedScheduler(reuse_model=True)
+
+        for _ in range(3):
+            release_time = randint(0, max_t - max_length + 1)
+            job_pool.add_job(release_time, release_time + max_length - 1, randint(1, max_length))
+
+            schedule_a = BruteForceScheduler().process(job_pool, max_concurrency)
+            schedule_b = scheduler.process(job_pool, max_concurrency)
+
+            check_2_approximation(schedule_a, schedule_b, job_pool, max_concurrency)
+
+    @pytest.mark.repeat(100)
+    @pytest.mark.parametrize('limits', [{'time_limit': 0.0}, {'max_iterations': 1}])
+    def test_limits(self, limits: dict) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(4, 9)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        scheduler_a = LinearProgrammingScheduler()
+        scheduler_b = LinearProgrammingScheduler(**limits)
+
+        filters = list(warnings.filters)
+
+        schedule_a = scheduler_a.process(job_pool, max_concurrency)
+        schedule_b = scheduler_b.process(job_pool, max_concurrency)
+
+        assert warnings.filters == filters
+        assert schedule_a.all_jobs_scheduled == schedule_b.all_jobs_scheduled
+
+        if schedule_a.all_jobs_scheduled is False:
+            assert scheduler_b.objective_gap is None
+            return
+
+        active_time_a = sum(interval.end - interval.start for interval in schedule_a.active_time_intervals)
+        active_time_b = sum(interval.end - interval.start for interval in schedule_b.active_time_intervals)
+
+        assert scheduler_a.objective_gap == 0
+        assert scheduler_b.lower_bound <= active_time_a + 1e-6
+        assert abs(scheduler_b.primal_bound - active_time_b) < 1e-6
+        assert active_time_b >= active_time_a - 1e-6
+        assert 0 <= scheduler_b.objective_gap < 1
+
+        _check_fractional_feasibility(schedule_b, job_pool, max_concurrency)
+
+        scheduler_d = LinearProgrammingRoundedScheduler(**limits)
+
+        schedule_c = BruteForceScheduler().process(job_pool, max_concurrency)
+        schedule_d = scheduler_d.process(job_pool, max_concurrency)
+
+        check_2_approximation(schedule_c, schedule_d, job_pool, max_concurrency)
+
+        assert scheduler_d.linear_programming_scheduler.objective_gap is None
+
+    @pytest.mark.repeat(100)
+    def test_anytime_lower_bound(self) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(4, 9)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        scheduler = LinearProgrammingScheduler()
+        linear_program = scheduler._prepare_linear_program(job_pool, max_concurrency)
+        result = scheduler._solve(linear_program.c, linear_program.A_ub, linear_program.b_ub)
+
+        if result.status != 0:
+            return
+
+        active_time = linear_program.lengths.sum() + result.fun
+        durations = [job.duration for job in job_pool.jobs]
+        trivial_bound = max(max(durations), sum(durations) / max_concurrency)
+
+        # A solver stopped by a limit with its primal and dual solutions at hand
+        result = OptimizeResult(result, status=1)
+        _, primal_bound, lower_bound = scheduler._create_anytime_schedule(
+            job_pool,
+            max_concurrency,
+            linear_program,
+            result,
+        )
+
+        assert abs(primal_bound - active_time) < 1e-6
+        assert abs(lower_bound - active_time) < 1e-6
+
+        result.x = None
+        _, primal_bound, lower_bound = scheduler._create_anytime_schedule(
+            job_pool,
+            max_concurrency,
+            linear_program,
+            result,
+        )
+
+        assert abs(lower_bound - active_time) < 1e-6
+        assert lower_bound >= trivial_bound - 1e-6
+        assert primal_bound >= active_time - 1e-6
+
+        result.ineqlin = None
+        _, _, lower_bound = scheduler._create_anytime_schedule(job_pool, max_concurrency, linear_program, result)
+
+        assert lower_bound == min(trivial_bound, primal_bound)
+
     @pytest.mark.repeat(1000)
     def test_against_lazy_activation(self) -> None:
         max_length = randint(1, 5)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import pytest
+from random import randint, random
+
+from src.active_time_scheduling.models import JobPool, TimeInterval
+from src.active_time_scheduling.schedulers import BruteForceScheduler, MixedIntegerProgrammingScheduler
+from tests.schedulers.common import (
+    check_2_approximation,
+    check_equality,
+    generate_jobs_uniform_distribution,
+    generate_mi_jobs,
+)
+
+
+class TestMixedIntegerProgrammingScheduler(object):
+
+    def test_empty(self) -> None:
+        job_pool = JobPool()
+
+        schedule = MixedIntegerProgrammingScheduler().process(job_pool, 2)
+
+        assert schedule.all_jobs_scheduled is True
+        assert schedule.active_time_intervals == []
+        assert len(schedule.job_schedules) == 0
+
+        job_pool = JobPool()
+        job_pool.add_job(1, 5, 0)
+        job_pool.add_job(3, 7, 0)
+
+        schedule = MixedIntegerProgrammingScheduler().process(job_pool, 2)
+
+        assert schedule.all_jobs_scheduled is True
+        assert schedule.active_time_intervals == []
+        assert len(schedule.job_schedules) == 2
+
+    def test_simple_examples(self) -> None:
+        job_pool = JobPool()
+        job_pool.add_job(0, 3, 1)
+        job_pool.add_job(2, 5, 2)
+        job_pool.add_job(1, 2, 1)
+
+        scheduler = MixedIntegerProgrammingScheduler()
+        schedule = scheduler.process(job_pool, 2)
+
+        assert schedule.all_jobs_scheduled is True
+        assert schedule.active_time_intervals == [TimeInterval(2, 3)]
+        assert scheduler.primal_bound == 2
+        assert scheduler.lower_bound == 2
+        assert scheduler.objective_gap == 0
+
+        for _ in range(3):
+            job_pool.add_job(1, 1, 1)
+
+        schedule = scheduler.process(job_pool, 2)
+
+        assert schedule.all_jobs_scheduled is False
+        assert scheduler.objective_gap is None
+
+    @pytest.mark.repeat(1000)
+    def test_against_brute_force(self) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(4, 9)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = BruteForceScheduler().process(job_pool, max_concurrency)
+        schedule_b = MixedIntegerProgrammingScheduler().process(job_pool, max_concurrency)
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+
+    @pytest.mark.repeat(300)
+    def test_mi_against_brute_force(self) -> None:
+        max_t = randint(4, 9)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t * max_concurrency // 2 + 1)
+
+        job_pool = generate_mi_jobs(number_of_jobs, max_t, (0, random()), randint(1, 5))
+
+        schedule_a = BruteForceScheduler().process(job_pool, max_concurrency)
+        schedule_b = MixedIntegerProgrammingScheduler().process(job_pool, max_concurrency)
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+
+    @pytest.mark.repeat(100)
+    def test_time_limit(self) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(4, 9)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        scheduler = MixedIntegerProgrammingScheduler(time_limit=0.0)
+
+        schedule_a = BruteForceScheduler().process(job_pool, max_concurrency)
+        schedule_b = scheduler.process(job_pool, max_concurrency)
+
+        check_2_approximation(schedule_a, schedule_b, job_pool, max_concurrency)
+
+        if schedule_b.all_jobs_scheduled is True:
+            active_time_a = sum(interval.duration for interval in schedule_a.active_time_intervals)
+
+            assert scheduler.lower_bound <= active_time_a <= scheduler.primal_bound
+            assert 0 <= scheduler.objective_gap <= 1
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+import json
+import pytest
+from numpy.random import randint
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.active_time_scheduling.cli import create_job_pool, create_scheduler, main
+from src.active_time_scheduling.models import ColumnarFixedLengthJobPool, ColumnarJobPoolMI, FixedLengthJobPool
+from src.active_time_scheduling.schedulers import (
+    FlowMethod,
+    GreedyScheduler,
+    LinearProgrammingMethod,
+    LinearProgrammingScheduler,
+)
+
+
+def _write_records(path: Path, records: List[Any]) -> None:
+    path.write_text('\n'.join(record if isinstance(record, str) else json.dumps(record) for record in records))
+
+
+def _run(tmp_path: Path, records: List[Any], *args: str) -> List[Dict[str, Any]]:
+    input_path = tmp_path / 'input.jsonl'
+    output_path = tmp_path / 'output.jsonl'
+    _write_records(input_path, records)
+
+    assert main([str(input_path), '-o', str(output_path)] + list(args)) in [0, 1]
+
+    return [json.loads(line) for line in output_path.read_text().splitlines()]
+
+
+def _generate_record(record_id: int) -> Dict[str, Any]:
+    number_of_jobs = randint(1, 10)
+    release_times = randint(0, 20, number_of_jobs).tolist()
+
+    return {
+        'id': record_id,
+        'max_concurrency': randint(1, 4),
+        'jobs': [
+            {'release_time': release_time, 'deadline': release_time + randint(2, 6), 'duration': randint(1, 3)}
+            for release_time in release_times
+        ],
+    }
+
+
+class TestCommandLineInterface(object):
+
+    @pytest.mark.repeat(5)
+    def test_against_greedy(self, tmp_path: Path) -> None:
+        records = [_generate_record(i) for i in range(20)]
+
+        for workers in ['1', '2']:
+            results = _run(tmp_path, records, '-w', workers, '-q', '3')
+
+            assert [result['id'] for result in results] == list(range(20))
+
+            for record, result in zip(records, results):
+                job_pool = create_job_pool(record)
+                schedule = GreedyScheduler().process(job_pool, record['max_concurrency'])
+
+                assert result['all_jobs_scheduled'] == schedule.all_jobs_scheduled
+                assert set(result['timing']) == {'parse', 'process'}
+
+                if schedule.all_jobs_scheduled is True:
+                    assert result['active_time_intervals'] == [
+                        [interval.start, interval.end] for interval in schedule.active_time_intervals
+                    ]
+                    assert sorted(job_schedule['job'] for job_schedule in result['job_schedules']) == list(
+                        range(len(record['jobs'])),
+                    )
+
+    def test_job_pools(self, tmp_path: Path) -> None:
+        records = [
+            {'jobs': [{'availability_intervals': [[0, 1], [4, 5]], 'duration': 2}]},
+            {'job_pool': 'FixedLengthJobPool', 'duration': 2, 'jobs': [{'release_time': 0, 'deadline': 3}]},
+        ]
+
+        assert isinstance(create_job_pool(records[0]), ColumnarJobPoolMI)
+
+        results = _run(tmp_path, records, '-w', '1', '-s', 'LinearProgrammingScheduler', '--lp-method', 'highs')
+
+        assert [result['all_jobs_scheduled'] for result in results] == [True, True]
+
+        assert isinstance(create_job_pool(records[1], 'ColumnarFixedLengthJobPool'), FixedLengthJobPool)
+
+        del records[1]['job_pool']
+        job_pool = create_job_pool(records[1], 'ColumnarFixedLengthJobPool')
+
+        assert isinstance(job_pool, ColumnarFixedLengthJobPool)
+        assert job_pool.get_columns().durations.tolist() == [2]
+
+        results = _run(tmp_path, records[1:], '-w', '1', '-s', 'BatchScheduler', '-c', '2', '-j', 'FixedLengthJobPool')
+        job_schedule = results[0]['job_schedules'][0]
+
+        assert job_schedule['jobs'] == [0]
+        assert job_schedule['execution_end'] - job_schedule['execution_start'] == 1
+
+    @pytest.mark.parametrize('workers', ['1', '2'])
+    def test_matching(self, tmp_path: Path, workers: str) -> None:
+        records = [
+            {'id': 0, 'jobs': [{'release_time': 0, 'deadline': 2}, {'release_time': 1, 'deadline': 3}]},
+            {'id': 1, 'jobs': [{'release_time': 4, 'deadline': 4}], 'max_concurrency': 2},
+        ]
+
+        for job_pool_name in ['UnitJobPool', 'ColumnarUnitJobPool']:
+            results = _run(tmp_path, records, '-w', workers, '-s', 'MatchingScheduler', '-j', job_pool_name)
+
+            assert ['error' in result for result in results] == [False, False]
+            assert [result['all_jobs_scheduled'] for result in results] == [True, True]
+            assert sorted(job_schedule['job'] for job_schedule in results[0]['job_schedules']) == [0, 1]
+            assert results[1]['active_time_intervals'] == [[4, 4]]
+
+    def test_errors(self, tmp_path: Path) -> None:
+        records = ['not json', '', '[1]', {'id': 'a', 'jobs': [{'release_time': 0}]}, _generate_record(1)]
+        input_path = tmp_path / 'input.jsonl'
+        _write_records(input_path, records)
+
+        assert main([str(input_path), '-o', str(tmp_path / 'output.jsonl'), '-w', '2']) == 1
+
+        results = [json.loads(line) for line in (tmp_path / 'output.jsonl').read_text().splitlines()]
+
+        assert [result['line'] for result in results] == [1, 3, 4, 5]
+        assert ['error' in result for result in results] == [True, True, True, False]
+        assert results[2]['id'] == 'a'
+
+        assert main([str(input_path), '-s', 'AbstractScheduler']) == 2
+        assert main([str(input_path), '-s', 'GreedyScheduler', '--option', 'unknown=1']) == 2
+        assert main([str(input_path), '--flow-method', 'UNKNOWN']) == 2
+
+    def test_options(self) -> None:
+        scheduler = create_scheduler('GreedyScheduler', {'flow_method': 'edmonds_karp'})
+
+        assert scheduler.flow_method == FlowMethod.EDMONDS_KARP
+
+        scheduler = create_scheduler('LinearProgrammingScheduler', {'lp_method': 'HIGHS', 'time_limit': '1.5'})
+
+        assert isinstance(scheduler, LinearProgrammingScheduler)
+        assert scheduler.lp_method == LinearProgrammingMethod.HIGHS
+        assert scheduler.time_limit == 1.5
+
+        with pytest.raises(ValueError):
+            create_scheduler('JobPool', {})